@@ -1,10 +1,14 @@
 """TcEx Framework Module"""
 
+# standard library
+from collections.abc import Iterable
+from typing import Any
+
 # third-party
 from requests import Session  # TYPE-CHECKING
 
 # first-party
-from tcex.api.tc.ti_transform import TiTransform, TiTransforms
+from tcex.api.tc.ti_transform import TiColumnarTransforms, TiTransform, TiTransforms
 from tcex.api.tc.ti_transform.model import GroupTransformModel, IndicatorTransformModel
 from tcex.api.tc.util.threat_intel_util import ThreatIntelUtil
 from tcex.api.tc.v2.v2 import V2
@@ -36,6 +40,20 @@ class TC:
         """Return a indicator transform model."""
         return IndicatorTransformModel(**transform)
 
+    @staticmethod
+    def ti_columnar_transforms(
+        columns: Any,
+        transforms: list[GroupTransformModel | IndicatorTransformModel],
+        *,
+        seperate_batch_associations: bool = False,
+    ) -> TiColumnarTransforms:
+        """Return an instance of TI Columnar Transforms class."""
+        return TiColumnarTransforms(
+            columns,
+            transforms,
+            seperate_batch_associations=seperate_batch_associations,
+        )
+
     @staticmethod
     def ti_transform(
         ti_dict: dict,
@@ -46,14 +64,20 @@ class TC:
 
     @staticmethod
     def ti_transforms(
-        ti_dict: list[dict],
+        ti_dict: Iterable[dict],
         transforms: list[GroupTransformModel | IndicatorTransformModel],
         *,
         seperate_batch_associations: bool = False,
+        processes: int = 1,
+        fork: bool = False,
     ) -> TiTransforms:
         """Return an instance of TI Transforms class."""
         return TiTransforms(
-            ti_dict, transforms, seperate_batch_associations=seperate_batch_associations
+            ti_dict,
+            transforms,
+            seperate_batch_associations=seperate_batch_associations,
+            processes=processes,
+            fork=fork,
         )
 
     @cached_property
@@ -1,17 +1,20 @@
 """TcEx Framework Module"""
 
 # first-party
+from tcex.api.tc.ti_transform.ti_columnar_transform import TiColumnarTransforms
 from tcex.api.tc.ti_transform.ti_predefined_functions import (
     ProcessingFunctions,
     transform_builder_to_model,
 )
-from tcex.api.tc.ti_transform.ti_transform import TiTransform, TiTransforms
+from tcex.api.tc.ti_transform.ti_transform import TiTransform, TiTransforms, read_jsonl
 from tcex.api.tc.ti_transform.transform_abc import TransformException
 
 __all__ = [
     'ProcessingFunctions',
+    'TiColumnarTransforms',
     'TiTransform',
     'TiTransforms',
     'TransformException',
+    'read_jsonl',
     'transform_builder_to_model',
 ]
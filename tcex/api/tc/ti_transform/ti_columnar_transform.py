@@ -0,0 +1,271 @@
+"""TcEx Framework Module"""
+
+# standard library
+import contextlib
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+# first-party
+from tcex.api.tc.ti_transform.model import (
+    GroupTransformModel,
+    IndicatorTransformModel,
+    MetadataTransformModel,
+    TransformModel,
+)
+from tcex.api.tc.ti_transform.ti_predefined_functions import ProcessingFunctions
+from tcex.api.tc.ti_transform.ti_transform import TiTransform, TiTransforms
+from tcex.api.tc.ti_transform.transform_plan import TransformPlan
+
+
+def to_columns(data: Any) -> dict[str, list]:
+    """Return column-oriented TI data as a dict of lists.
+
+    Args:
+        data: A dict of lists (or other sequences), a pyarrow Table/RecordBatch, a pandas
+            DataFrame, or a NumPy structured array.
+    """
+    if hasattr(data, 'to_pydict'):  # pyarrow Table/RecordBatch
+        columns = data.to_pydict()
+    elif getattr(getattr(data, 'dtype', None), 'names', None):  # numpy structured array
+        columns = {name: data[name].tolist() for name in data.dtype.names}
+    elif hasattr(data, 'to_dict') and hasattr(data, 'columns'):  # pandas DataFrame
+        columns = data.to_dict('list')
+    elif isinstance(data, Mapping):
+        columns = {
+            name: column if isinstance(column, list) else _to_list(column)
+            for name, column in data.items()
+        }
+    else:
+        ex_msg = f'Invalid columnar data type ({type(data).__name__}).'
+        raise TypeError(ex_msg)
+
+    if len({len(column) for column in columns.values()}) > 1:
+        ex_msg = 'All columns must have the same length.'
+        raise ValueError(ex_msg)
+    return columns
+
+
+def _to_list(column: Any) -> list:
+    """Return a column (e.g., a NumPy array or pandas Series) as a list of Python values."""
+    return column.tolist() if hasattr(column, 'tolist') else list(column)
+
+
+@dataclass(frozen=True)
+class _ColumnError:
+    """The error of a column-wise transform, raised as a new exception for each row."""
+
+    ex_type: type[Exception]
+    args: tuple
+
+    def cause(self) -> Exception:
+        """Return a new instance of the original exception."""
+        try:
+            return self.ex_type(*self.args)
+        except Exception:
+            # e.g., an exception with required keyword arguments
+            return RuntimeError(*self.args)
+
+
+class TransformColumns(Sequence[dict]):
+    """Column-oriented TI data, a sequence of the row TI dicts.
+
+    The row TI dicts are only built on access. The column-wise transform results are cached
+    so that each field is evaluated once for all rows.
+
+    Args:
+        columns: The columns, keyed by name.
+    """
+
+    def __init__(self, columns: dict[str, list]):
+        """Initialize instance properties."""
+        self.columns = columns
+        # the column-wise results (None when the field can't be vectorized), keyed by the id of
+        # the metadata model and the mode (single or multiple values)
+        self.results: dict[tuple[int, bool], tuple[MetadataTransformModel, list | None]] = {}
+
+        # the column for each path (None when the path is not a column name)
+        self._paths: dict[str, list | None] = {}
+        self._rows = len(next(iter(columns.values()), []))
+
+    def __getitem__(self, row: int) -> dict:  # type: ignore[override]
+        """Return the TI dict of a row."""
+        return {name: column[row] for name, column in self.columns.items()}
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return self._rows
+
+    def column(self, plan: TransformPlan, path: str) -> list | None:
+        """Return the column for a path that selects a column by name."""
+        try:
+            return self._paths[path]
+        except KeyError:
+            parsed = plan.expression(path).parsed
+            column = None
+            if parsed['type'] == 'field':
+                column = self.columns.get(parsed['value'])
+            self._paths[path] = column
+            return column
+
+
+class TiColumnarTransforms(TiTransforms):
+    """Threat Intelligence transforms for column-oriented (tabular) data.
+
+    Fields whose path is a column name and whose transform steps are all static_map, filter_map,
+    or element-wise ProcessingFunctions functions are evaluated column-wise, once per distinct
+    value of the column. All other fields (e.g., custom callables, which may depend on the
+    ti_dict or add adhoc entities) are evaluated per row. The output is the same as
+    TiTransforms on the row TI dicts. The rows are always processed serially.
+
+    Args:
+        columns: A dict of lists, a pyarrow Table, a pandas DataFrame, or a NumPy structured
+            array with one row per TI dict.
+        transforms: The group or indicator transforms.
+        raise_exceptions: If True, transform errors are raised.
+        seperate_batch_associations: If True, associations are returned separately.
+    """
+
+    def __init__(
+        self,
+        columns: Any,
+        transforms: list[GroupTransformModel | IndicatorTransformModel],
+        raise_exceptions: bool = False,
+        *,
+        seperate_batch_associations: bool = False,
+    ):
+        """Initialize instance properties."""
+        self.columns = TransformColumns(to_columns(columns))
+        super().__init__(
+            self.columns,
+            transforms,
+            raise_exceptions,
+            seperate_batch_associations=seperate_batch_associations,
+        )
+
+    def _ti_transforms(self) -> Iterator[TiTransform]:
+        """Yield the TiColumnarTransform of each row."""
+        for row in range(len(self.columns)):
+            yield TiColumnarTransform(
+                self.columns[row],
+                self.transforms,
+                seperate_batch_associations=self.seperate_batch_associations,
+                plans=self.plans,
+                columns=self.columns,
+                row=row,
+            )
+
+
+class TiColumnarTransform(TiTransform):
+    """Threat Intelligence transform of one row of column-oriented data."""
+
+    def __init__(
+        self,
+        ti_dict: dict,
+        transforms: list[GroupTransformModel | IndicatorTransformModel],
+        *,
+        seperate_batch_associations: bool = False,
+        plans: list[TransformPlan] | None = None,
+        columns: TransformColumns,
+        row: int,
+    ):
+        """Initialize instance properties."""
+        self.columns = columns
+        self.row = row
+        super().__init__(
+            ti_dict,
+            transforms,
+            seperate_batch_associations=seperate_batch_associations,
+            plans=plans,
+        )
+
+    @staticmethod
+    def _elementwise(step: TransformModel) -> bool:
+        """Return True if the result of the step only depends on the value."""
+        if step.filter_map is not None or step.static_map is not None:
+            return True
+
+        fn = step.method if step.method is not None else step.for_each
+        if not callable(fn):
+            return True
+        return (
+            isinstance(getattr(fn, '__self__', None), ProcessingFunctions)
+            and getattr(fn, '__name__', None) in ProcessingFunctions.elementwise_functions
+        )
+
+    def _column_result(self, metadata: MetadataTransformModel, multi: bool) -> tuple[bool, Any]:
+        """Return (vectorized, result) of the field for the row.
+
+        The results of all rows are evaluated (and cached) on the first access.
+        """
+        key = (id(metadata), multi)
+        try:
+            metadata_, results = self.columns.results[key]
+            if metadata_ is not metadata:
+                raise KeyError(key)  # noqa: TRY301
+        except KeyError:
+            results = self._column_results(metadata, multi)
+            self.columns.results[key] = (metadata, results)
+
+        if results is None:
+            return False, None
+
+        result = results[self.row]
+        if isinstance(result, _ColumnError):
+            # raised as in row mode, the field and context are added by the caller
+            raise result.cause()
+        return True, list(result) if multi else result
+
+    def _column_results(self, metadata: MetadataTransformModel, multi: bool) -> list | None:
+        """Return the result of the field for each row (None when it can't be vectorized)."""
+        column = self.columns.column(self.plan, metadata.path)  # type: ignore
+        if column is None or not all(map(self._elementwise, metadata.transform or [])):
+            return None
+
+        evaluate = self._transform_path_values if multi else self._transform_path_value
+        memo: dict[tuple[type, Any], Any] = {}
+        results = []
+        for value in column:
+            # the type is part of the key, so that e.g. 1 and True are not evaluated as one value
+            key = (type(value), value)
+            try:
+                result = memo[key]
+            except (KeyError, TypeError):
+                try:
+                    result = evaluate(metadata, value)
+                except Exception as ex:
+                    # a new error is raised for each row with the value
+                    result = _ColumnError(type(ex), ex.args)
+                with contextlib.suppress(TypeError):  # unhashable value (e.g., list)
+                    memo[key] = result
+            results.append(result)
+
+        self.log.trace(
+            f'feature=ti-columnar-transform, event=column-evaluated, path={metadata.path}, '
+            f'rows={len(column)}, distinct-values={len(memo)}'
+        )
+        return results
+
+    def _path_search(self, path: str) -> Any:
+        """Return the value of the provided path (the row value when the path is a column)."""
+        if path is not None:
+            column = self.columns.column(self.plan, path)
+            if column is not None:
+                return column[self.row]
+        return super()._path_search(path)
+
+    def _transform_value(self, metadata: MetadataTransformModel | None) -> str | None:
+        """Pass value to series transforms (column-wise when possible)."""
+        if metadata is not None and metadata.path is not None:
+            vectorized, result = self._column_result(metadata, multi=False)
+            if vectorized:
+                return result
+        return super()._transform_value(metadata)
+
+    def _transform_values(self, metadata: MetadataTransformModel | None) -> list[str]:
+        """Pass value to series transforms (column-wise when possible)."""
+        if metadata is not None and metadata.path is not None:
+            vectorized, result = self._column_result(metadata, multi=True)
+            if vectorized:
+                return result
+        return super()._transform_values(metadata)
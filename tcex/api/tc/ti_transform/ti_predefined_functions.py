@@ -98,6 +98,28 @@ def custom_function_definition(definition: FunctionDefinition):
 class ProcessingFunctions:
     """Predefined functions to use in transforms."""
 
+    # functions whose result only depends on the value and the static kwargs, so that they can
+    # be applied once per distinct value of a column (see TiColumnarTransforms)
+    elementwise_functions = frozenset(
+        [
+            'any_to_datetime',
+            'append',
+            'convert_to_MITRE_tag',
+            'hash',
+            'prepend',
+            'remove_surrounding_whitespace',
+            'replace',
+            'split',
+            'static_map',
+            'to_lowercase',
+            'to_titlecase',
+            'to_uppercase',
+            'truncate',
+            'uuid5',
+            'value_in',
+        ]
+    )
+
     def __init__(self, tcex) -> None:
         """."""
         self.tcex = tcex
@@ -1,7 +1,18 @@
 """TcEx Framework Module"""
 
 # standard library
+import json
+import multiprocessing
+import pickle  # nosec
+import traceback
+from collections import deque
+from collections.abc import Iterator, Sized
+from concurrent.futures import Future, ProcessPoolExecutor
 from datetime import datetime
+from itertools import islice
+from multiprocessing.context import BaseContext
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 # first-party
 from tcex.api.tc.ti_transform.model import GroupTransformModel, IndicatorTransformModel
@@ -11,40 +22,123 @@ from tcex.api.tc.ti_transform.transform_abc import (
     TransformException,
     TransformsABC,
 )
+from tcex.api.tc.ti_transform.transform_plan import TransformPlan
+
+if TYPE_CHECKING:  # pragma: no cover
+    # first-party
+    from tcex.api.tc.v2.batch.batch_writer import BatchWriter
+
+# the state of a worker process (set by the pool initializer)
+_worker: dict = {}
 
 
 class TiTransforms(TransformsABC):
-    """Mappings"""
+    """Mappings
+
+    When processes is greater than 1, the TI dicts are sharded across a process pool. The
+    results are returned in input order and transform errors are reported (and raised) by the
+    parent process. The workers are started with the spawn start method, unless fork is enabled
+    (forking a multithreaded process may deadlock). Transforms that can't be pickled (e.g.,
+    lambdas) are processed serially with a warning, unless fork is enabled. In parallel mode the
+    TiTransform instances are not kept in transformed_collection.
+    """
 
     def process(self):
         """Process the mapping."""
         self.transformed_collection: list[TiTransform] = []
-        for ti_dict in self.ti_dicts:
-            self.transformed_collection.append(
-                TiTransform(
-                    ti_dict,
-                    self.transforms,
-                    seperate_batch_associations=self.seperate_batch_associations,
-                )
+        for t in self._ti_transforms():
+            self.transformed_collection.append(t)
+
+    def _mp_context(self) -> BaseContext | None:
+        """Return the multiprocessing context for the worker pool (None to process serially)."""
+        if self.processes <= 1 or (isinstance(self.ti_dicts, Sized) and len(self.ti_dicts) <= 1):
+            return None
+
+        if self.fork and 'fork' in multiprocessing.get_all_start_methods():
+            # opt-in, the transforms (including unpicklable transforms) are inherited by the workers
+            return multiprocessing.get_context('fork')
+
+        try:
+            pickle.dumps(self.plans)
+        except (AttributeError, TypeError, pickle.PicklingError):
+            self.log.warning(
+                'feature=ti-transforms, event=parallel-fallback, reason=transform-not-picklable'
             )
+            return None
 
-    @property
-    def batch(self) -> dict:
-        """Return the data in batch format."""
-        self.process()
+        # not the platform default, which may be fork (e.g., Linux before Python 3.14)
+        return multiprocessing.get_context('spawn')
 
-        batch = {
-            'group': [],
-            'indicator': [],
-        }
-        self.log.trace(f'feature=ti-transform-batch, ti-count={len(self.transformed_collection)}')
-        for index, t in enumerate(self.transformed_collection):
+    def _outcomes(self, output: str, collect: bool = True) -> Iterator[tuple | BaseException]:
+        """Yield the outcome of each TI dict in input order.
+
+        Args:
+            output: The output format (batch, batch_item, or v3_api).
+            collect: If True, the TiTransform instances are kept in transformed_collection
+                (serial mode only).
+        """
+        context = self._mp_context()
+        if context is None:
+            if collect:
+                self.process()
+                for t in self.transformed_collection:
+                    yield _outcome(t, output)
+            else:
+                for t in self._ti_transforms():
+                    yield _outcome(t, output)
+            return
+
+        self.transformed_collection = []
+        with ProcessPoolExecutor(
+            max_workers=self.processes,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(self.plans, self.seperate_batch_associations),
+        ) as executor:
+            # bound the number of in-flight shards so that any iterable is read incrementally
+            pending: deque[Future] = deque()
+            for shard in self._shards():
+                pending.append(executor.submit(_transform_shard, shard, output))
+                if len(pending) >= self.processes * 2:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+
+    def _shards(self) -> Iterator[list[dict]]:
+        """Yield the TI dicts in shards for the worker processes."""
+        shard_size = 1_000
+        if isinstance(self.ti_dicts, Sized):
+            shard_size = max(1, min(shard_size, -(-len(self.ti_dicts) // (self.processes * 4))))
+
+        ti_dicts = iter(self.ti_dicts)
+        while shard := list(islice(ti_dicts, shard_size)):
+            yield shard
+
+    def _ti_transform(self, ti_dict: dict) -> 'TiTransform':
+        """Return the TiTransform for a TI dict using the shared transform plans."""
+        return TiTransform(
+            ti_dict,
+            self.transforms,
+            seperate_batch_associations=self.seperate_batch_associations,
+            plans=self.plans,
+        )
+
+    def _ti_transforms(self) -> Iterator['TiTransform']:
+        """Yield the TiTransform of each TI dict."""
+        for ti_dict in self.ti_dicts:
+            yield self._ti_transform(ti_dict)
+
+    def _transformed(self, output: str, feature: str, collect: bool = True) -> Iterator[tuple]:
+        """Yield the (ti type, data, adhoc groups, adhoc indicators) of each TI dict."""
+        if isinstance(self.ti_dicts, Sized):
+            self.log.trace(f'feature={feature}, ti-count={len(self.ti_dicts)}')
+        for index, outcome in enumerate(self._outcomes(output, collect)):
             if index and index % 1_000 == 0:
-                self.log.trace(f'feature=ti-transform-batch, items={index}')
+                self.log.trace(f'feature={feature}, items={index}')
 
-            # batch must be called so that the transform type is selected
             try:
-                data = t.batch
+                if isinstance(outcome, BaseException):
+                    raise outcome  # noqa: TRY301
             except NoValidTransformException:
                 self.log.exception('feature=ti-transforms, event=runtime-error')
                 continue
@@ -62,55 +156,113 @@ class TiTransforms(TransformsABC):
                     raise
                 continue
 
+            yield outcome
+
+    @property
+    def batch(self) -> dict:
+        """Return the data in batch format."""
+        batch = {
+            'group': [],
+            'indicator': [],
+        }
+        for ti_type, data, adhoc_groups, adhoc_indicators in self._transformed(
+            'batch', 'ti-transform-batch'
+        ):
             # now that batch is called we can identify the ti type
             if self.seperate_batch_associations:
                 associations = data.pop('association', [])
                 batch.setdefault('association', []).extend(associations)
-            if isinstance(t.transform, GroupTransformModel):
-                batch['group'].append(data)
-            elif isinstance(t.transform, IndicatorTransformModel):
-                batch['indicator'].append(data)
+            batch[ti_type].append(data)
 
             # append adhoc groups and indicators
-            batch['group'].extend(t.adhoc_groups)
-            batch['indicator'].extend(t.adhoc_indicators)
+            batch['group'].extend(adhoc_groups)
+            batch['indicator'].extend(adhoc_indicators)
         return batch
 
     @property
     def v3_api(self) -> dict:
         """Return the data in v3 format."""
-        self.process()
-
         v3_data = {}
-        self.log.trace(f'feature=ti-transform-v3, ti-count={len(self.transformed_collection)}')
-        for index, t in enumerate(self.transformed_collection):
-            if index and index % 1_000 == 0:
-                self.log.trace(f'feature=ti-transform-v3, items={index}')
-
-            # v3_api must be called so that the transform type is selected
-            try:
-                data = t.v3_api
-            except NoValidTransformException:
-                self.log.exception('feature=ti-transforms, event=runtime-error')
-                continue
-            except TransformException as e:
-                self.log.warning(
-                    f'feature=ti-transforms, event=transform-error, field="{e.field}", '
-                    f'cause="{e.cause}", context="{e.context}"'
-                )
-                if self.raise_exceptions:
-                    raise
-                continue
-            except Exception:
-                self.log.exception('feature=ti-transforms, event=transform-error')
-                if self.raise_exceptions:
-                    raise
-                continue
-
+        for _, data, _, _ in self._transformed('v3_api', 'ti-transform-v3'):
             v3_data.setdefault(data.pop('type'), []).extend(data)
 
         return v3_data
 
+    def stream_batch(self) -> Iterator[tuple[str, dict]]:
+        """Yield each transformed entity in batch format as it is transformed.
+
+        Unlike the batch property, the TI dicts are read incrementally and nothing is kept in
+        memory, so ti_dicts can be any iterable (e.g., read_jsonl) and the entities can be
+        added directly to a batch writer.
+
+        .. code-block:: python
+
+            transforms = TiTransforms(
+                read_jsonl('feed.jsonl'), [transform]
+            )
+            for section, data in transforms.stream_batch():
+                # section is association, group, or indicator
+                getattr(batch, f'add_{section}')(data)
+
+        Yields:
+            tuple[str, dict]: The section (association, group, or indicator) and the data.
+        """
+        for ti_type, data, adhoc_groups, adhoc_indicators in self._transformed(
+            'batch', 'ti-transform-stream', collect=False
+        ):
+            associations = data.pop('association', []) if self.seperate_batch_associations else []
+            yield ti_type, data
+            for group in adhoc_groups:
+                yield 'group', group
+            for indicator in adhoc_indicators:
+                yield 'indicator', indicator
+            for association in associations:
+                yield 'association', association
+
+    def write_batch(self, batch: 'BatchWriter') -> int:
+        """Transform the TI dicts and add each entity directly to a batch writer (or Batch).
+
+        The transformed item of each TI dict is added as is, without the sorted copy made by
+        the batch property and without building the intermediate batch lists, and the TI dicts
+        are read incrementally (see stream_batch).
+
+        Args:
+            batch: The batch writer the groups, indicators, and associations are added to.
+
+        Returns:
+            int: The number of entities added to the batch writer.
+        """
+        count = 0
+        for ti_type, data, adhoc_groups, adhoc_indicators in self._transformed(
+            'batch_item', 'ti-transform-sink', collect=False
+        ):
+            associations = data.pop('association', []) if self.seperate_batch_associations else []
+            if ti_type == 'group':
+                batch.add_group(data)
+            else:
+                batch.add_indicator(data)
+
+            for group in adhoc_groups:
+                batch.add_group(group)
+            for indicator in adhoc_indicators:
+                batch.add_indicator(indicator)
+            for association in associations:
+                batch.add_association(association)
+            count += 1 + len(adhoc_groups) + len(adhoc_indicators) + len(associations)
+        return count
+
+
+def read_jsonl(fqfn: Path | str) -> Iterator[dict]:
+    """Yield the TI dicts of a JSON lines file (one JSON object per line).
+
+    Args:
+        fqfn: The fully qualified filename of the JSON lines file.
+    """
+    with Path(fqfn).open(encoding='utf-8') as fh:
+        for line in fh:
+            if line.strip():
+                yield json.loads(line)
+
 
 class TiTransform(TransformABC):
     """Threat Intelligence Transform Module"""
@@ -308,6 +460,12 @@ class TiTransform(TransformABC):
         self._process()
         return dict(sorted(self.transformed_item.items()))
 
+    @property
+    def batch_item(self) -> dict:
+        """Return the data in batch format, without a sorted copy (e.g., for a batch writer)."""
+        self._process()
+        return self.transformed_item
+
     @property
     def v3_api(self) -> dict:
         """Return the data in v3 format."""
@@ -373,3 +531,59 @@ class TiTransform(TransformABC):
             del v3_data['fileOccurrence']
 
         return v3_data
+
+
+def _init_worker(plans: list[TransformPlan], seperate_batch_associations: bool):
+    """Initialize the state of a worker process."""
+    _worker['plans'] = plans
+    _worker['seperate_batch_associations'] = seperate_batch_associations
+
+
+def _outcome(t: TiTransform, output: str) -> tuple | BaseException:
+    """Return the transformed data of a TI dict (e.g., batch or v3_api) or the transform error."""
+    try:
+        # the output must be generated so that the transform type is selected
+        data = getattr(t, output)
+    except Exception as ex:
+        return ex
+
+    ti_type = 'group' if isinstance(t.transform, GroupTransformModel) else 'indicator'
+    return ti_type, data, t.adhoc_groups, t.adhoc_indicators
+
+
+def _picklable_error(ex: Exception) -> Exception:
+    """Return the transform error in a form that can be returned from a worker process."""
+    # the worker traceback is not pickled, keep it as a note for the exception log
+    ex.add_note(''.join(traceback.format_exception(ex)).rstrip())
+    try:
+        pickle.dumps(ex)
+    except Exception:
+        if isinstance(ex, TransformException):
+            ex_ = TransformException(ex.field, RuntimeError(str(ex.cause)), str(ex.context))
+        else:
+            ex_ = RuntimeError(f'{type(ex).__name__}: {ex}')
+        for note in getattr(ex, '__notes__', []):
+            ex_.add_note(note)
+        return ex_
+    return ex
+
+
+def _transform_shard(ti_dicts: list[dict], output: str) -> list[tuple | BaseException]:
+    """Return the outcome of each TI dict of a shard (run in a worker process)."""
+    plans: list[TransformPlan] = _worker['plans']
+    transforms = [plan.transform for plan in plans]
+    outcomes = []
+    for ti_dict in ti_dicts:
+        outcome = _outcome(
+            TiTransform(
+                ti_dict,
+                transforms,
+                seperate_batch_associations=_worker['seperate_batch_associations'],
+                plans=plans,
+            ),
+            output,
+        )
+        if isinstance(outcome, Exception):
+            outcome = _picklable_error(outcome)
+        outcomes.append(outcome)
+    return outcomes
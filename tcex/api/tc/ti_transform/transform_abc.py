@@ -1,19 +1,13 @@
 """TcEx Framework Module"""
 
 # standard library
-import collections
 import logging
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections.abc import Iterable
 from datetime import datetime
-from inspect import signature
 from typing import Any, cast
 
-# third-party
-import jmespath
-
 # first-party
-from tcex.api.tc.ti_transform import ti_predefined_functions
 from tcex.api.tc.ti_transform.model import (
     AttributeTransformModel,
     GroupTransformModel,
@@ -28,10 +22,10 @@ from tcex.api.tc.ti_transform.model.transform_model import (
     AssociatedIndicatorFromIndicatorTransform,
     DatetimeTransformModel,
     FileOccurrenceTransformModel,
-    PredefinedFunctionModel,
+    TransformModel,
 )
+from tcex.api.tc.ti_transform.transform_plan import TransformPlan
 from tcex.logger.trace_logger import TraceLogger
-from tcex.pleb.jmespath_custom import TcFunctions
 from tcex.util import Util
 
 # get tcex logger
@@ -48,6 +42,10 @@ class TransformException(Exception):
         self.cause = cause
         self.context = context
 
+    def __reduce__(self) -> tuple:
+        """Return the pickle state (e.g., to return the exception from a worker process)."""
+        return (self.__class__, (self.field, self.cause, self.context, *self.args), self.__dict__)
+
     def __str__(self) -> str:
         """."""
         return f'Error transforming {self.field}: {self.cause}'
@@ -62,18 +60,22 @@ class TransformsABC(ABC):  # noqa: B024
 
     def __init__(
         self,
-        ti_dicts: list[dict],
+        ti_dicts: Iterable[dict],
         transforms: list[GroupTransformModel | IndicatorTransformModel],
         raise_exceptions: bool = False,
         *,
         seperate_batch_associations: bool = False,
+        processes: int = 1,
+        fork: bool = False,
     ):
         """Initialize instance properties."""
         self.ti_dicts = ti_dicts
         self.transforms = transforms
 
         # properties
+        self.fork = fork
         self.log = _logger
+        self.processes = processes
         self.raise_exceptions = raise_exceptions
         self.seperate_batch_associations = seperate_batch_associations
         self.transformed_collection: list[TransformABC] = []
@@ -81,6 +83,9 @@ class TransformsABC(ABC):  # noqa: B024
         # validate transforms
         self._validate_transforms()
 
+        # compile each transform once, the plans are shared by all TI dicts
+        self.plans = [TransformPlan(transform) for transform in self.transforms]
+
     def _validate_transforms(self):
         """Validate the transform model."""
         if len(self.transforms) > 1:
@@ -102,10 +107,12 @@ class TransformABC(ABC):
         transforms: list[GroupTransformModel | IndicatorTransformModel],
         *,
         seperate_batch_associations: bool = False,
+        plans: list[TransformPlan] | None = None,
     ):
         """Initialize instance properties."""
         self.ti_dict = ti_dict
         self.transforms = transforms if isinstance(transforms, list) else [transforms]
+        self.plans = plans or [TransformPlan(transform) for transform in self.transforms]
         self.seperate_batch_associations = seperate_batch_associations
 
         # properties
@@ -116,9 +123,8 @@ class TransformABC(ABC):
         self.transform: GroupTransformModel | IndicatorTransformModel
         self.transformed_item = {}
         self.util = Util()
-        self.jmespath_options = jmespath.Options(
-            custom_functions=TcFunctions(), dict_cls=collections.OrderedDict
-        )
+        # the plan of the current active transform
+        self.plan: TransformPlan = self.plans[0]
 
         # validate transforms
         self._validate_transforms()
@@ -145,7 +151,7 @@ class TransformABC(ABC):
         Path can return any type of data from the TI dict.
         """
         if path is not None:
-            return jmespath.search(path, self.ti_dict, options=self.jmespath_options)
+            return self.plan.search(path, self.ti_dict)
             # self.log.trace(f'feature=transform, action=path-search, path={path}, value={value}')
         return None
 
@@ -548,9 +554,10 @@ class TransformABC(ABC):
 
     def _select_transform(self):
         """Select the correct transform based on the "applies" field."""
-        for transform in self.transforms:
-            if transform.applies is None or transform.applies(self.ti_dict) is True:
-                self.transform = transform
+        for plan in self.plans:
+            if plan.transform.applies is None or plan.transform.applies(self.ti_dict) is True:
+                self.plan = plan
+                self.transform = plan.transform
                 break
         else:
             ex_msg = 'No transform found for TI data'
@@ -567,8 +574,10 @@ class TransformABC(ABC):
             return metadata.default
 
         # get value from path
-        value = self._path_search(metadata.path)
+        return self._transform_path_value(metadata, self._path_search(metadata.path))
 
+    def _transform_path_value(self, metadata: MetadataTransformModel, value: Any) -> str | None:
+        """Pass the value returned from the path search to the series transforms."""
         # return default if value of None is returned from Path
         # IMPORTANT: a value of None passed to the transform may cause a failure (lambda x.lower())
         if value is None:
@@ -582,7 +591,7 @@ class TransformABC(ABC):
             elif t.static_map is not None:
                 value = self._transform_value_map(value, t.static_map)
             elif callable(t.method):
-                value = self._transform_value_callable(value, t.method, t.kwargs)
+                value = self._transform_value_callable(value, t)
 
         # ensure only a string value or None is returned (set to default if required)
         if value is None:
@@ -593,28 +602,11 @@ class TransformABC(ABC):
         return value
 
     def _transform_value_callable(
-        self, value: dict | list | str, c: Callable | PredefinedFunctionModel, kwargs=None
+        self, value: dict | list | str, step: TransformModel
     ) -> str | None | list[str]:
         """Transform values in the TI data."""
-        # find signature of method and call with correct args
-        if isinstance(c, PredefinedFunctionModel):
-            normalized_params = {
-                k.replace(' ', '_').lower(): v for k, v in PredefinedFunctionModel.params or {}
-            }
-            return getattr(ti_predefined_functions, c.name)(value, **normalized_params)
-
-        kwargs = kwargs or {}
-        try:
-            sig = signature(c, follow_wrapped=True)
-            if 'ti_dict' in sig.parameters:
-                kwargs.update({'ti_dict': self.ti_dict})
-            if 'transform' in sig.parameters:
-                kwargs.update({'transform': self})
-        except ValueError:  # signature doesn't work for many built-in methods/functions
-            pass
-
         # pass value to transform callable/method, which should always return a string
-        return c(value, **kwargs)
+        return self.plan.callable(step)(value, self)
 
     def _transform_value_map(self, value: str, map_: dict, passthrough: bool = False) -> str:
         """Transform a value using a static map."""
@@ -652,7 +644,17 @@ class TransformABC(ABC):
             # )
 
         # path search can return multiple data types and single or multiple values
-        value = self._path_search(metadata.path)
+        return self._transform_path_values(metadata, self._path_search(metadata.path))
+
+    def _transform_path_values(self, metadata: MetadataTransformModel, value: Any) -> list[str]:
+        """Pass the value(s) returned from the path search to the series transforms."""
+
+        def _default() -> list:
+            """Return default value (as list) if exists, else empty list."""
+            if metadata.default is None:
+                return []
+
+            return self._always_array(metadata.default)
 
         # return default if value of None is returned from Path
         # IMPORTANT: a None value passed to the transform may cause a failure (lambda x: x.lower())
@@ -679,10 +681,11 @@ class TransformABC(ABC):
                 value = _values
             # PYRIGHT-MISS - None check for value already performed above
             elif callable(t.method) and value is not None:
-                value = self._transform_value_callable(value, t.method, t.kwargs)
+                value = self._transform_value_callable(value, t)
             elif callable(t.for_each):
+                transform_callable = self.plan.callable(t)
                 value = [
-                    self._transform_value_callable(v, t.for_each, t.kwargs) if v is not None else v
+                    transform_callable(v, self) if v is not None else v
                     for v in self._always_array(value)
                 ]
 
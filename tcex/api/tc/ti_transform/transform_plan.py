@@ -0,0 +1,150 @@
+"""TcEx Framework Module"""
+
+# standard library
+import collections
+from collections.abc import Callable
+from inspect import signature
+from typing import TYPE_CHECKING, Any
+
+# third-party
+import jmespath
+from jmespath.parser import ParsedResult
+from pydantic import BaseModel
+
+# first-party
+from tcex.api.tc.ti_transform import ti_predefined_functions
+from tcex.api.tc.ti_transform.model import (
+    GroupTransformModel,
+    IndicatorTransformModel,
+    TransformModel,
+)
+from tcex.api.tc.ti_transform.model.transform_model import (
+    PathTransformModel,
+    PredefinedFunctionModel,
+)
+from tcex.pleb.jmespath_custom import TcFunctions
+
+if TYPE_CHECKING:  # pragma: no cover
+    # first-party
+    from tcex.api.tc.ti_transform.transform_abc import TransformABC
+
+
+class TransformCallable:
+    """A transform method/for_each callable with the call arguments resolved.
+
+    The signature of the callable is inspected once, so that the ti_dict and transform
+    arguments are only passed to callables that accept them.
+
+    Args:
+        step: The transform step (method or for_each).
+    """
+
+    __slots__ = ['fn', 'kwargs', 'name', 'ti_dict', 'transform']
+
+    def __init__(self, step: TransformModel):
+        """Initialize instance properties."""
+        c = step.method if step.method is not None else step.for_each
+        self.kwargs: dict = step.kwargs or {}
+        self.name: str | None = None
+        self.ti_dict = False
+        self.transform = False
+
+        if isinstance(c, PredefinedFunctionModel):
+            self.fn: Callable | None = getattr(ti_predefined_functions, c.name, None)
+            self.kwargs = {k.replace(' ', '_').lower(): v for k, v in (c.params or {}).items()}
+            self.name = c.name
+            return
+
+        self.fn = c
+        try:
+            parameters = signature(c, follow_wrapped=True).parameters  # type: ignore
+            self.ti_dict = 'ti_dict' in parameters
+            self.transform = 'transform' in parameters
+        except ValueError:  # signature doesn't work for many built-in methods/functions
+            pass
+
+    def __call__(self, value: Any, transform: 'TransformABC') -> Any:
+        """Call the transform callable with the value and the resolved arguments."""
+        if self.fn is None:
+            ex_msg = f'Predefined function {self.name} does not exist.'
+            raise AttributeError(ex_msg)
+
+        kwargs = self.kwargs
+        if self.ti_dict or self.transform:
+            kwargs = {**kwargs}
+            if self.ti_dict:
+                kwargs['ti_dict'] = transform.ti_dict
+            if self.transform:
+                kwargs['transform'] = transform
+        return self.fn(value, **kwargs)
+
+
+class TransformPlan:
+    """A group/indicator transform compiled for execution against many TI dicts.
+
+    All JMESPath expressions of the transform are compiled and all transform callables are
+    resolved once, when the plan is created. TiTransforms compiles one plan per transform
+    and shares it with every TI dict it processes.
+
+    Args:
+        transform: The group or indicator transform model.
+    """
+
+    __slots__ = ['_callables', '_expressions', 'options', 'transform']
+
+    def __init__(self, transform: GroupTransformModel | IndicatorTransformModel):
+        """Initialize instance properties."""
+        self.transform = transform
+        self.options = jmespath.Options(
+            custom_functions=TcFunctions(), dict_cls=collections.OrderedDict
+        )
+
+        # compiled JMESPath expressions, keyed by path
+        self._expressions: dict[str, ParsedResult] = {}
+        # resolved callables, keyed by id of the transform step
+        self._callables: dict[int, tuple[TransformModel, TransformCallable]] = {}
+        self._compile(transform)
+
+    def __reduce__(self) -> tuple:
+        """Pickle the transform only, the plan is compiled again when unpickled."""
+        return (self.__class__, (self.transform,))
+
+    def _compile(self, value: Any):
+        """Compile the paths and resolve the callables of the model (recursively)."""
+        if isinstance(value, list):
+            for item in value:
+                self._compile(item)
+        elif isinstance(value, TransformModel):
+            if value.method is not None or value.for_each is not None:
+                self.callable(value)
+        elif isinstance(value, BaseModel):
+            if isinstance(value, PathTransformModel) and value.path is not None:
+                self.expression(value.path)
+            for name in value.__fields__:
+                self._compile(getattr(value, name))
+
+    def callable(self, step: TransformModel) -> TransformCallable:
+        """Return the resolved callable for a transform step (method or for_each)."""
+        try:
+            step_, callable_ = self._callables[id(step)]
+            if step_ is step:
+                return callable_
+        except KeyError:
+            pass
+
+        # a step added after the plan was compiled
+        callable_ = TransformCallable(step)
+        self._callables[id(step)] = (step, callable_)
+        return callable_
+
+    def expression(self, path: str) -> ParsedResult:
+        """Return the compiled JMESPath expression for a path."""
+        try:
+            return self._expressions[path]
+        except KeyError:
+            expression = self._expressions[path] = jmespath.compile(path)
+            return expression
+
+    def search(self, path: str, data: dict) -> Any:
+        """Return the result of the path search on the data."""
+        return self.expression(path).search(data, options=self.options)
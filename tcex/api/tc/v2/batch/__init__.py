@@ -2,8 +2,25 @@
 
 # first-party
 from tcex.api.tc.v2.batch.batch import Batch
+from tcex.api.tc.v2.batch.batch_checkpoint import BatchCheckpoint
+from tcex.api.tc.v2.batch.batch_chunk_encoder import BatchChunkEncoder
+from tcex.api.tc.v2.batch.batch_chunk_planner import BatchChunkPlan, BatchChunkPlanner
 from tcex.api.tc.v2.batch.batch_cleaner import BatchCleaner
+from tcex.api.tc.v2.batch.batch_poll import BatchPollEstimator, BatchPollStats
 from tcex.api.tc.v2.batch.batch_submit import BatchSubmit
 from tcex.api.tc.v2.batch.batch_writer import BatchWriter, GroupType, IndicatorType
 
-__all__ = ['Batch', 'BatchCleaner', 'BatchSubmit', 'BatchWriter', 'GroupType', 'IndicatorType']
+__all__ = [
+    'Batch',
+    'BatchCheckpoint',
+    'BatchChunkEncoder',
+    'BatchChunkPlan',
+    'BatchChunkPlanner',
+    'BatchCleaner',
+    'BatchPollEstimator',
+    'BatchPollStats',
+    'BatchSubmit',
+    'BatchWriter',
+    'GroupType',
+    'IndicatorType',
+]
@@ -2,7 +2,9 @@
 
 # standard library
 import json
+import sys
 from collections.abc import Callable
+from typing import ClassVar
 
 # first-party
 from tcex.util import Util
@@ -11,7 +13,10 @@ from tcex.util import Util
 class Attribute:
     """ThreatConnect Batch Attribute Object"""
 
-    __slots__ = ['_attribute_data', '_valid', 'util']
+    __slots__ = ['_attribute_data', '_valid']
+
+    # shared utility instance
+    util: ClassVar[Util] = Util()
 
     def __init__(
         self,
@@ -31,7 +36,7 @@ class Attribute:
             formatter: A callable that take a single attribute
                 value and return a single formatted value.
         """
-        self._attribute_data: dict[str, bool | str] = {'type': attr_type}
+        self._attribute_data: dict[str, bool | str] = {'type': sys.intern(attr_type)}
         if displayed:
             self._attribute_data['displayed'] = displayed
 
@@ -51,9 +56,6 @@ class Attribute:
         if attr_value in [None, '']:
             self._valid = False
 
-        # properties
-        self.util = Util()
-
     @property
     def data(self) -> dict:
         """Return Attribute data."""
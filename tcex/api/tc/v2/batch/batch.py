@@ -1,15 +1,17 @@
 """TcEx Framework Module"""
 
 # standard library
+import contextlib
 import gzip
 import json
 import os
 import shelve  # nosec
-import sys
 import threading
 import time
 from collections import deque
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
 from typing import Any
 
 # third-party
@@ -17,6 +19,10 @@ from requests import Response, Session
 
 # first-party
 from tcex.api.tc.v2.batch.association import Association
+from tcex.api.tc.v2.batch.batch_checkpoint import BatchCheckpoint
+from tcex.api.tc.v2.batch.batch_chunk_encoder import BatchChunkEncoder
+from tcex.api.tc.v2.batch.batch_chunk_planner import BatchChunkPlan, BatchChunkPlanner
+from tcex.api.tc.v2.batch.batch_spill_store import BatchSpillStore, popitems
 from tcex.api.tc.v2.batch.batch_submit import BatchSubmit
 from tcex.api.tc.v2.batch.batch_writer import BatchWriter, GroupType, IndicatorType
 from tcex.exit.error_code import handle_error
@@ -75,9 +81,18 @@ class Batch(BatchWriter, BatchSubmit):
 
         # properties
         self._batch_max_chunk = 5_000
+        self._batch_max_in_flight = 3  # max concurrent batch jobs for pipelined submit
         self._batch_max_size = 75_000_000  # max size in bytes
+        self._checkpoint: BatchCheckpoint | None = None  # see enable_checkpoint
+        self._chunk_plan: deque[list[tuple[str, Any]]] = deque()  # see plan_chunks
+        self._file_futures: list[Future] = []
+        self._file_lock = threading.Lock()
+        self._file_max_workers = 4  # max concurrent file uploads
         self._file_merge_mode = None
-        self._file_threads = []
+        self._file_pool: ThreadPoolExecutor | None = None
+        self._file_retries = 3  # max retries per file on 429/5xx responses
+        self._file_retry_backoff = 1.0  # initial retry delay in seconds, doubled on each retry
+        self._file_retry_status_codes = {429, 500, 502, 503, 504}
         self._hash_collision_mode = None
         self._submit_thread = None
 
@@ -94,8 +109,6 @@ class Batch(BatchWriter, BatchSubmit):
 
         # default properties
         self._batch_data_count = None
-        self._poll_interval = None
-        self._poll_interval_times = []
         self._poll_timeout = 3600
 
         # batch debug/replay variables
@@ -131,6 +144,9 @@ class Batch(BatchWriter, BatchSubmit):
         else:
             # store new group
             self.groups[xid] = group_data
+
+            # memory budget hit, spill TI to disk
+            self._spill_check('group', xid, group_data)
         return group_data
 
     def _indicator(
@@ -160,6 +176,9 @@ class Batch(BatchWriter, BatchSubmit):
         else:
             # store new indicators
             self.indicators[xid] = indicator_data
+
+            # memory budget hit, spill TI to disk
+            self._spill_check('indicator', xid, indicator_data)
         return indicator_data
 
     def close(self) -> None:
@@ -168,9 +187,19 @@ class Batch(BatchWriter, BatchSubmit):
         if self._submit_thread and hasattr(self._submit_thread, 'is_alive'):
             self._submit_thread.join()
 
-        # allow file threads to complete before wrapping up job
-        for t in self._file_threads:
-            t.join()
+        # allow file uploads to complete before wrapping up job (uploads that were still queued
+        # when submit_files halted on an error are cancelled)
+        for future in self._file_futures:
+            if future.cancelled():
+                continue
+            if future.exception() is not None:
+                self.log.error(
+                    f'feature=batch, event=file-upload-error, err="""{future.exception()}"""'
+                )
+        self._file_futures = []
+        if self._file_pool is not None:
+            self._file_pool.shutdown(wait=True)
+            self._file_pool = None
 
         self.groups_shelf.close()
         self.indicators_shelf.close()
@@ -196,29 +225,123 @@ class Batch(BatchWriter, BatchSubmit):
         Returns:
             dict: A dictionary of group, indicators, and/or file data.
         """
+        data, _ = self.data_chunk()
+        return data
+
+    def data_chunk(self) -> tuple[dict, BatchChunkEncoder]:
+        """Return the batch data and the encoded content payload for the next chunk.
+
+        Each entity is serialized once as it is added to the chunk. The encoder tracks the exact
+        byte length of the content payload, which is used to enforce the max batch size, and the
+        encoded payload can be passed directly to the createAndUpload request.
+
+        This method will remove the group/indicator from memory and/or shelf.
+
+        Returns:
+            tuple: The dictionary of group, indicators, and/or file data and the chunk encoder.
+        """
+        # follow the association graph plan, if one was created (see plan_chunks)
+        while self._chunk_plan:
+            data, encoder = self.data_chunk_planned()
+            if len(encoder) > 0:
+                return data, encoder
+
         data = {'file': {}, 'group': [], 'indicator': [], 'association': []}
-        tracker = {'count': 0, 'bytes': 0}
+        encoder = BatchChunkEncoder()
+        tracker = {'count': 0, 'bytes': 0, 'encoder': encoder}
 
         # process group from memory, returning if max values have been reached
         if self.data_groups(data, self.groups, tracker) is True:
-            return data
+            return data, encoder
 
         # process group from shelf file, returning if max values have been reached
         if self.data_groups(data, self.groups_shelf, tracker) is True:
-            return data
+            return data, encoder
 
         # process indicator from memory, returning if max values have been reached
         if self.data_indicators(data, self.indicators, tracker) is True:
-            return data
+            return data, encoder
 
         # process indicator from shelf file, returning if max values have been reached
         if self.data_indicators(data, self.indicators_shelf, tracker) is True:
-            return data
+            return data, encoder
 
         if self.data_associations(data, self.associations, tracker) is True:
-            return data
+            return data, encoder
 
-        return data
+        return data, encoder
+
+    def data_chunk_planned(self) -> tuple[dict, BatchChunkEncoder]:
+        """Return the batch data and the encoded content payload for the next planned chunk.
+
+        Entities that were already removed (e.g., submitted or deleted) after planning are
+        skipped. If the max values are reached before the end of the planned chunk, the remaining
+        entries are returned to the front of the plan.
+
+        Returns:
+            tuple: The dictionary of group, indicators, and/or file data and the chunk encoder.
+        """
+        data = {'file': {}, 'group': [], 'indicator': [], 'association': []}
+        encoder = BatchChunkEncoder()
+        tracker = {'count': 0, 'bytes': 0, 'encoder': encoder}
+
+        entries = self._chunk_plan.popleft()
+        for index, (section, key) in enumerate(entries):
+            if (
+                tracker['count'] >= self._batch_max_chunk
+                or tracker['bytes'] >= self._batch_max_size
+            ):
+                self.log.info(
+                    """feature=batch, event=max-value-reached, """
+                    f"""count={tracker.get('count'):,}, bytes={tracker.get('bytes'):,}"""
+                )
+                self._chunk_plan.appendleft(entries[index:])
+                break
+
+            if section == 'association':
+                if key not in self.associations:
+                    continue
+                self.associations.remove(key)
+                item = key.data
+            else:
+                if section == 'group':
+                    memory, shelf = self.groups, self.groups_shelf
+                else:
+                    memory, shelf = self.indicators, self.indicators_shelf
+
+                entity = memory.pop(key, None)
+                if entity is None:
+                    entity = shelf.pop(key, None)
+                if entity is None:
+                    continue
+
+                if section == 'group':
+                    file_data, item = self.data_group_type(entity)
+                    if file_data:
+                        data['file'][key] = file_data
+                else:
+                    item = entity if isinstance(entity, dict) else entity.data
+
+            data[section].append(item)
+            self.data_encode(tracker, section, item)
+
+        return data, encoder
+
+    @staticmethod
+    def data_encode(tracker: dict, section: str, item: dict) -> None:
+        """Encode an entity into the chunk and update the entity trackers.
+
+        Args:
+            tracker: A dictionary tracking count and bytes of processed data.
+            section: The section of the payload (group, indicator, or association).
+            item: The entity data to encode.
+        """
+        encoder: BatchChunkEncoder = tracker.setdefault('encoder', BatchChunkEncoder())
+        encoder.add(section, item)
+
+        # update entity trackers
+        tracker['count'] += 1
+        tracker['bytes'] = encoder.size
 
     def data_group_association(self, data: dict, tracker: dict, xid: str) -> None:
         """Return group dict array following all associations.
@@ -251,9 +374,8 @@ class Batch(BatchWriter, BatchSubmit):
                 if file_data:
                     data['file'][xid] = file_data
 
-                # update entity trackers
-                tracker['count'] += 1
-                tracker['bytes'] += sys.getsizeof(json.dumps(group_data))
+                # encode the group and update entity trackers
+                self.data_encode(tracker, 'group', group_data)
 
                 # extend xids with any groups associated with the same GroupType
                 xids.extend(group_data.get('associatedGroupXid', []))
@@ -286,7 +408,9 @@ class Batch(BatchWriter, BatchSubmit):
 
         return file_data, group_data
 
-    def data_groups(self, data: dict, groups: dict | shelve.Shelf[Any], tracker: dict) -> bool:
+    def data_groups(
+        self, data: dict, groups: dict | shelve.Shelf[Any] | BatchSpillStore, tracker: dict
+    ) -> bool:
         """Process Group data.
 
         Args:
@@ -325,7 +449,7 @@ class Batch(BatchWriter, BatchSubmit):
         return False
 
     def data_indicators(
-        self, data: dict, indicators: dict | shelve.Shelf[Any], tracker: dict
+        self, data: dict, indicators: dict | shelve.Shelf[Any] | BatchSpillStore, tracker: dict
     ) -> bool:
         """Process Indicator data.
 
@@ -337,35 +461,34 @@ class Batch(BatchWriter, BatchSubmit):
         Returns:
             True if max batch limits have been reached, False otherwise.
         """
-        # process the indicators
-        for xid, indicator_data in list(indicators.items()):
-            indicator_data_ = indicator_data
-            if not isinstance(indicator_data, dict):
-                indicator_data_ = indicator_data.data
-            data['indicator'].append(indicator_data_)
-            del indicators[xid]
-
-            # update entity trackers
-            tracker['count'] += 1
-            tracker['bytes'] += sys.getsizeof(json.dumps(indicator_data_))
-
-            if tracker['count'] % 2_500 == 0:
-                # log count/size at a sane level
-                self.log.info(
-                    """feature=batch, action=data-indicators, """
-                    f"""count={tracker.get('count'):,}, bytes={tracker.get('bytes'):,}"""
-                )
+        # process the indicators, removing each indicator from memory/shelf as it is processed
+        with contextlib.closing(popitems(indicators)) as items:
+            for _, indicator_data in items:
+                indicator_data_ = indicator_data
+                if not isinstance(indicator_data, dict):
+                    indicator_data_ = indicator_data.data
+                data['indicator'].append(indicator_data_)
+
+                # encode the indicator and update entity trackers
+                self.data_encode(tracker, 'indicator', indicator_data_)
+
+                if tracker['count'] % 2_500 == 0:
+                    # log count/size at a sane level
+                    self.log.info(
+                        """feature=batch, action=data-indicators, """
+                        f"""count={tracker.get('count'):,}, bytes={tracker.get('bytes'):,}"""
+                    )
 
-            if (
-                tracker['count'] >= self._batch_max_chunk
-                or tracker['bytes'] >= self._batch_max_size
-            ):
-                # stop processing xid once max limit are reached
-                self.log.info(
-                    """feature=batch, event=max-value-reached, """
-                    f"""count={tracker.get('count'):,}, bytes={tracker.get('bytes'):,}"""
-                )
-                return True
+                if (
+                    tracker['count'] >= self._batch_max_chunk
+                    or tracker['bytes'] >= self._batch_max_size
+                ):
+                    # stop processing xid once max limit are reached
+                    self.log.info(
+                        """feature=batch, event=max-value-reached, """
+                        f"""count={tracker.get('count'):,}, bytes={tracker.get('bytes'):,}"""
+                    )
+                    return True
         return False
 
     def data_associations(self, data: dict, associations: set[Association], tracker: dict) -> bool:
@@ -388,8 +511,9 @@ class Batch(BatchWriter, BatchSubmit):
                 association_ = association.data
             data['association'].append(association_)
             associations.remove(Association(**association_))
-            tracker['count'] += 1
-            tracker['bytes'] += sys.getsizeof(json.dumps(association_))
+
+            # encode the association and update entity trackers
+            self.data_encode(tracker, 'association', association_)
             if tracker['count'] % 2_500 == 0:
                 # log count/size at a sane level
                 self.log.info(
@@ -408,6 +532,21 @@ class Batch(BatchWriter, BatchSubmit):
                 return True
         return False
 
+    @property
+    def batch_max_in_flight(self) -> int:
+        """Return the max number of batch jobs in flight for pipelined submit."""
+        return self._batch_max_in_flight
+
+    @batch_max_in_flight.setter
+    def batch_max_in_flight(self, value: int) -> None:
+        """Set the max number of batch jobs in flight for pipelined submit."""
+        self._batch_max_in_flight = max(1, int(value))
+
+    @property
+    def checkpoint(self) -> BatchCheckpoint | None:
+        """Return the checkpoint journal, if enabled (see enable_checkpoint)."""
+        return self._checkpoint
+
     @property
     def debug(self) -> bool:
         """Return debug setting."""
@@ -430,6 +569,54 @@ class Batch(BatchWriter, BatchSubmit):
                 self._debug = True
         return self._debug
 
+    def enable_checkpoint(self, name: str = 'default') -> BatchCheckpoint:
+        """Enable the durable checkpoint journal for resumable batch jobs (submit_all only).
+
+        The journal is written to the tc_temp_path directory and records each chunk as built,
+        uploaded, and completed. When the App is restarted after a failure, submit_all polls the
+        outstanding batch jobs, uploads the chunks that were built but not uploaded, and skips
+        the chunks that already completed. Skipping completed chunks requires the App to add the
+        same data in the same order, so that the same chunks are built.
+
+        Args:
+            name: The name of the checkpoint (e.g., a unique name per batch job in the App).
+
+        Returns:
+            BatchCheckpoint: The checkpoint journal.
+        """
+        path = self.inputs.model.tc_temp_path / 'batch-checkpoint' / name
+        self._checkpoint = BatchCheckpoint(path)
+        return self._checkpoint
+
+    @property
+    def file_max_workers(self) -> int:
+        """Return the max number of concurrent file uploads."""
+        return self._file_max_workers
+
+    @file_max_workers.setter
+    def file_max_workers(self, value: int) -> None:
+        """Set the max number of concurrent file uploads (applies to a new upload pool)."""
+        self._file_max_workers = max(1, int(value))
+
+    @property
+    def file_pool(self) -> ThreadPoolExecutor:
+        """Return the bounded thread pool used to upload Document and Report files."""
+        if self._file_pool is None:
+            self._file_pool = ThreadPoolExecutor(
+                max_workers=self.file_max_workers, thread_name_prefix='submit-files'
+            )
+        return self._file_pool
+
+    @property
+    def file_retries(self) -> int:
+        """Return the max number of retries per file on 429/5xx responses."""
+        return self._file_retries
+
+    @file_retries.setter
+    def file_retries(self, value: int) -> None:
+        """Set the max number of retries per file on 429/5xx responses."""
+        self._file_retries = max(0, int(value))
+
     @property
     def halt_on_file_error(self) -> bool:
         """Return halt on file post error value."""
@@ -515,6 +702,45 @@ class Batch(BatchWriter, BatchSubmit):
             with fqfn.open('wb') as fh:
                 fh.write(content)
 
+    def plan_chunks(self) -> BatchChunkPlan:
+        """Plan the chunks for all groups, indicators, and associations in the batch job.
+
+        The entities are partitioned by the connected components of the association graph so
+        that associated entities are submitted in the same chunk (see BatchChunkPlanner). The
+        following calls to data/data_chunk (and all submit methods) will follow the plan. Any
+        entities added after planning are submitted after the planned chunks.
+
+        Planning reads every entity (including the shelf) and serializes each entity to
+        estimate the chunk size, so it should only be used when associations are expected to
+        span multiple chunks.
+
+        Returns:
+            BatchChunkPlan: The planned chunks and the partition quality report.
+        """
+        planner = BatchChunkPlanner(self._batch_max_chunk, self._batch_max_size)
+        for groups in (self.groups, self.groups_shelf):
+            for xid in list(groups.keys()):
+                group_data = groups[xid]
+                if not isinstance(group_data, dict):
+                    group_data = group_data.data
+                planner.add_group(xid, group_data)
+
+        for indicators in (self.indicators, self.indicators_shelf):
+            for xid in list(indicators.keys()):
+                indicator_data = indicators[xid]
+                if not isinstance(indicator_data, dict):
+                    indicator_data = indicator_data.data
+                planner.add_indicator(xid, indicator_data)
+
+        for association in self.associations:
+            planner.add_association(association)
+
+        plan = planner.plan()
+        self._chunk_plan = deque(plan.chunks)
+        report = ', '.join(f'{k.replace("_", "-")}={v}' for k, v in plan.report.items())
+        self.log.info(f'feature=batch, event=chunk-plan, {report}')
+        return plan
+
     @property
     def saved_groups(self) -> bool:
         """Return True if saved group files exits, else False."""
@@ -594,12 +820,14 @@ class Batch(BatchWriter, BatchSubmit):
             A dictionary containing the batch status data.
         """
         # get file, group, and indicator data
-        content = self.data
+        content, encoder = self.data_chunk()
 
         # pop any file content to pass to submit_files
         file_data = content.pop('file', {})
         batch_data = (
-            self.submit_create_and_upload(content=content, halt_on_error=halt_on_error)
+            self.submit_create_and_upload(
+                content=content, halt_on_error=halt_on_error, payload=encoder.payload
+            )
             .get('data', {})
             .get('batchStatus', {})
         )
@@ -626,16 +854,7 @@ class Batch(BatchWriter, BatchSubmit):
 
         if process_files:
             # submit file data after batch job is complete
-            self._file_threads.append(
-                self.submit_thread(
-                    name='submit-files',
-                    target=self.submit_files,
-                    args=(
-                        file_data,
-                        halt_on_error,
-                    ),
-                )
-            )
+            self.submit_files_async(file_data, halt_on_error)
         return batch_data
 
     def submit_all(
@@ -670,12 +889,17 @@ class Batch(BatchWriter, BatchSubmit):
         """
         batch_data_array = []
         file_data = {}
+
+        # complete the chunks journaled by a previous run before submitting new chunks
+        if self._checkpoint is not None:
+            batch_data_array.extend(self._resume_chunks(poll, errors, halt_on_error))
+
         while True:
-            batch_data: dict[str, int | list | str] | None = {}
+            batch_data: dict | None = {}
             batch_id: int | None = None
 
             # get file, group, and indicator data
-            content = self.data
+            content, encoder = self.data_chunk()
 
             # break loop when end of data is reached
             if (
@@ -685,67 +909,55 @@ class Batch(BatchWriter, BatchSubmit):
             ):
                 break
 
+            # the payload is encoded on each access
+            payload = encoder.payload
+
+            # skip chunks completed by a previous run and journal the new chunk
+            chunk_id = None
+            if self._checkpoint is not None:
+                payload_hash = self._checkpoint.hash(payload)
+                if self._checkpoint.is_completed(payload_hash):
+                    self.log.info(
+                        f'feature=batch, event=checkpoint-skip-completed-chunk, hash={payload_hash}'
+                    )
+                    continue
+                chunk_id = self._checkpoint.record_built(
+                    payload, payload_hash, has_files=bool(content.get('file'))
+                )
+
             if self.action.lower() == 'delete':
                 # no need to process files on a delete batch job
                 process_files = False
-
-                # while waiting of FR for delete support in createAndUpload submit delete request
-                # the old way (submit job + submit data), still using V2.
-                if len(content) > 0:
-                    batch_id = self.submit_job(halt_on_error)
-                    if batch_id is not None:
-                        batch_data = self.submit_data(
-                            batch_id=batch_id, content=content, halt_on_error=halt_on_error
-                        )
-                else:
-                    batch_data = {}
             else:
                 # pop any file content to pass to submit_files
                 file_data = content.pop('file', {})
-                batch_data = (
-                    self.submit_create_and_upload(content=content, halt_on_error=halt_on_error)
-                    .get('data', {})
-                    .get('batchStatus', {})
-                )
-                batch_id = batch_data.get('id')  # type: ignore
+            batch_data, batch_id = self._submit_chunk(content, payload, halt_on_error)
 
             if batch_id is not None:
                 self.log.info(f'feature=batch, event=status, batch-id={batch_id}')
+                if chunk_id is not None:
+                    self._checkpoint.record_uploaded(chunk_id, batch_id)  # type: ignore
+
                 # job hit queue
                 if poll:
-                    # poll for status
-                    batch_data = (
-                        self.poll(batch_id, halt_on_error=halt_on_error)
-                        .get('data', {})
-                        .get('batchStatus', {})
+                    # poll for status and retrieve errors
+                    batch_data = self.submit_poll(
+                        batch_id, errors=errors, halt_on_error=halt_on_error
                     )
-                    if errors and batch_data is not None:
-                        # retrieve errors
-                        error_count = batch_data.get('errorCount', 0)
-                        error_groups = batch_data.get('errorGroupCount', 0)
-                        error_indicators = batch_data.get('errorIndicatorCount', 0)
-                        if (
-                            isinstance(error_count, int)
-                            and isinstance(error_groups, int)
-                            and isinstance(error_indicators, int)
-                        ) and (error_count > 0 or error_groups > 0 or error_indicators > 0):
-                            batch_data['errors'] = self.errors(batch_id)
+                    if chunk_id is not None:
+                        self._checkpoint.record_completed(chunk_id, batch_data)  # type: ignore
                 else:
                     # can't process files if status is unknown (polling must be enabled)
                     process_files = False
+                    if chunk_id is not None:
+                        self._checkpoint.record_abandoned(chunk_id, 'not-polled')  # type: ignore
+            elif chunk_id is not None:
+                # the upload failed without halting, the chunk is not resumed by the next run
+                self._checkpoint.record_abandoned(chunk_id, 'upload-failed')  # type: ignore
 
             if process_files:
                 # submit file data after batch job is complete
-                self._file_threads.append(
-                    self.submit_thread(
-                        name='submit-files',
-                        target=self.submit_files,
-                        args=(
-                            file_data,
-                            halt_on_error,
-                        ),
-                    )
-                )
+                self.submit_files_async(file_data, halt_on_error)
             batch_data_array.append(batch_data)
 
             # write errors for debugging
@@ -754,6 +966,248 @@ class Batch(BatchWriter, BatchSubmit):
                 if isinstance(batch_errors, list) and len(batch_errors) > 0:
                     self.write_error_json(batch_errors)
 
+        # the batch job is complete, the checkpoint is only required if jobs are outstanding
+        if self._checkpoint is not None and not self._checkpoint.pending:
+            self._checkpoint.clear()
+
+        return batch_data_array
+
+    def submit_all_pipelined(
+        self,
+        poll: bool = True,
+        errors: bool = True,
+        process_files: bool = True,
+        halt_on_error: bool = True,
+        max_in_flight: int | None = None,
+    ) -> list[dict]:
+        """Submit Batch request to ThreatConnect API with multiple batch jobs in flight.
+
+        The submit_all method waits for each batch job to complete before building the next
+        chunk. This method continues to build and upload chunks while previously submitted batch
+        jobs are being polled in worker threads. When the in-flight window is full the oldest
+        batch job is waited on before any more data is submitted.
+
+        Batch status is returned in the same order the chunks were submitted. If any of the
+        submit, poll, or error methods fail with halt_on_error enabled, the error is raised when
+        the failed job is collected and no further chunks are submitted. Batch jobs that are
+        already in flight are allowed to complete.
+
+        Args:
+            poll: If True, poll for batch job status. Defaults to True.
+            errors: If True, retrieve errors after polling. Defaults to True.
+            process_files: If True, upload file content for Documents/Reports. Defaults to True.
+            halt_on_error: If True, halt on any batch error. Defaults to True.
+            max_in_flight: The max number of batch jobs being polled at the same time. Defaults
+                to the batch_max_in_flight value.
+
+        Returns:
+            A list of dictionaries containing batch status data for each batch submission.
+        """
+        max_in_flight = max(1, max_in_flight or self.batch_max_in_flight)
+        if self.action.lower() == 'delete':
+            # no need to process files on a delete batch job
+            process_files = False
+
+        batch_data_array = []
+        in_flight: deque[tuple[Future, dict, bool]] = deque()
+        with ThreadPoolExecutor(
+            max_workers=max_in_flight, thread_name_prefix='submit-poll'
+        ) as executor:
+            while True:
+                # collect finished jobs in submission order, blocking on the oldest job when the
+                # window is full or when a newer job has already failed.
+                while in_flight and (
+                    len(in_flight) >= max_in_flight
+                    or in_flight[0][0].done()
+                    or any(f.done() and f.exception() is not None for f, _, _ in in_flight)
+                ):
+                    batch_data_array.append(
+                        self._submit_all_pipelined_collect(*in_flight.popleft(), halt_on_error)
+                    )
+
+                # get file, group, and indicator data
+                content, encoder = self.data_chunk()
+
+                # break loop when end of data is reached
+                if (
+                    not content.get('group')
+                    and not content.get('indicator')
+                    and not content.get('association')
+                ):
+                    break
+
+                file_data = content.pop('file', {})
+                batch_data, batch_id = self._submit_chunk(content, encoder.payload, halt_on_error)
+
+                # release the chunk data before waiting on any in-flight jobs
+                count = encoder.count('group') + encoder.count('indicator')
+                del content, encoder
+
+                if batch_id is not None and poll:
+                    self.log.info(f'feature=batch, event=status, batch-id={batch_id}')
+                    future = executor.submit(
+                        self.submit_poll,
+                        batch_id,
+                        errors=errors,
+                        halt_on_error=halt_on_error,
+                        count=count,
+                    )
+                else:
+                    # job was processed inline or is not being polled
+                    future = Future()
+                    future.set_result(batch_data)
+
+                # can't process files if status is unknown (polling must be enabled)
+                chunk_process_files = process_files and (batch_id is None or poll)
+                in_flight.append((future, file_data, chunk_process_files))
+
+            # collect remaining jobs in submission order
+            while in_flight:
+                batch_data_array.append(
+                    self._submit_all_pipelined_collect(*in_flight.popleft(), halt_on_error)
+                )
+
+        return batch_data_array
+
+    def _submit_all_pipelined_collect(
+        self, future: Future, file_data: dict, process_files: bool, halt_on_error: bool
+    ) -> dict:
+        """Return the batch status for a pipelined batch job, waiting for it to complete.
+
+        Args:
+            future: The future for the batch job poll.
+            file_data: A dictionary mapping xid to file content data.
+            process_files: If True, upload file content for Documents/Reports.
+            halt_on_error: If True, halt on any file upload error.
+
+        Returns:
+            A dictionary containing the batch status data.
+        """
+        # any poll/error exception is raised here in the calling thread
+        batch_data = future.result()
+
+        if process_files and file_data:
+            # submit file data after batch job is complete
+            self.submit_files_async(file_data, halt_on_error)
+
+        # write errors for debugging
+        if isinstance(batch_data, dict):
+            batch_errors = batch_data.get('errors', [])
+            if isinstance(batch_errors, list) and len(batch_errors) > 0:
+                self.write_error_json(batch_errors)
+
+        return batch_data
+
+    def _submit_chunk(
+        self, content: dict, payload: bytes, halt_on_error: bool
+    ) -> tuple[dict | None, int | None]:
+        """Submit a single chunk and return the batch status and batch id.
+
+        Args:
+            content: The batch content dictionary containing groups and indicators.
+            payload: The encoded content payload.
+            halt_on_error: If True, halt on any batch error.
+
+        Returns:
+            tuple: The batch status data and the batch id (None if the submit failed).
+        """
+        batch_data: dict | None
+        batch_id: int | None = None
+        if self.action.lower() == 'delete':
+            # while waiting of FR for delete support in createAndUpload submit delete request
+            # the old way (submit job + submit data), still using V2.
+            batch_data = {}
+            if len(content) > 0:
+                batch_id = self.submit_job(halt_on_error)
+                if batch_id is not None:
+                    batch_data = self.submit_data(
+                        batch_id=batch_id, content=content, halt_on_error=halt_on_error
+                    )
+        else:
+            batch_data = (
+                self.submit_create_and_upload(
+                    content=content, halt_on_error=halt_on_error, payload=payload
+                )
+                .get('data', {})
+                .get('batchStatus', {})
+            )
+            batch_id = batch_data.get('id')  # type: ignore
+        return batch_data, batch_id
+
+    def submit_resume(
+        self, poll: bool = True, errors: bool = True, halt_on_error: bool = True
+    ) -> list[dict]:
+        """Complete the chunks journaled by a previous run of the App.
+
+        Chunks that were uploaded are polled using the journaled batch id and chunks that were
+        built but not uploaded are uploaded from the journaled payload. File content for
+        Documents/Reports is not journaled and can not be resumed. The journal is cleared once
+        no chunks are pending.
+
+        Args:
+            poll: If True, poll for batch job status. Defaults to True.
+            errors: If True, retrieve errors after polling. Defaults to True.
+            halt_on_error: If True, halt on any batch error. Defaults to True.
+
+        Returns:
+            A list of dictionaries containing batch status data for each resumed chunk.
+        """
+        batch_data_array = self._resume_chunks(poll, errors, halt_on_error)
+        if self._checkpoint is not None and not self._checkpoint.pending:
+            self._checkpoint.clear()
+        return batch_data_array
+
+    def _resume_chunks(self, poll: bool, errors: bool, halt_on_error: bool) -> list[dict]:
+        """Complete the pending chunks of the checkpoint journal (see submit_resume).
+
+        Chunks that can't be resumed (e.g., the upload fails without halting) are recorded as
+        abandoned, so they are not resumed again by the next run.
+        """
+        batch_data_array = []
+        if self._checkpoint is None:
+            return batch_data_array
+
+        for chunk in self._checkpoint.pending:
+            chunk_id = chunk['chunk']
+            batch_id = chunk.get('batch_id')
+            count = None
+            self.log.info(
+                f'feature=batch, event=checkpoint-resume, chunk={chunk_id}, '
+                f'state={chunk["state"]}, batch-id={batch_id}'
+            )
+            if chunk.get('has_files'):
+                self.log.warning(
+                    f'feature=batch, event=checkpoint-file-content-not-resumed, chunk={chunk_id}'
+                )
+
+            if chunk['state'] == 'built':
+                try:
+                    payload = self._checkpoint.load(chunk_id)
+                except OSError:
+                    self.log.exception(
+                        f'feature=batch, event=checkpoint-load-error, chunk={chunk_id}'
+                    )
+                    self._checkpoint.record_abandoned(chunk_id, 'load-failed')
+                    continue
+                content = json.loads(payload)
+                count = len(content.get('group', [])) + len(content.get('indicator', []))
+                batch_data, batch_id = self._submit_chunk(content, payload, halt_on_error)
+                if batch_id is None:
+                    self._checkpoint.record_abandoned(chunk_id, 'upload-failed')
+                    batch_data_array.append(batch_data)
+                    continue
+                self._checkpoint.record_uploaded(chunk_id, batch_id)
+            else:
+                batch_data = {'id': batch_id}
+
+            if poll:
+                batch_data = self.submit_poll(
+                    batch_id, errors=errors, halt_on_error=halt_on_error, count=count
+                )
+                self._checkpoint.record_completed(chunk_id, batch_data)
+            else:
+                self._checkpoint.record_abandoned(chunk_id, 'not-polled')
+            batch_data_array.append(batch_data)
         return batch_data_array
 
     def submit_callback(
@@ -779,11 +1233,10 @@ class Batch(BatchWriter, BatchSubmit):
             True if data was submitted, False if no data was available to submit.
         """
         # user provided content or grab content from local group/indicator lists
-        if content is not None:
-            # process content
-            pass
-        else:
-            content = self.data
+        payload = None
+        if content is None:
+            content, encoder = self.data_chunk()
+            payload = encoder.payload
         file_data = content.pop('file', {})
 
         # return False when end of data is reached
@@ -804,7 +1257,9 @@ class Batch(BatchWriter, BatchSubmit):
 
         # submit the data and collect the response
         batch_data: dict = (
-            self.submit_create_and_upload(content=content, halt_on_error=halt_on_error)
+            self.submit_create_and_upload(
+                content=content, halt_on_error=halt_on_error, payload=payload
+            )
             .get('data', {})
             .get('batchStatus', {})
         )
@@ -855,20 +1310,10 @@ class Batch(BatchWriter, BatchSubmit):
         else:
             batch_status = batch_data
 
-        # launch file upload in a thread *after* batch status is returned. while only one batch
-        # submission thread is allowed, there is no limit on file upload threads. the upload
-        # status returned by file upload will be ignored when running in a thread.
+        # queue file uploads *after* batch status is returned. uploads are processed by the
+        # bounded file upload pool and the upload status is ignored when running in a thread.
         if file_data:
-            self._file_threads.append(
-                self.submit_thread(
-                    name='submit-files',
-                    target=self.submit_files,
-                    args=(
-                        file_data,
-                        halt_on_error,
-                    ),
-                )
-            )
+            self.submit_files_async(file_data, halt_on_error)
 
         # send batch_status to callback
         if callable(callback):
@@ -878,12 +1323,16 @@ class Batch(BatchWriter, BatchSubmit):
             except Exception as e:
                 self.log.warning(f'feature=batch, event=callback-error, err="""{e}"""')
 
-    def submit_create_and_upload(self, content: dict, halt_on_error: bool = True) -> dict:
+    def submit_create_and_upload(
+        self, content: dict, halt_on_error: bool = True, payload: bytes | None = None
+    ) -> dict:
         """Submit Batch request to ThreatConnect API.
 
         Args:
             content: The batch content dictionary containing groups and indicators.
             halt_on_error: If True, halt on any batch error. Defaults to True.
+            payload: The pre-encoded content payload (e.g., BatchChunkEncoder.payload). When
+                provided the content is not serialized again.
 
         Returns:
             A dictionary containing the API response with batch status data.
@@ -896,6 +1345,7 @@ class Batch(BatchWriter, BatchSubmit):
         self.write_batch_json(content)
 
         # store the length of the batch data to use for poll interval calculations
+        self._batch_data_count = len(content['group']) + len(content['indicator'])
         self.log.info(
             """feature=batch, event=submit-create-and-upload, type=group, """
             f"""count={len(content['group']):,}"""
@@ -906,7 +1356,9 @@ class Batch(BatchWriter, BatchSubmit):
         )
 
         try:
-            files = (('config', json.dumps(self.settings)), ('content', json.dumps(content)))
+            if payload is None:
+                payload = json.dumps(content).encode()
+            files = (('config', json.dumps(self.settings)), ('content', payload))
             params = {'includeAdditional': 'true'}
             r = self.session_tc.post('/v2/batch/createAndUpload', files=files, params=params)
             if not r.ok or 'application/json' not in r.headers.get('content-type', ''):
@@ -921,109 +1373,155 @@ class Batch(BatchWriter, BatchSubmit):
 
         return {}
 
-    def submit_files(self, file_data: dict, halt_on_error: bool = True) -> list[dict] | None:
+    def submit_files(self, file_data: dict, halt_on_error: bool = True) -> list[dict]:
         """Submit Files for Documents and Reports to ThreatConnect API.
 
+        Files are uploaded concurrently using the file upload pool (see file_max_workers). This
+        method blocks until all files have been uploaded.
+
         Critical Errors: There is insufficient document storage allocated to this account.
 
         Args:
             file_data: A dictionary mapping xid to file content data.
             halt_on_error: If True, halt on any file upload error. Defaults to True.
-            clean_content: If True, clean the content before upload. Defaults to False.
 
         Returns:
-            A list of dictionaries with upload status for each file, or None on critical error.
+            A list of dictionaries with upload status for each file (in submission order).
+        """
+        futures = self.submit_files_async(file_data, halt_on_error)
+
+        upload_status = []
+        try:
+            for future in futures:
+                status = future.result()
+                if status is not None:
+                    upload_status.append(status)
+        except Exception:
+            # halt on error, don't start any uploads that are still queued
+            for future in futures:
+                future.cancel()
+            raise
+        return upload_status
+
+    def submit_files_async(self, file_data: dict, halt_on_error: bool = True) -> list[Future]:
+        """Queue Files for Documents and Reports for upload in the file upload pool.
+
+        The file content can be bytes, str, a Path (streamed from disk), an iterable of bytes
+        (streamed, not retried), or a callable that takes the xid and returns any of these.
+
+        Args:
+            file_data: A dictionary mapping xid to file content data.
+            halt_on_error: If True, halt on any file upload error. Defaults to True.
+
+        Returns:
+            A list of futures, each resolving to the upload status of a single file.
         """
         # check global setting for override
         if self.halt_on_file_error is not None:
             halt_on_error = self.halt_on_file_error
 
-        upload_status = []
         self.log.info(f'feature=batch, action=submit-files, count={len(file_data)}')
+        futures = []
         for xid, content_data in list(file_data.items()):
             del file_data[xid]  # win or loose remove the entry
-            status = True
+            futures.append(
+                self.file_pool.submit(self._submit_file, xid, content_data, halt_on_error)
+            )
 
-            # used for debug/testing to prevent upload of previously uploaded file
-            if self.debug and xid in self.saved_xids:
-                self.log.debug(
-                    f'feature=batch-submit-files, action=skip-previously-saved-file, xid={xid}'
-                )
-                continue
+        # track the futures so that close() can wait for outstanding uploads
+        self._file_futures = [f for f in self._file_futures if not f.done()]
+        self._file_futures.extend(futures)
+        return futures
 
-            # process the file content
-            content = content_data.get('fileContent')
-            if callable(content):
-                try:
-                    content_callable_name = getattr(content, '__name__', repr(content))
-                    self.log.trace(
-                        f'feature=batch-submit-files, method={content_callable_name}, xid={xid}'
-                    )
-                    content = content_data.get('fileContent')(xid)
-                except Exception as e:
-                    self.log.warning(f'feature=batch, event=file-download-exception, err="""{e}"""')
+    def _submit_file(self, xid: str, content_data: dict, halt_on_error: bool) -> dict | None:
+        """Upload a single file for a Document or Report (runs in the file upload pool).
 
-            if content is None:
-                upload_status.append({'uploaded': False, 'xid': xid})
-                self.log.warning(f'feature=batch-submit-files, xid={xid}, event=content-null')
-                continue
+        Args:
+            xid: The xid of the Document or Report.
+            content_data: The file content data.
+            halt_on_error: If True, halt on any file upload error.
 
-            api_branch = 'documents'
-            if content_data.get('type') == 'Report':
-                api_branch = 'reports'
+        Returns:
+            The upload status for the file, or None if the file was skipped.
+        """
+        # used for debug/testing to prevent upload of previously uploaded file
+        if self.debug and xid in self.saved_xids:
+            self.log.debug(
+                f'feature=batch-submit-files, action=skip-previously-saved-file, xid={xid}'
+            )
+            return None
 
-            if self.debug and content_data.get('fileName'):
-                # special code for debugging App using batchV2.
-                fqfn = (
-                    self.debug_path_files
-                    / f'{api_branch}--{xid}--{content_data.get("fileName").replace("/", ":")}'
+        # process the file content
+        content = content_data.get('fileContent')
+        if callable(content):
+            try:
+                content_callable_name = getattr(content, '__name__', repr(content))
+                self.log.trace(
+                    f'feature=batch-submit-files, method={content_callable_name}, xid={xid}'
                 )
-                if fqfn.parent.is_dir():
-                    with fqfn.open(mode='wb') as fh:
-                        if not isinstance(content, bytes):
-                            content = content.encode()
-                        fh.write(content)
-
-            # Post File
-            url = f'/v2/groups/{api_branch}/{xid}/upload'
-            headers = {'Content-Type': 'application/octet-stream'}
-            params = {'owner': self._owner, 'updateIfExists': 'true'}
-            r = self.submit_file_content('POST', url, content, headers, params, halt_on_error)
-            if r is None:
-                return None
+                content = content(xid)
+            except Exception as e:
+                self.log.warning(f'feature=batch, event=file-download-exception, err="""{e}"""')
+                content = None
 
-            http_unauthorized_code = 401
-            if r.status_code == http_unauthorized_code:
-                # use PUT method if file already exists
-                self.log.info('feature=batch, event=401-from-post, action=switch-to-put')
-                r = self.submit_file_content('PUT', url, content, headers, params, halt_on_error)
-                if r is None:
-                    return None
+        if content is None:
+            self.log.warning(f'feature=batch-submit-files, xid={xid}, event=content-null')
+            return {'attempts': 0, 'status_code': None, 'uploaded': False, 'xid': xid}
 
-            if not r.ok:
-                status = False
-                handle_error(
-                    code=585,
-                    message_values=[r.status_code, r.text],
-                    raise_error=halt_on_error,
-                )
-            elif self.debug and self.enable_saved_file and xid not in self.saved_xids:
-                # save xid "if" successfully uploaded and not already saved
-                self.saved_xids = xid
+        api_branch = 'documents'
+        if content_data.get('type') == 'Report':
+            api_branch = 'reports'
 
-            self.log.info(
-                f'feature=batch, event=file-upload, status={r.status_code}, '
-                f'xid={xid}, remaining={len(file_data)}'
+        if self.debug and content_data.get('fileName'):
+            # special code for debugging App using batchV2.
+            fqfn = (
+                self.debug_path_files
+                / f'{api_branch}--{xid}--{content_data.get("fileName").replace("/", ":")}'
+            )
+            if fqfn.parent.is_dir():
+                if not isinstance(content, bytes | str | Path):
+                    # streamed content can only be consumed once
+                    content = b''.join(content)
+                with fqfn.open(mode='wb') as fh:
+                    if isinstance(content, Path):
+                        fh.write(content.read_bytes())
+                    else:
+                        fh.write(content if isinstance(content, bytes) else content.encode())
+
+        # Post File
+        url = f'/v2/groups/{api_branch}/{xid}/upload'
+        headers = {'Content-Type': 'application/octet-stream'}
+        params = {'owner': self._owner, 'updateIfExists': 'true'}
+        r, attempts = self.submit_file_content_retry(url, content, headers, params, halt_on_error)
+
+        status = r is not None and r.ok
+        if r is not None and not r.ok:
+            handle_error(
+                code=585,
+                message_values=[r.status_code, r.text],
+                raise_error=halt_on_error,
             )
-            upload_status.append({'uploaded': status, 'xid': xid})
+        elif status and self.debug and self.enable_saved_file and xid not in self.saved_xids:
+            # save xid "if" successfully uploaded and not already saved
+            with self._file_lock:
+                self.saved_xids = xid
 
-        return upload_status
+        self.log.info(
+            f'feature=batch, event=file-upload, '
+            f'status={None if r is None else r.status_code}, xid={xid}, attempts={attempts}'
+        )
+        return {
+            'attempts': attempts,
+            'status_code': None if r is None else r.status_code,
+            'uploaded': status,
+            'xid': xid,
+        }
 
     def submit_file_content(
         self,
         method: str,
         url: str,
-        data: bytes | str,
+        data: bytes | str | Path | Iterable[bytes],
         headers: dict,
         params: dict,
         halt_on_error: bool = True,
@@ -1033,7 +1531,8 @@ class Batch(BatchWriter, BatchSubmit):
         Args:
             method: The HTTP method to use (e.g., 'POST', 'PUT').
             url: The API endpoint URL.
-            data: The file content as bytes or string.
+            data: The file content as bytes or string, a Path (streamed from disk), or an
+                iterable of bytes (streamed).
             headers: The HTTP headers for the request.
             params: The query parameters for the request.
             halt_on_error: If True, halt on any error. Defaults to True.
@@ -1043,11 +1542,78 @@ class Batch(BatchWriter, BatchSubmit):
         """
         r = None
         try:
-            r = self.session_tc.request(method, url, data=data, headers=headers, params=params)
+            if isinstance(data, Path):
+                with data.open('rb') as fh:
+                    r = self.session_tc.request(
+                        method, url, data=fh, headers=headers, params=params
+                    )
+            else:
+                r = self.session_tc.request(method, url, data=data, headers=headers, params=params)
         except Exception as e:
             handle_error(code=580, message_values=[e], raise_error=halt_on_error)
         return r
 
+    def submit_file_content_retry(
+        self,
+        url: str,
+        content: bytes | str | Path | Iterable[bytes],
+        headers: dict,
+        params: dict,
+        halt_on_error: bool = True,
+    ) -> tuple[Response | None, int]:
+        """Submit File Content, retrying with exponential backoff on 429/5xx responses.
+
+        A POST is sent first, switching to PUT if the API returns 401 (file already exists).
+        Path content is streamed from disk and reopened on each attempt. Any other iterable is
+        streamed as-is and can not be retried.
+
+        Args:
+            url: The API endpoint URL.
+            content: The file content.
+            headers: The HTTP headers for the request.
+            params: The query parameters for the request.
+            halt_on_error: If True, halt on any error. Defaults to True.
+
+        Returns:
+            The Response object (or None on error) and the number of attempts made.
+        """
+        replayable = isinstance(content, bytes | str | Path)
+        method = 'POST'
+        attempt = 0
+        while True:
+            attempt += 1
+            # a request error only halts on the last attempt
+            last_attempt = not replayable or attempt > self.file_retries
+            r = self.submit_file_content(
+                method, url, content, headers, params, halt_on_error and last_attempt
+            )
+
+            http_unauthorized_code = 401
+            if r is not None and r.status_code == http_unauthorized_code and method == 'POST':
+                # use PUT method if file already exists
+                self.log.info('feature=batch, event=401-from-post, action=switch-to-put')
+                method = 'PUT'
+                if replayable:
+                    attempt -= 1  # the method switch does not count as a retry
+                    continue
+
+            retryable = r is None or r.status_code in self._file_retry_status_codes
+            if not retryable or last_attempt:
+                break
+
+            # honor the Retry-After header if provided, else use exponential backoff
+            delay = self._file_retry_backoff * 2 ** (attempt - 1)
+            retry_after = None if r is None else r.headers.get('Retry-After')
+            if retry_after is not None and retry_after.isdigit():
+                delay = max(delay, float(retry_after))
+            self.log.warning(
+                f'feature=batch, event=file-upload-retry, url={url}, attempt={attempt}, '
+                f'status={None if r is None else r.status_code}, delay={delay}'
+            )
+            time.sleep(delay)
+
+        return r, attempt
+
     def submit_job(self, halt_on_error: bool = True) -> int | None:
         """Submit Batch request to ThreatConnect API.
 
@@ -1083,6 +1649,43 @@ class Batch(BatchWriter, BatchSubmit):
         self.log.debug(f'feature=batch, event=submit-job, status={data}')
         return data.get('data', {}).get('batchId')
 
+    def submit_poll(
+        self,
+        batch_id: int,
+        errors: bool = True,
+        halt_on_error: bool = True,
+        count: int | None = None,
+    ) -> dict:
+        """Poll for batch job status and retrieve any batch errors.
+
+        Args:
+            batch_id: The ID returned from the ThreatConnect API for the batch job.
+            errors: If True, retrieve errors after polling. Defaults to True.
+            halt_on_error: If True, halt on any batch error. Defaults to True.
+            count: The number of groups and indicators in the batch job, used to estimate the
+                poll interval. Defaults to the count of the last submitted batch job.
+
+        Returns:
+            A dictionary containing the batch status data.
+        """
+        batch_data = (
+            self.poll(batch_id, halt_on_error=halt_on_error, count=count)
+            .get('data', {})
+            .get('batchStatus', {})
+        )
+        if errors and batch_data is not None:
+            # retrieve errors
+            error_count = batch_data.get('errorCount', 0)
+            error_groups = batch_data.get('errorGroupCount', 0)
+            error_indicators = batch_data.get('errorIndicatorCount', 0)
+            if (
+                isinstance(error_count, int)
+                and isinstance(error_groups, int)
+                and isinstance(error_indicators, int)
+            ) and (error_count > 0 or error_groups > 0 or error_indicators > 0):
+                batch_data['errors'] = self.errors(batch_id)
+        return batch_data
+
     def submit_thread(
         self,
         name: str,
@@ -0,0 +1,192 @@
+"""TcEx Framework Module"""
+
+# standard library
+import gzip
+import hashlib
+import json
+import logging
+import os
+import shutil
+import time
+from pathlib import Path
+
+# first-party
+from tcex.logger.trace_logger import TraceLogger
+
+# get tcex logger
+_logger: TraceLogger = logging.getLogger(__name__.split('.', maxsplit=1)[0])  # type: ignore
+
+
+class BatchCheckpoint:
+    """Durable checkpoint journal for resumable batch jobs.
+
+    The journal is an append-only JSON lines file recording the state of each chunk:
+
+    * built - the encoded chunk payload was written to disk (chunk-<id>.json.gz).
+    * uploaded - the chunk was submitted and the batch id was returned.
+    * completed - the batch job completed (the chunk payload is removed).
+    * abandoned - the chunk can't be resumed, e.g., the upload failed without halting or the
+      batch job was not polled (the chunk payload is removed).
+
+    Each record is flushed and fsynced before the next step runs, so after a restart the
+    chunks that were built but not uploaded can be uploaded from disk, jobs that were uploaded
+    but not completed can be polled, and chunks that completed can be skipped (matched by the
+    sha256 of the payload).
+
+    Args:
+        path: The directory for the journal and chunk payloads.
+    """
+
+    def __init__(self, path: Path):
+        """Initialize instance properties."""
+        self.path = path
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.journal_fqfn = self.path / 'journal.jsonl'
+        self.log = _logger
+
+        # chunk state replayed from the journal
+        self._chunks: dict[int, dict] = {}
+        self._completed_hashes: set[str] = set()
+        self._replay()
+
+    def _append(self, record: dict):
+        """Durably append a record to the journal."""
+        record['ts'] = round(time.time(), 3)
+        with self.journal_fqfn.open('a', encoding='utf-8') as fh:
+            fh.write(f'{json.dumps(record)}\n')
+            fh.flush()
+            os.fsync(fh.fileno())
+        self._apply(record)
+
+    def _apply(self, record: dict):
+        """Apply a journal record to the chunk state."""
+        chunk = self._chunks.setdefault(record['chunk'], {'chunk': record['chunk']})
+        chunk['state'] = record['event']
+        for key in ('batch_id', 'has_files', 'hash'):
+            if key in record:
+                chunk[key] = record[key]
+        if record['event'] == 'completed' and chunk.get('hash'):
+            self._completed_hashes.add(chunk['hash'])
+
+    def _replay(self):
+        """Replay the journal to rebuild the chunk state."""
+        if not self.journal_fqfn.is_file():
+            return
+
+        line = ''
+        with self.journal_fqfn.open(encoding='utf-8') as fh:
+            for line in fh:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # a partially written record (e.g., the App was killed mid write)
+                    self.log.warning(f'feature=batch, event=checkpoint-invalid-record, line={line}')
+                    continue
+                self._apply(record)
+
+        if line and not line.endswith('\n'):
+            # terminate the partial record so that new records start on a new line
+            with self.journal_fqfn.open('a', encoding='utf-8') as fh:
+                fh.write('\n')
+
+        self.log.info(
+            f'feature=batch, event=checkpoint-replay, chunks={len(self._chunks)}, '
+            f'pending={len(self.pending)}'
+        )
+
+    def chunk_fqfn(self, chunk: int) -> Path:
+        """Return the fully qualified filename of a chunk payload."""
+        return self.path / f'chunk-{chunk:06d}.json.gz'
+
+    def clear(self):
+        """Remove the journal and any chunk payloads (e.g., once the batch job is complete)."""
+        shutil.rmtree(self.path, ignore_errors=True)
+        self._chunks.clear()
+        self._completed_hashes.clear()
+
+    @staticmethod
+    def hash(payload: bytes) -> str:
+        """Return the hash used to match a chunk payload to a completed chunk."""
+        return hashlib.sha256(payload).hexdigest()
+
+    def is_completed(self, payload_hash: str) -> bool:
+        """Return True if a chunk with the same payload has already completed."""
+        return payload_hash in self._completed_hashes
+
+    def load(self, chunk: int) -> bytes:
+        """Return the payload of a built chunk."""
+        with gzip.open(self.chunk_fqfn(chunk), mode='rb') as fh:
+            return fh.read()
+
+    @property
+    def pending(self) -> list[dict]:
+        """Return the built or uploaded chunks that have not completed, in chunk order."""
+        return [
+            chunk
+            for _, chunk in sorted(self._chunks.items())
+            if chunk.get('state') in ('built', 'uploaded')
+        ]
+
+    def record_built(self, payload: bytes, payload_hash: str, has_files: bool = False) -> int:
+        """Write the chunk payload to disk and record the chunk as built.
+
+        Args:
+            payload: The encoded content payload.
+            payload_hash: The hash of the payload.
+            has_files: True if the chunk has Document/Report file content (not checkpointed).
+
+        Returns:
+            int: The chunk id.
+        """
+        chunk = max(self._chunks, default=0) + 1
+        self.path.mkdir(parents=True, exist_ok=True)
+
+        # write the payload atomically so that a partial file is never loaded
+        fqfn = self.chunk_fqfn(chunk)
+        fqfn_tmp = fqfn.with_suffix('.tmp')
+        with gzip.open(fqfn_tmp, mode='wb', compresslevel=1) as fh:
+            fh.write(payload)
+        with fqfn_tmp.open('rb') as fh:
+            os.fsync(fh.fileno())
+        fqfn_tmp.replace(fqfn)
+
+        self._append(
+            {'chunk': chunk, 'event': 'built', 'has_files': has_files, 'hash': payload_hash}
+        )
+        return chunk
+
+    def record_abandoned(self, chunk: int, reason: str):
+        """Record a chunk that can not be resumed and remove the chunk payload.
+
+        Args:
+            chunk: The chunk id.
+            reason: The reason the chunk was abandoned (e.g., upload-failed or not-polled).
+        """
+        self._append({'chunk': chunk, 'event': 'abandoned', 'reason': reason})
+        self.chunk_fqfn(chunk).unlink(missing_ok=True)
+
+    def record_completed(self, chunk: int, batch_status: dict | None = None):
+        """Record the batch job for a chunk as completed and remove the chunk payload.
+
+        Args:
+            chunk: The chunk id.
+            batch_status: The batch status returned by the ThreatConnect API.
+        """
+        record = {'chunk': chunk, 'event': 'completed'}
+        if batch_status:
+            record['status'] = {
+                k: v
+                for k, v in batch_status.items()
+                if k in ('errorCount', 'id', 'status', 'successCount', 'unprocessCount')
+            }
+        self._append(record)
+        self.chunk_fqfn(chunk).unlink(missing_ok=True)
+
+    def record_uploaded(self, chunk: int, batch_id: int | None):
+        """Record a chunk as uploaded.
+
+        Args:
+            chunk: The chunk id.
+            batch_id: The batch id returned by the ThreatConnect API.
+        """
+        self._append({'batch_id': batch_id, 'chunk': chunk, 'event': 'uploaded'})
@@ -0,0 +1,87 @@
+"""TcEx Framework Module"""
+
+# standard library
+import json
+
+
+class BatchChunkEncoder:
+    """Incrementally encode batch entities into a createAndUpload content payload.
+
+    Each entity is serialized exactly once when it is added to the chunk. The encoded fragments
+    are retained so that the final payload can be assembled without serializing the chunk a
+    second time, and the exact byte length of the payload is tracked as entities are added.
+
+    The assembled payload is byte-for-byte identical to ``json.dumps(content).encode()`` for
+    a content dict containing the group, indicator, and association sections in that order.
+    """
+
+    __slots__ = ['_counts', '_fragments', '_sizes']
+
+    # the order of the sections in the payload (matches the order used by Batch.data)
+    sections = ('group', 'indicator', 'association')
+
+    # separators used by json.dumps default formatting
+    _item_separator = b', '
+    _key_separator = b': '
+
+    def __init__(self):
+        """Initialize instance properties."""
+        self._counts: dict[str, int] = dict.fromkeys(self.sections, 0)
+        self._fragments: dict[str, list[bytes]] = {section: [] for section in self.sections}
+        self._sizes: dict[str, int] = dict.fromkeys(self.sections, 0)
+
+    def add(self, section: str, item: dict) -> int:
+        """Encode and add a single entity to the chunk.
+
+        Args:
+            section: The section of the payload (group, indicator, or association).
+            item: The entity data to encode.
+
+        Returns:
+            int: The number of bytes the entity added to the payload.
+        """
+        encoded = json.dumps(item).encode()
+
+        # include the item separator for all but the first item in the section
+        added = len(encoded)
+        if self._counts[section] > 0:
+            added += len(self._item_separator)
+
+        self._fragments[section].append(encoded)
+        self._counts[section] += 1
+        self._sizes[section] += added
+        return added
+
+    def count(self, section: str | None = None) -> int:
+        """Return the number of entities in the chunk or a single section of the chunk.
+
+        Args:
+            section: Optional section name, if not provided the total count is returned.
+        """
+        if section is not None:
+            return self._counts[section]
+        return sum(self._counts.values())
+
+    @property
+    def payload(self) -> bytes:
+        """Return the encoded content payload."""
+        sections = []
+        for section in self.sections:
+            key = json.dumps(section).encode()
+            items = self._item_separator.join(self._fragments[section])
+            sections.append(key + self._key_separator + b'[' + items + b']')
+        return b'{' + self._item_separator.join(sections) + b'}'
+
+    @property
+    def size(self) -> int:
+        """Return the exact byte length of the encoded content payload."""
+        # framing: braces plus separators between each section
+        size = 2 + len(self._item_separator) * (len(self.sections) - 1)
+        for section in self.sections:
+            # quoted key, key separator, brackets, and the encoded items
+            size += len(section) + 2 + len(self._key_separator) + 2 + self._sizes[section]
+        return size
+
+    def __len__(self) -> int:
+        """Return the number of entities in the chunk."""
+        return self.count()
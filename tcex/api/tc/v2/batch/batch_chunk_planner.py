@@ -0,0 +1,260 @@
+"""TcEx Framework Module"""
+
+# standard library
+import json
+from collections import deque
+from typing import Any
+
+# first-party
+from tcex.api.tc.v2.batch.association import Association
+
+
+class BatchChunkPlan:
+    """The chunks produced by the BatchChunkPlanner and the quality of the partition.
+
+    Each chunk is a list of (section, key) entries, where section is group, indicator, or
+    association and the key is the xid of the group/indicator or the Association object.
+
+    Args:
+        chunks: The planned chunks in submission order.
+        report: The partition quality report.
+    """
+
+    __slots__ = ['chunks', 'report']
+
+    def __init__(self, chunks: list[list[tuple[str, Any]]], report: dict[str, float | int]):
+        """Initialize instance properties."""
+        self.chunks = chunks
+        self.report = report
+
+    def __len__(self) -> int:
+        """Return the number of planned chunks."""
+        return len(self.chunks)
+
+
+class BatchChunkPlanner:
+    """Partition groups, indicators, and associations into chunks using the association graph.
+
+    Entities are connected by group associations (associatedGroupXid), indicator associations
+    (associatedGroups.groupXid), and Association objects (ref_1/ref_2). References to xids that
+    are not part of the batch job (e.g., previously created groups) are ignored.
+
+    Each connected component is placed in a single chunk when it fits the max chunk count and
+    size (first-fit decreasing). Components that are too large are split with all groups ahead
+    of indicators and associations, so that references point to groups submitted in the same or
+    an earlier chunk whenever possible. References to a later chunk (forward references) are the
+    ones that can fail and are reported separately.
+
+    Args:
+        max_chunk: The max number of entities in a chunk.
+        max_size: The max size in bytes of a chunk (estimated from the encoded entities).
+    """
+
+    # order of the sections within a chunk
+    sections = ('group', 'indicator', 'association')
+
+    def __init__(self, max_chunk: int, max_size: int):
+        """Initialize instance properties."""
+        self.max_chunk = max_chunk
+        self.max_size = max_size
+
+        # node storage (index based)
+        self._index: dict[str, int] = {}
+        self._keys: list[Any] = []
+        self._refs: list[list[str]] = []
+        self._sections: list[str] = []
+        self._sizes: list[int] = []
+
+    def _add(self, section: str, key: Any, xid: str | None, refs: list[str], size: int):
+        """Add a node to the graph."""
+        if xid is not None:
+            if xid in self._index:
+                # duplicate xid, the entity will only be submitted once
+                return
+            self._index[xid] = len(self._keys)
+        self._keys.append(key)
+        self._refs.append(refs)
+        self._sections.append(section)
+        self._sizes.append(size)
+
+    @staticmethod
+    def _size(data: dict) -> int:
+        """Return the encoded size of an entity (file content is not part of the payload)."""
+        if 'fileContent' in data:
+            data = {k: v for k, v in data.items() if k != 'fileContent'}
+        # json.dumps escapes non-ascii characters, so the str length equals the byte length
+        return len(json.dumps(data)) + 2  # include the item separator
+
+    def add_association(self, association: Association):
+        """Add an association to the graph.
+
+        Args:
+            association: The Association object.
+        """
+        refs = [ref for ref in (association.ref_1, association.ref_2) if ref is not None]
+        self._add('association', association, None, refs, self._size(association.data))
+
+    def add_group(self, xid: str, data: dict):
+        """Add a group to the graph.
+
+        Args:
+            xid: The xid of the group.
+            data: The group data.
+        """
+        refs = list(data.get('associatedGroupXid') or [])
+        self._add('group', xid, xid, refs, self._size(data))
+
+    def add_indicator(self, xid: str, data: dict):
+        """Add an indicator to the graph.
+
+        Args:
+            xid: The xid of the indicator.
+            data: The indicator data.
+        """
+        refs = [
+            group['groupXid']
+            for group in data.get('associatedGroups') or []
+            if group.get('groupXid') is not None
+        ]
+        self._add('indicator', xid, xid, refs, self._size(data))
+
+    def _components(self) -> list[list[int]]:
+        """Return the connected components of the graph (union-find)."""
+        parent = list(range(len(self._keys)))
+
+        def find(node: int) -> int:
+            while parent[node] != node:
+                parent[node] = parent[parent[node]]
+                node = parent[node]
+            return node
+
+        for node, refs in enumerate(self._refs):
+            for ref in refs:
+                other = self._index.get(ref)
+                if other is not None:
+                    root_a, root_b = find(node), find(other)
+                    if root_a != root_b:
+                        parent[root_b] = root_a
+
+        components: dict[int, list[int]] = {}
+        for node in range(len(self._keys)):
+            components.setdefault(find(node), []).append(node)
+        return list(components.values())
+
+    def _order(self, nodes: list[int]) -> list[int]:
+        """Return the nodes of a component ordered by section, groups in association order."""
+        by_section: dict[str, list[int]] = {section: [] for section in self.sections}
+        for node in nodes:
+            by_section[self._sections[node]].append(node)
+
+        # order the groups breadth-first so associated groups stay adjacent when split
+        groups = by_section['group']
+        if len(groups) > 1:
+            ordered, seen = [], set()
+            for start in groups:
+                if start in seen:
+                    continue
+                seen.add(start)
+                queue = deque([start])
+                while queue:
+                    node = queue.popleft()
+                    ordered.append(node)
+                    for ref in self._refs[node]:
+                        other = self._index.get(ref)
+                        if other is not None and other not in seen:
+                            seen.add(other)
+                            queue.append(other)
+            by_section['group'] = ordered
+
+        return [node for section in self.sections for node in by_section[section]]
+
+    def plan(self) -> BatchChunkPlan:
+        """Return the planned chunks and the partition quality report."""
+        components = self._components()
+        sizes = self._sizes
+
+        # first-fit decreasing: place the largest components first
+        components.sort(key=len, reverse=True)
+        bins: list[list[int]] = []  # node lists
+        bin_counts: list[int] = []
+        bin_sizes: list[int] = []
+        open_bins: list[int] = []  # bins with remaining capacity
+        split_components = 0
+
+        def new_bin() -> int:
+            bins.append([])
+            bin_counts.append(0)
+            bin_sizes.append(0)
+            open_bins.append(len(bins) - 1)
+            return len(bins) - 1
+
+        for component in components:
+            count = len(component)
+            size = sum(sizes[node] for node in component)
+            if count > self.max_chunk or size > self.max_size:
+                # split the component across new chunks
+                split_components += 1
+                target = new_bin()
+                for node in self._order(component):
+                    if (
+                        bin_counts[target] + 1 > self.max_chunk
+                        or bin_sizes[target] + sizes[node] > self.max_size
+                    ) and bin_counts[target] > 0:
+                        target = new_bin()
+                    bins[target].append(node)
+                    bin_counts[target] += 1
+                    bin_sizes[target] += sizes[node]
+            else:
+                target = None
+                for bin_ in open_bins:
+                    if (
+                        bin_counts[bin_] + count <= self.max_chunk
+                        and bin_sizes[bin_] + size <= self.max_size
+                    ):
+                        target = bin_
+                        break
+                if target is None:
+                    target = new_bin()
+                bins[target].extend(self._order(component))
+                bin_counts[target] += count
+                bin_sizes[target] += size
+
+            # stop considering bins that are full
+            open_bins = [b for b in open_bins if bin_counts[b] < self.max_chunk]
+
+        # build the chunks, ordered by section
+        chunk_of: list[int] = [0] * len(self._keys)
+        chunks: list[list[tuple[str, Any]]] = []
+        for chunk_index, nodes in enumerate(bins):
+            for node in nodes:
+                chunk_of[node] = chunk_index
+            ordered = sorted(nodes, key=lambda n: self.sections.index(self._sections[n]))
+            chunks.append([(self._sections[node], self._keys[node]) for node in ordered])
+
+        # partition quality
+        refs_total = refs_cross = refs_forward = 0
+        for node, refs in enumerate(self._refs):
+            for ref in refs:
+                other = self._index.get(ref)
+                if other is None:
+                    continue
+                refs_total += 1
+                if chunk_of[other] != chunk_of[node]:
+                    refs_cross += 1
+                    if chunk_of[other] > chunk_of[node]:
+                        refs_forward += 1
+
+        report = {
+            'chunks': len(chunks),
+            'components': len(components),
+            'components_split': split_components,
+            'entities': len(self._keys),
+            'fill_ratio': (
+                round(len(self._keys) / (len(chunks) * self.max_chunk), 3) if chunks else 0.0
+            ),
+            'max_chunk_bytes': max(bin_sizes, default=0),
+            'refs_cross_chunk': refs_cross,
+            'refs_forward': refs_forward,
+            'refs_total': refs_total,
+        }
+        return BatchChunkPlan(chunks, report)
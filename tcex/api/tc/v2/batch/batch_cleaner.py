@@ -21,6 +21,11 @@ class BatchCleaner:
     """Batch content cleaning configuration and logic.
 
     All flags default to False. Enable the desired cleaning steps before calling clean().
+
+    The cleaner can also be used incrementally (see BatchWriter.incremental_cleaner). In that
+    mode a persistent index of dedup keys (summary, file hash, filename, or xid) to the xid of
+    the stored entity is maintained as entities are added, so each duplicate is merged in O(1)
+    into the stored entity, including duplicates that would otherwise land in different chunks.
     """
 
     def __init__(
@@ -60,6 +65,10 @@ class BatchCleaner:
         self.deduplicate_attributes = deduplicate_attributes
         self.truncate_attributes = truncate_attributes
 
+        # persistent dedup key -> xid index used by the incremental cleaner
+        self._index: dict[str, dict[str, str]] = {'group': {}, 'indicator': {}}
+        self._truncated_types: set[str] = set()
+
     def clean(self, content: dict | str) -> dict:
         """Run enabled cleaning steps on content.
 
@@ -145,9 +154,11 @@ class BatchCleaner:
             match_idx = next((seen[k] for k in keys if k in seen), None)
             if match_idx is not None:
                 self.deduplicate(item, result[match_idx])
-                # re-index: merged item may have new keys (e.g. combined file hashes)
-                for k in key_fn(result[match_idx]):
-                    seen[k] = match_idx
+                # re-index: merged File item may have new keys (combined file hashes), the keys
+                # of all other items are not changed by a merge
+                if result[match_idx].get('type') == 'File':
+                    for k in key_fn(result[match_idx]):
+                        seen[k] = match_idx
             else:
                 idx = len(result)
                 for k in keys:
@@ -202,6 +213,22 @@ class BatchCleaner:
         xid = item.get('xid')
         return {xid} if xid else set()
 
+    def _index_keys(self, item: dict, section: str) -> set[str]:
+        """Return the dedup keys for a group or indicator based on the enabled flags.
+
+        Args:
+            item: A group or indicator dictionary.
+            section: The section of the item (group or indicator).
+
+        Returns:
+            A set of key strings for dedup lookup.
+        """
+        if section == 'group':
+            return self._group_keys(item) if self.deduplicate_groups else set()
+        if not self.deduplicate_indicators and not self.combine_on_filename:
+            return set()
+        return self._indicator_keys(item)
+
     def _normalize_tags(self, tags: list) -> None:
         """Convert tag names to formatted MITRE/NAICS format where applicable.
 
@@ -322,6 +349,74 @@ class BatchCleaner:
         item['attribute'] = cleaned_attrs
         return item
 
+    def index_add(self, item: dict, section: str, xid: str) -> None:
+        """Add the dedup keys of an item to the incremental index.
+
+        Args:
+            item: A group or indicator dictionary.
+            section: The section of the item (group or indicator).
+            xid: The xid of the stored entity the keys should resolve to.
+        """
+        index = self._index[section]
+        for key in self._index_keys(item, section):
+            index[key] = xid
+
+    def index_clear(self) -> None:
+        """Clear the incremental index."""
+        for index in self._index.values():
+            index.clear()
+
+    def index_match(self, item: dict, section: str) -> str | None:
+        """Return the xid of a previously added duplicate of the item, if any.
+
+        Args:
+            item: A group or indicator dictionary.
+            section: The section of the item (group or indicator).
+
+        Returns:
+            The xid of the duplicate or None if the item is not a duplicate.
+        """
+        index = self._index[section]
+        return next((index[k] for k in self._index_keys(item, section) if k in index), None)
+
+    def merge(self, incoming: dict, existing: dict, section: str) -> dict:
+        """Merge an incoming duplicate into the stored entity and update the index.
+
+        Attributes are cleaned immediately (if enabled) so stored entities stay bounded.
+
+        Args:
+            incoming: The new item.
+            existing: The stored item to merge into.
+            section: The section of the item (group or indicator).
+
+        Returns:
+            The merged item (same reference as existing).
+        """
+        self.deduplicate(incoming, existing)
+        if existing.get('type') == 'File':
+            # merged File item may have new keys (combined file hashes)
+            self.index_add(existing, section, existing['xid'])
+        if self.deduplicate_attributes or self.truncate_attributes:
+            self.clean_attributes(
+                existing,
+                self.attribute_types,
+                deduplicate=self.deduplicate_attributes,
+                truncate=self.truncate_attributes,
+                truncated_types=self._truncated_types,
+            )
+        return existing
+
+    @staticmethod
+    def _list_item_key(item: dict) -> tuple | frozenset:
+        """Return a hashable key for a list field item (e.g. tag or security label).
+
+        Single key items (e.g. {'name': 'tag'}) use the key/value tuple, which avoids
+        building a frozenset for the most common case.
+        """
+        if len(item) == 1:
+            return next(iter(item.items()))
+        return frozenset(item.items())
+
     @staticmethod
     def merge_list_field(existing: dict, incoming: dict, field: str) -> None:
         """Merge a list-of-dicts field from incoming into existing, removing duplicates.
@@ -336,9 +431,10 @@ class BatchCleaner:
             return
 
         existing_items = existing.setdefault(field, [])
-        seen = {frozenset(item.items()) for item in existing_items}
+        item_key = BatchCleaner._list_item_key
+        seen = {item_key(item) for item in existing_items}
         for item in incoming_items:
-            key = frozenset(item.items())
+            key = item_key(item)
             if key not in seen:
                 seen.add(key)
                 existing_items.append(item)
@@ -0,0 +1,236 @@
+"""TcEx Framework Module"""
+
+# standard library
+import threading
+
+
+class BatchPollEstimator:
+    """Estimate the time until the next batch status check.
+
+    The estimate is driven by the progress reported by the server in batchStatus. The processed
+    count (successCount + errorCount) is sampled on each status check and the processing rate is
+    used with the unprocessCount to estimate the time to completion. When no progress has been
+    reported yet, the throughput learned from previous jobs is used, and when that is not
+    available the classic linear back off is used.
+
+    Args:
+        count: The number of entities in the batch job, if known.
+        throughput: The throughput (entities per second) learned from previous jobs, if known.
+        interval_min: The minimum number of seconds between status checks.
+        interval_max: The maximum number of seconds between status checks.
+        retry_seconds: The base number of seconds for the back off when there is no progress.
+        back_off: The back off multiplier applied for each status check without progress.
+        start: The (monotonic) time the batch job was submitted, used as the first progress
+            sample so the rate can be measured on the first status check.
+    """
+
+    __slots__ = [
+        '_back_off',
+        '_checks',
+        '_count',
+        '_interval_max',
+        '_interval_min',
+        '_last_interval',
+        '_processed',
+        '_rate',
+        '_retry_seconds',
+        '_sample_time',
+        '_throughput',
+        '_unprocessed',
+    ]
+
+    def __init__(
+        self,
+        count: int | None = None,
+        throughput: float | None = None,
+        interval_min: float = 1.0,
+        interval_max: float = 20.0,
+        retry_seconds: float = 5.0,
+        back_off: float = 2.5,
+        start: float | None = None,
+    ):
+        """Initialize instance properties."""
+        self._back_off = back_off
+        self._checks = 0
+        self._count = count
+        self._interval_max = interval_max
+        self._interval_min = interval_min
+        self._last_interval = 0.0
+        self._processed: int | None = None if start is None else 0
+        self._rate: float | None = None
+        self._retry_seconds = retry_seconds
+        self._sample_time: float | None = start
+        self._throughput = throughput
+        self._unprocessed: int | None = None
+
+    def _clamp(self, interval: float) -> float:
+        """Return the interval limited to the min/max interval."""
+        return max(self._interval_min, min(interval, self._interval_max))
+
+    def first_interval(
+        self, first_check: float | None = None, early_check: float | None = None
+    ) -> float:
+        """Return the number of seconds to wait before the first status check.
+
+        Args:
+            first_check: When provided, the first check happens after this many seconds
+                (early first check), regardless of the estimate.
+            early_check: When provided, the first check happens after this many seconds,
+                unless the job is estimated to take longer from the learned throughput.
+        """
+        estimate = self._count / self._throughput if self._count and self._throughput else None
+        if first_check is not None:
+            interval = max(0.0, float(first_check))
+        elif early_check is not None and (
+            estimate is None or estimate <= max(early_check, self._interval_min)
+        ):
+            interval = max(0.0, float(early_check))
+        elif estimate is not None:
+            interval = self._clamp(estimate)
+        else:
+            interval = self._clamp(self._retry_seconds)
+        self._last_interval = interval
+        return interval
+
+    def job_count(self, batch_status: dict) -> int | None:
+        """Return the number of entities in the batch job.
+
+        Args:
+            batch_status: The batchStatus dict returned from the ThreatConnect API.
+        """
+        total = sum(
+            int(batch_status.get(key) or 0)
+            for key in ('errorCount', 'successCount', 'unprocessCount')
+        )
+        return total or self._count
+
+    def next_interval(self) -> float:
+        """Return the number of seconds to wait before the next status check."""
+        remaining = self.remaining_time
+        if remaining is not None:
+            interval = self._clamp(remaining)
+        else:
+            # no progress information available, use the linear back off
+            interval = self._clamp(self._retry_seconds + self._checks * self._back_off)
+        self._last_interval = interval
+        return interval
+
+    @property
+    def rate(self) -> float | None:
+        """Return the processing rate (entities per second) measured from the server progress."""
+        return self._rate
+
+    @property
+    def remaining_time(self) -> float | None:
+        """Return the estimated number of seconds until the batch job completes."""
+        if self._unprocessed is None:
+            return None
+        rate = self._rate or self._throughput
+        if not rate:
+            return None
+        return self._unprocessed / rate
+
+    def update(self, batch_status: dict, now: float):
+        """Record the progress reported in a batch status response.
+
+        Args:
+            batch_status: The batchStatus dict returned from the ThreatConnect API.
+            now: The current (monotonic) time.
+        """
+        self._checks += 1
+        processed = int(batch_status.get('successCount') or 0) + int(
+            batch_status.get('errorCount') or 0
+        )
+        unprocessed = batch_status.get('unprocessCount')
+
+        if self._processed is not None and self._sample_time is not None:
+            elapsed = now - self._sample_time
+            if elapsed > 0 and processed > self._processed:
+                self._rate = (processed - self._processed) / elapsed
+
+        self._processed = processed
+        self._sample_time = now
+        self._unprocessed = None if unprocessed is None else int(unprocessed)
+
+    def wasted_time(self, now: float) -> float:
+        """Return the estimated time slept after the batch job completed.
+
+        When the completion time can be estimated from the previous sample, the time between the
+        estimated completion and now is returned. Otherwise half of the last interval is used.
+
+        Args:
+            now: The (monotonic) time the completed status was received.
+        """
+        remaining = self.remaining_time
+        if remaining is not None and self._sample_time is not None:
+            wasted = now - (self._sample_time + remaining)
+        else:
+            wasted = self._last_interval / 2
+        return max(0.0, min(wasted, self._last_interval))
+
+
+class BatchPollStats:
+    """Batch poll statistics used to tune the poll intervals (thread safe).
+
+    Attributes:
+        calls: The number of status checks sent to the API.
+        jobs: The number of batch jobs that completed.
+        sleep_time: The total number of seconds slept waiting on batch jobs.
+        throughput: The smoothed throughput (entities per second) of completed batch jobs.
+        wasted_sleep_time: The estimated number of seconds slept after batch jobs completed.
+    """
+
+    __slots__ = ['_lock', 'calls', 'jobs', 'sleep_time', 'throughput', 'wasted_sleep_time']
+
+    # weight of the most recent job when smoothing the throughput
+    smoothing = 0.3
+
+    def __init__(self):
+        """Initialize instance properties."""
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.jobs = 0
+        self.sleep_time = 0.0
+        self.throughput: float | None = None
+        self.wasted_sleep_time = 0.0
+
+    def as_dict(self) -> dict:
+        """Return the poll statistics as a dict."""
+        with self._lock:
+            return {
+                'calls': self.calls,
+                'jobs': self.jobs,
+                'sleep_time': round(self.sleep_time, 3),
+                'throughput': None if self.throughput is None else round(self.throughput, 3),
+                'wasted_sleep_time': round(self.wasted_sleep_time, 3),
+            }
+
+    def record_job(self, count: int | None, elapsed: float, wasted: float):
+        """Record a completed batch job.
+
+        Args:
+            count: The number of entities in the batch job, if known.
+            elapsed: The number of seconds between submit and completion.
+            wasted: The estimated number of seconds slept after completion.
+        """
+        with self._lock:
+            self.jobs += 1
+            self.wasted_sleep_time += wasted
+            if count and elapsed > 0:
+                throughput = count / max(elapsed - wasted, 1e-3)
+                if self.throughput is None:
+                    self.throughput = throughput
+                else:
+                    self.throughput = (
+                        self.smoothing * throughput + (1 - self.smoothing) * self.throughput
+                    )
+
+    def record_poll(self, slept: float):
+        """Record a single status check.
+
+        Args:
+            slept: The number of seconds slept before the status check.
+        """
+        with self._lock:
+            self.calls += 1
+            self.sleep_time += slept
@@ -0,0 +1,176 @@
+"""TcEx Framework Module"""
+
+# standard library
+import pickle  # nosec
+import sqlite3
+from collections.abc import Iterator, MutableMapping
+from pathlib import Path
+from typing import Any
+
+
+class BatchSpillStore(MutableMapping):
+    """SQLite backed spill store for batch groups and indicators.
+
+    A drop-in replacement for the shelve files used by BatchWriter. All entities are stored in a
+    single SQLite file (WAL journal) keyed by xid. Writes are batched into a single transaction,
+    entities are returned in insertion order, and entities can be removed in bulk.
+
+    Args:
+        fqfn: The fully qualified filename of the SQLite database.
+        batch_size: The number of writes to buffer before committing.
+    """
+
+    def __init__(self, fqfn: Path | str, batch_size: int = 1_000):
+        """Initialize instance properties."""
+        self.fqfn = Path(fqfn)
+        self.batch_size = batch_size
+
+        # pending writes, buffered until the next flush
+        self._pending: dict[str, bytes] = {}
+        self._uncommitted = 0
+
+        self._conn = sqlite3.connect(str(self.fqfn), check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS store ('
+            'seq INTEGER PRIMARY KEY AUTOINCREMENT, '
+            'xid TEXT UNIQUE NOT NULL, '
+            'value BLOB NOT NULL)'
+        )
+        self._conn.commit()
+
+    def _commit(self, count: int = 1):
+        """Commit the open transaction once enough writes have accumulated."""
+        self._uncommitted += count
+        if self._uncommitted >= self.batch_size:
+            self._conn.commit()
+            self._uncommitted = 0
+
+    def close(self):
+        """Flush any pending writes and close the database."""
+        if self._conn is None:
+            return
+        self.flush()
+        self._conn.commit()
+        self._conn.close()
+        self._conn = None
+
+    def compact(self):
+        """Reclaim the space of deleted entities."""
+        self.flush()
+        self._conn.commit()
+        self._conn.execute('VACUUM')
+
+    def delete_many(self, xids: list[str]):
+        """Remove multiple entities from the store.
+
+        Args:
+            xids: The xids of the entities to remove. Missing xids are ignored.
+        """
+        # a pending write may replace a committed row, so the row is always deleted too
+        for xid in xids:
+            self._pending.pop(xid, None)
+        if xids:
+            self._conn.executemany('DELETE FROM store WHERE xid = ?', [(x,) for x in xids])
+            self._commit(len(xids))
+
+    def flush(self):
+        """Write any pending entities to the database."""
+        if not self._pending:
+            return
+        self._conn.executemany(
+            'INSERT INTO store (xid, value) VALUES (?, ?) '
+            'ON CONFLICT(xid) DO UPDATE SET value = excluded.value',
+            list(self._pending.items()),
+        )
+        self._commit(len(self._pending))
+        self._pending.clear()
+
+    def popitems(self) -> Iterator[tuple[str, Any]]:
+        """Yield and remove entities in insertion order.
+
+        Entities are removed in bulk as each page is consumed. If the consumer stops early, only
+        the entities that have been yielded are removed.
+        """
+        self.flush()
+        last_seq = 0
+        while True:
+            rows = self._conn.execute(
+                'SELECT seq, xid, value FROM store WHERE seq > ? ORDER BY seq LIMIT ?',
+                (last_seq, self.batch_size),
+            ).fetchall()
+            if not rows:
+                return
+
+            yielded = []
+            try:
+                for seq, xid, value in rows:
+                    last_seq = seq
+                    yielded.append(xid)
+                    yield xid, pickle.loads(value)  # nosec
+            finally:
+                self.delete_many(yielded)
+
+    def __contains__(self, xid: object) -> bool:
+        """Return True if the xid is in the store."""
+        if xid in self._pending:
+            return True
+        row = self._conn.execute('SELECT 1 FROM store WHERE xid = ?', (xid,)).fetchone()
+        return row is not None
+
+    def __delitem__(self, xid: str):
+        """Remove an entity from the store."""
+        # a pending write may replace a committed row, so the row is always deleted too
+        pending = self._pending.pop(xid, None)
+        cursor = self._conn.execute('DELETE FROM store WHERE xid = ?', (xid,))
+        if pending is None and cursor.rowcount == 0:
+            raise KeyError(xid)
+        self._commit()
+
+    def __getitem__(self, xid: str) -> Any:
+        """Return an entity from the store."""
+        value = self._pending.get(xid)
+        if value is None:
+            row = self._conn.execute('SELECT value FROM store WHERE xid = ?', (xid,)).fetchone()
+            if row is None:
+                raise KeyError(xid)
+            value = row[0]
+        return pickle.loads(value)  # nosec
+
+    def __iter__(self) -> Iterator[str]:
+        """Yield the xids in insertion order."""
+        self.flush()
+        for (xid,) in self._conn.execute('SELECT xid FROM store ORDER BY seq').fetchall():
+            yield xid
+
+    def __len__(self) -> int:
+        """Return the number of entities in the store."""
+        self.flush()
+        return self._conn.execute('SELECT COUNT(*) FROM store').fetchone()[0]
+
+    def __setitem__(self, xid: str, value: Any):
+        """Add or replace an entity in the store."""
+        self._pending[xid] = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+
+def popitems(container: MutableMapping) -> Iterator[tuple[str, Any]]:
+    """Yield and remove entities from a dict, shelf, or BatchSpillStore in insertion order.
+
+    Args:
+        container: The container holding the groups or indicators.
+    """
+    if isinstance(container, BatchSpillStore):
+        yield from container.popitems()
+        return
+
+    # convert keys to a list to prevent dictionary change error
+    for xid in list(container.keys()):
+        value = container.get(xid)
+        if value is None:
+            # entity was already removed (e.g., by following a group association)
+            continue
+        del container[xid]
+        yield xid, value
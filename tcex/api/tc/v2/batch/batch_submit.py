@@ -4,7 +4,6 @@
 import gzip
 import json
 import logging
-import math
 import re
 import time
 
@@ -13,6 +12,7 @@ from requests import Session
 
 # first-party
 from tcex.api.tc.v2.batch.batch_cleaner import BatchCleaner
+from tcex.api.tc.v2.batch.batch_poll import BatchPollEstimator, BatchPollStats
 from tcex.api.tc.v3.tags.tag import Tags
 from tcex.api.tc.v3.tql.tql_operator import TqlOperator
 from tcex.exit.error_code import handle_error
@@ -72,8 +72,9 @@ class BatchSubmit:
 
         # default properties
         self._batch_data_count = None
-        self._poll_interval = None
-        self._poll_interval_times = []
+        self._poll_first_check = 1.0  # seconds before the first status check
+        self._poll_interval_max = 20.0  # max seconds between status checks
+        self._poll_stats = BatchPollStats()
         self._poll_timeout = 3600
 
     @property
@@ -356,6 +357,8 @@ class BatchSubmit:
         back_off: float | None = None,
         timeout: int | None = None,
         halt_on_error: bool = True,
+        count: int | None = None,
+        first_check: float | None = None,
     ) -> dict:
         """Poll Batch status to ThreatConnect API.
 
@@ -374,6 +377,13 @@ class BatchSubmit:
                 }
             }
 
+        The first status check is sent early (see poll_first_check) so small jobs are returned
+        quickly, unless the job is estimated to take longer from the count and the throughput
+        learned from previous jobs. The following intervals are estimated from the progress
+        reported by the server (successCount/errorCount/unprocessCount), falling back to the
+        throughput of previous jobs and then to the retry_seconds/back_off heuristic. See
+        poll_stats for the results.
+
         Args:
             batch_id: The ID returned from the ThreatConnect API for the current batch job.
             retry_seconds: The base number of seconds used for retries when job is not completed.
@@ -381,6 +391,9 @@ class BatchSubmit:
                 each poll attempt when job has not completed.
             timeout: The number of seconds before the poll should timeout.
             halt_on_error: If True any exception will raise an error.
+            count: The number of entities in the batch job, used to estimate the completion time.
+            first_check: The number of seconds before the first status check, defaults to
+                poll_first_check or the estimate from the learned throughput.
 
         Returns:
             dict: The batch status returned from the ThreatConnect API.
@@ -389,33 +402,27 @@ class BatchSubmit:
         if self.halt_on_poll_error is not None:
             halt_on_error = self.halt_on_poll_error
 
-        # initial poll interval
-        if self._poll_interval is None and self._batch_data_count is not None:
-            # calculate poll_interval base off the number of entries in the batch data
-            # with a minimum value of 5 seconds.
-            self._poll_interval = max(math.ceil(self._batch_data_count / 300), 5)
-        elif self._poll_interval is None:
-            # if not able to calculate poll_interval default to 15 seconds
-            self._poll_interval = 15
-
-        # poll retry back_off factor
-        poll_interval_back_off = float(2.5 if back_off is None else back_off)
-
-        # poll retry seconds
-        poll_retry_seconds = int(5 if retry_seconds is None else retry_seconds)
+        poll_start = time.monotonic()
+        estimator = BatchPollEstimator(
+            count=self._batch_data_count if count is None else count,
+            throughput=self._poll_stats.throughput,
+            interval_max=self.poll_interval_max,
+            retry_seconds=float(5 if retry_seconds is None else retry_seconds),
+            back_off=float(2.5 if back_off is None else back_off),
+            start=poll_start,
+        )
+        interval = estimator.first_interval(first_check, early_check=self.poll_first_check)
 
         # poll timeout
         timeout = self.poll_timeout if timeout is None else int(timeout)
         params = {'includeAdditional': 'true'}
 
-        poll_count = 0
-        poll_time_total = 0
         data = {}
         while True:
-            poll_count += 1
-            poll_time_total += self._poll_interval
-            time.sleep(self._poll_interval)
-            self.log.info(f'feature=batch, event=progress, poll-time={poll_time_total}')
+            time.sleep(interval)
+            self._poll_stats.record_poll(interval)
+            poll_time_total = time.monotonic() - poll_start
+            self.log.info(f'feature=batch, event=progress, poll-time={poll_time_total:.1f}')
             try:
                 # retrieve job status
                 r = self.session_tc.get(f'/v2/batch/{batch_id}', params=params)
@@ -436,41 +443,58 @@ class BatchSubmit:
             except Exception as e:
                 handle_error(code=540, message_values=[e], raise_error=halt_on_error)
 
-            if data.get('data', {}).get('batchStatus', {}).get('status') == 'Completed':
-                # store last 5 poll times to use in calculating average poll time
-                modifier = poll_time_total * 0.7
-                self._poll_interval_times = [*self._poll_interval_times[-4:], modifier]
-
-                weights: list[float | int] = [1]
-                poll_interval_time_weighted_sum = 0
-                for poll_interval_time in self._poll_interval_times:
-                    poll_interval_time_weighted_sum += poll_interval_time * weights[-1]
-                    # weights will be [1, 1.5, 2.25, 3.375, 5.0625] for all 5 poll times depending
-                    # on how many poll times are available.
-                    weights.append(weights[-1] * 1.5)
-
-                # pop off the last weight so its not added in to the sum
-                weights.pop()
-
-                # calculate the weighted average of the last 5 poll times
-                self._poll_interval = math.floor(poll_interval_time_weighted_sum / sum(weights))
-
-                if poll_count == 1:
-                    # if completed on first poll, reduce poll interval.
-                    self._poll_interval = self._poll_interval * 0.85
-
-                self.log.debug(f'feature=batch, poll-time={poll_time_total}, status={data}')
+            now = time.monotonic()
+            batch_status = data.get('data', {}).get('batchStatus', {})
+            if batch_status.get('status') == 'Completed':
+                wasted = estimator.wasted_time(now)
+                self._poll_stats.record_job(
+                    count=estimator.job_count(batch_status),
+                    elapsed=now - poll_start,
+                    wasted=wasted,
+                )
+                self.log.debug(
+                    f'feature=batch, poll-time={now - poll_start:.1f}, '
+                    f'wasted-time={wasted:.1f}, status={data}'
+                )
                 return data
 
-            # update poll_interval for retry with max poll time of 20 seconds
-            self._poll_interval = min(
-                poll_retry_seconds + int(poll_count * poll_interval_back_off), 20
+            # estimate the time to the next status check from the reported progress
+            estimator.update(batch_status, now)
+            interval = estimator.next_interval()
+            self.log.debug(
+                f'feature=batch, event=poll-estimate, batch-id={batch_id}, '
+                f'rate={estimator.rate}, next-interval={interval:.1f}'
             )
 
             # time out poll to prevent App running indefinitely
             if poll_time_total >= timeout:
                 handle_error(code=550, message_values=[timeout], raise_error=True)
 
+    @property
+    def poll_first_check(self) -> float:
+        """Return the number of seconds before the first status check of a batch job."""
+        return self._poll_first_check
+
+    @poll_first_check.setter
+    def poll_first_check(self, seconds: float):
+        """Set the number of seconds before the first status check of a batch job."""
+        self._poll_first_check = max(0.0, float(seconds))
+
+    @property
+    def poll_interval_max(self) -> float:
+        """Return the max number of seconds between status checks."""
+        return self._poll_interval_max
+
+    @poll_interval_max.setter
+    def poll_interval_max(self, seconds: float):
+        """Set the max number of seconds between status checks."""
+        self._poll_interval_max = max(1.0, float(seconds))
+
+    @property
+    def poll_stats(self) -> BatchPollStats:
+        """Return the poll statistics (calls, sleep time, wasted sleep time, throughput)."""
+        return self._poll_stats
+
     @property
     def poll_timeout(self) -> int:
         """Return current poll timeout value."""
@@ -6,6 +6,7 @@ import gzip
 import hashlib
 import json
 import logging
+import pickle  # nosec
 import re
 import shelve  # nosec
 import sys
@@ -21,6 +22,8 @@ from requests import Session  # TYPE-CHECKING
 # first-party
 from tcex.api.tc.util.threat_intel_util import ThreatIntelUtil
 from tcex.api.tc.v2.batch.association import Association
+from tcex.api.tc.v2.batch.batch_cleaner import BatchCleaner
+from tcex.api.tc.v2.batch.batch_spill_store import BatchSpillStore, popitems
 from tcex.api.tc.v2.batch.group import (
     Adversary,
     AttackPattern,
@@ -124,6 +127,7 @@ class BatchWriter:
         self._batch_max_chunk = 100_000
         self._batch_size = 0  # track current batch size
         self._batch_max_size = 75_000_000  # max size in bytes
+        self._incremental_cleaner: BatchCleaner | None = kwargs.get('incremental_cleaner')
         self.log = _logger
         self.tic = ThreatIntelUtil(self.session_tc)
         self.util = Util()
@@ -131,6 +135,13 @@ class BatchWriter:
         # shelf settings
         self._group_shelf_fqfn = None
         self._indicator_shelf_fqfn = None
+        self._spill_entity_count = 0
+        self._spill_entity_samples = 0
+        self._spill_entity_size = 0.0
+        self._spill_memory_budget = kwargs.get('spill_memory_budget')
+        # the (section, xid) of the in-memory entities in insertion order (memory budget only)
+        self._spill_order: deque[tuple[str, str]] = deque()
+        self._spill_store = kwargs.get('spill_store') or 'shelve'
 
         # containers
         self._groups = None
@@ -235,6 +246,9 @@ class BatchWriter:
             # max size hit, dump TI to disk
             if self._batch_size > self._batch_max_size:
                 self.dump()
+
+            # memory budget hit, spill TI to disk
+            self._spill_check('group', xid, group_data)
         return group_data
 
     def _indicator(
@@ -271,6 +285,9 @@ class BatchWriter:
             # max size hit, dump TI to disk
             if self._batch_size > self._batch_max_size:
                 self.dump()
+
+            # memory budget hit, spill TI to disk
+            self._spill_check('indicator', xid, indicator_data)
         return indicator_data
 
     @staticmethod
@@ -306,6 +323,75 @@ class BatchWriter:
 
         return indicator_list
 
+    def _clean_incremental(self, data: dict, section: str) -> dict | None:
+        """Merge a group/indicator dict into a previously added duplicate.
+
+        The incremental cleaner index maps the dedup keys to the xid of the stored entity. When
+        the stored entity has already been submitted (no longer in memory or shelf), the new
+        entity replaces it in the index.
+
+        Args:
+            data: The group or indicator dict being added.
+            section: The section of the data (group or indicator).
+
+        Returns:
+            The stored entity the data was merged into, or None if the data is not a duplicate.
+        """
+        cleaner: BatchCleaner = self._incremental_cleaner  # type: ignore
+        if section == 'group':
+            memory, shelf = self.groups, self.groups_shelf
+        else:
+            memory, shelf = self.indicators, self.indicators_shelf
+
+        xid = cleaner.index_match(data, section)
+        if xid is not None:
+            existing = memory.get(xid)
+            in_memory = existing is not None
+            if existing is None:
+                existing = shelf.get(xid)
+
+            if isinstance(existing, dict):
+                cleaner.merge(data, existing, section)
+                if not in_memory:
+                    # write back, entities loaded from a shelf are copies
+                    shelf[xid] = existing
+                return existing
+
+        cleaner.index_add(data, section, data['xid'])
+        return None
+
+    def _spill_check(self, section: str, xid: str, entity: dict | GroupType | IndicatorType):
+        """Spill in-memory groups/indicators to disk when the memory budget is exceeded.
+
+        The in-memory size is estimated from the pickled size of a sample of the entities added
+        (the first entity and every 1,000th entity after), which avoids serializing every entity.
+
+        Args:
+            section: The section of the entity (group or indicator).
+            xid: The xid of the entity.
+            entity: The group or indicator that was just stored in memory.
+        """
+        if self._spill_memory_budget is None:
+            return
+
+        self._spill_order.append((section, xid))
+
+        if self._spill_entity_count % 1_000 == 0:
+            # a failed sample (e.g., callable file content) keeps the previous estimate
+            with contextlib.suppress(Exception):
+                size = len(pickle.dumps(entity, protocol=pickle.HIGHEST_PROTOCOL))
+                self._spill_entity_samples += 1
+                self._spill_entity_size += (
+                    size - self._spill_entity_size
+                ) / self._spill_entity_samples
+        self._spill_entity_count += 1
+
+        if self.memory_usage > self._spill_memory_budget:
+            # spill the oldest entities, keeping half of the budget in memory. the entity that was
+            # just added is always kept, as the caller may still update it (e.g., add a tag).
+            keep = max(1, int(self._spill_memory_budget / 2 / max(self._spill_entity_size, 1)))
+            self.spill(len(self.groups) + len(self.indicators) - keep)
+
     def add_group(self, group_data: dict, **kwargs) -> dict | GroupType:
         """Add a group to Batch Job.
 
@@ -338,7 +424,12 @@ class BatchWriter:
         Returns:
             (dict|GroupType): The new group dict/GroupType or the previously stored dict/GroupType.
         """
-        return self._group(group_data, kwargs.get('store', True))
+        store = kwargs.get('store', True)
+        if store and self._incremental_cleaner is not None:
+            existing = self._clean_incremental(group_data, 'group')
+            if existing is not None:
+                return existing
+        return self._group(group_data, store)
 
     def add_indicator(self, indicator_data: dict, **kwargs) -> dict | IndicatorType:
         """Add an indicator to Batch Job.
@@ -408,7 +499,12 @@ class BatchWriter:
             if whois_active is not None:
                 indicator_data['flag2'] = whois_active
 
-        return self._indicator(indicator_data, kwargs.get('store', True))
+        store = kwargs.get('store', True)
+        if store and self._incremental_cleaner is not None:
+            existing = self._clean_incremental(indicator_data, 'indicator')
+            if existing is not None:
+                return existing
+        return self._indicator(indicator_data, store)
 
     def add_association(self, association: Association | dict) -> Association:
         """Add an association to Batch Job."""
@@ -536,19 +632,32 @@ class BatchWriter:
         # cleanup shelf files
         try:
             self.groups_shelf.close()
-            self.group_shelf_fqfn.unlink()
+            self._unlink_shelf(self.group_shelf_fqfn)
         except Exception as ex:
             self.log.warning(f'action=batch-close, filename={self.group_shelf_fqfn} exception={ex}')
 
         # cleanup shelf files
         try:
             self.indicators_shelf.close()
-            self.indicator_shelf_fqfn.unlink()
+            self._unlink_shelf(self.indicator_shelf_fqfn)
         except Exception as ex:
             self.log.warning(
                 f'action=batch-close, filename={self.indicator_shelf_fqfn} exception={ex}'
             )
 
+    def _open_shelf(self, fqfn: Path) -> shelve.Shelf[Any] | BatchSpillStore:
+        """Return a new shelf using the configured spill store backend."""
+        if self._spill_store == 'sqlite':
+            return BatchSpillStore(fqfn)
+        return shelve.open(fqfn, writeback=False)  # nosec  # noqa: SIM115
+
+    def _unlink_shelf(self, fqfn: Path):
+        """Remove a shelf file and any SQLite journal files."""
+        fqfn.unlink()
+        if self._spill_store == 'sqlite':
+            for suffix in ('-shm', '-wal'):
+                fqfn.with_name(f'{fqfn.name}{suffix}').unlink(missing_ok=True)
+
     def course_of_action(self, name: str, **kwargs) -> CourseOfAction:
         """Add Course Of Action Pattern data to Batch object.
 
@@ -667,7 +776,9 @@ class BatchWriter:
 
         return file_data, group_data
 
-    def data_groups(self, data: dict, groups: dict | shelve.Shelf[Any], tracker: dict) -> bool:
+    def data_groups(
+        self, data: dict, groups: dict | shelve.Shelf[Any] | BatchSpillStore, tracker: dict
+    ) -> bool:
         """Process Group data.
 
         Args:
@@ -693,7 +804,7 @@ class BatchWriter:
         return False
 
     def data_indicators(
-        self, data: dict, indicators: dict | shelve.Shelf[Any], tracker: dict
+        self, data: dict, indicators: dict | shelve.Shelf[Any] | BatchSpillStore, tracker: dict
     ) -> bool:
         """Process Indicator data.
 
@@ -706,12 +817,11 @@ class BatchWriter:
             bool: True if max values have been hit, else False.
         """
         # process the indicator
-        for xid, indicator_data in list(indicators.items()):
+        for _, indicator_data in popitems(indicators):
             if not isinstance(indicator_data, dict):
                 data['indicator'].append(indicator_data.data)
             else:
                 data['indicator'].append(indicator_data)
-            del indicators[xid]
 
             # update entity trackers
             tracker['count'] += 1
@@ -924,12 +1034,10 @@ class BatchWriter:
         return self._groups
 
     @property
-    def groups_shelf(self) -> shelve.Shelf[Any]:
+    def groups_shelf(self) -> shelve.Shelf[Any] | BatchSpillStore:
         """Return dictionary of all Groups data."""
         if self._groups_shelf is None:
-            self._groups_shelf = (
-                shelve.open(self.group_shelf_fqfn, writeback=False)  # nosec  # noqa: SIM115
-            )
+            self._groups_shelf = self._open_shelf(self.group_shelf_fqfn)
         return self._groups_shelf
 
     def host(self, hostname: str, **kwargs) -> Host:
@@ -973,6 +1081,27 @@ class BatchWriter:
         group_obj = Incident(name, **kwargs)
         return self._group(group_obj, kwargs.get('store', True))  # type: ignore
 
+    @property
+    def incremental_cleaner(self) -> BatchCleaner | None:
+        """Return the cleaner used to deduplicate groups/indicators as they are added."""
+        return self._incremental_cleaner
+
+    @incremental_cleaner.setter
+    def incremental_cleaner(self, cleaner: BatchCleaner | None):
+        """Set the cleaner used to deduplicate groups/indicators as they are added.
+
+        When set, dicts added with add_group/add_indicator are merged into a previously added
+        duplicate (according to the cleaner flags) before being stored, so duplicates are
+        collapsed across the entire batch job instead of within a single chunk.
+
+        Example::
+
+            batch.incremental_cleaner = batch.cleaner(
+                deduplicate_indicators=True
+            )
+        """
+        self._incremental_cleaner = cleaner
+
     def indicator(self, indicator_type: str, summary: str, **kwargs) -> IndicatorType:
         """Add Indicator data to Batch.
 
@@ -1017,12 +1146,10 @@ class BatchWriter:
         return self._indicators
 
     @property
-    def indicators_shelf(self) -> shelve.Shelf[Any]:
+    def indicators_shelf(self) -> shelve.Shelf[Any] | BatchSpillStore:
         """Return dictionary of all Indicator data."""
         if self._indicators_shelf is None:
-            self._indicators_shelf = shelve.open(  # nosec  # noqa: SIM115
-                self.indicator_shelf_fqfn, writeback=False
-            )
+            self._indicators_shelf = self._open_shelf(self.indicator_shelf_fqfn)
         return self._indicators_shelf
 
     def intrusion_set(self, name: str, **kwargs) -> IntrusionSet:
@@ -1059,6 +1186,27 @@ class BatchWriter:
         group_obj = Malware(name, **kwargs)
         return self._group(group_obj, kwargs.get('store', True))  # type: ignore
 
+    @property
+    def memory_usage(self) -> int:
+        """Return the estimated size in bytes of the groups and indicators held in memory."""
+        return int((len(self.groups) + len(self.indicators)) * self._spill_entity_size)
+
+    @property
+    def memory_budget(self) -> int | None:
+        """Return the memory budget in bytes before groups/indicators are spilled to disk."""
+        return self._spill_memory_budget
+
+    @memory_budget.setter
+    def memory_budget(self, value: int | None):
+        """Set the memory budget in bytes before groups/indicators are spilled to disk.
+
+        .. note:: Spilled entities are stored as a copy. Any changes made to a GroupType or
+            IndicatorType after it has been spilled will not be included in the batch job. The
+            oldest entities are spilled first and the entity that was just added is never
+            spilled.
+        """
+        self._spill_memory_budget = value
+
     def mutex(self, mutex: str, **kwargs) -> Mutex:
         """Add Mutex data to Batch.
 
@@ -1201,6 +1349,73 @@ class BatchWriter:
         group_obj = Signature(name, file_name, file_type, file_text, **kwargs)
         return self._group(group_obj, kwargs.get('store', True))  # type: ignore
 
+    def spill(self, count: int | None = None):
+        """Move the oldest in-memory groups/indicators to the shelf.
+
+        When a memory budget is set, the entities are spilled in insertion order across groups
+        and indicators, otherwise indicators are spilled before groups. Any entity that can not
+        be saved (e.g., a Document with callable file content) is kept in memory.
+
+        Args:
+            count: The max number of entities to spill. Defaults to all entities.
+        """
+        containers = {
+            'group': (self.groups, self.groups_shelf),
+            'indicator': (self.indicators, self.indicators_shelf),
+        }
+        remaining = len(self.groups) + len(self.indicators) if count is None else count
+
+        # entities added before the memory budget was set are not tracked in the spill order
+        order = list(self._spill_order)
+        tracked = set(order)
+        order.extend(
+            (section, xid)
+            for section in ('indicator', 'group')
+            for xid in containers[section][0]
+            if (section, xid) not in tracked
+        )
+
+        spilled = 0
+        for section, xid in order:
+            if remaining <= 0:
+                break
+            container, shelf = containers[section]
+            if xid not in container:
+                # entity was already removed (e.g., submitted or spilled)
+                continue
+            remaining -= 1
+            try:
+                shelf[xid] = container[xid]
+            except Exception:
+                continue
+            del container[xid]
+            spilled += 1
+
+        # drop the spilled and removed entities from the spill order
+        self._spill_order = deque(
+            (section, xid) for section, xid in self._spill_order if xid in containers[section][0]
+        )
+        self.log.debug(f'feature=batch, event=spill, count={spilled:,}')
+
+    @property
+    def spill_store(self) -> str:
+        """Return the spill store backend (shelve or sqlite)."""
+        return self._spill_store
+
+    @spill_store.setter
+    def spill_store(self, value: str):
+        """Set the spill store backend (shelve or sqlite).
+
+        The backend must be set before any group or indicator is saved to disk.
+        """
+        if value not in ('shelve', 'sqlite'):
+            ex_msg = f'Invalid spill store "{value}", valid values are shelve and sqlite.'
+            raise ValueError(ex_msg)
+        if self._groups_shelf is not None or self._indicators_shelf is not None:
+            ex_msg = 'The spill store can not be changed after the shelf has been opened.'
+            raise RuntimeError(ex_msg)
+        self._spill_store = value
+
     def tactic(self, name: str, **kwargs) -> Tactic:
         """Add Tactic data to Batch object.
 
@@ -2,9 +2,11 @@
 
 # standard library
 import json
+import sys
 import uuid
-from collections.abc import Callable
-from typing import Any
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any, ClassVar
 
 # first-party
 from tcex.api.tc.v2.batch.attribute import Attribute
@@ -14,24 +16,60 @@ from tcex.util import Util
 
 
 class Group:
-    """ThreatConnect Batch Group Object"""
+    """ThreatConnect Batch Group Object
+
+    To keep the memory footprint of large batch jobs low, all groups share a single Util
+    instance and metadata map, and the attribute, label, and tag lists are only created when
+    the first item is added.
+    """
 
     __slots__ = [
         '_attributes',
         '_file_content',
         '_group_data',
         '_labels',
-        '_name',
         '_processed',
         '_tags',
-        '_type',
         'file_content',
         'malware',
         'password',
         'status',
-        'util',
     ]
 
+    # fields that are converted to a datetime string
+    _datetime_fields: ClassVar[frozenset[str]] = frozenset(
+        {
+            'dateAdded',
+            'eventDate',
+            'firstSeen',
+            'lastSeen',
+            'externalDateCreated',
+            'externalDateExpires',
+            'externalLastModified',
+            'publishDate',
+        }
+    )
+
+    # metadata map for Group objects
+    _metadata_map: ClassVar[dict[str, str]] = {
+        'date_added': 'dateAdded',
+        'event_date': 'eventDate',
+        'file_name': 'fileName',
+        'file_text': 'fileText',
+        'file_type': 'fileType',
+        'first_seen': 'firstSeen',
+        'last_seen': 'lastSeen',
+        'external_date_created': 'externalDateCreated',
+        'external_date_expires': 'externalDateExpires',
+        'external_last_modified': 'externalLastModified',
+        'from_addr': 'from',
+        'publish_date': 'publishDate',
+        'to_addr': 'to',
+    }
+
+    # shared utility instance
+    util: ClassVar[Util] = Util()
+
     def __init__(self, group_type: str, name: str, **kwargs):
         """Initialize instance properties.
 
@@ -43,17 +81,17 @@ class Group:
         Keyword Args:
             xid (str, kwargs): The external id for this Group.
         """
-        self._name = name
-        self._group_data: dict[str, bool | int | list | str] = {'name': name, 'type': group_type}
-        self._type = group_type
+        self._group_data: dict[str, bool | int | list | str] = {
+            'name': name,
+            'type': sys.intern(group_type),
+        }
 
-        # properties
-        self._attributes = []
-        self._labels = []
+        # properties (lists are created on first use)
+        self._attributes: list[Attribute] | None = None
+        self._labels: list[SecurityLabel] | None = None
         self._file_content = None
-        self._tags = []
+        self._tags: list[Tag] | None = None
         self._processed = False
-        self.util = Util()
 
         # process all kwargs and update metadata field names
         for arg, value in kwargs.items():
@@ -62,26 +100,11 @@ class Group:
         if kwargs.get('xid') is None:
             self._group_data['xid'] = str(uuid.uuid4())
 
-    @property
-    def _metadata_map(self) -> dict:
-        """Return metadata map for Group objects."""
-        return {
-            'date_added': 'dateAdded',
-            'event_date': 'eventDate',
-            'file_name': 'fileName',
-            'file_text': 'fileText',
-            'file_type': 'fileType',
-            'first_seen': 'firstSeen',
-            'last_seen': 'lastSeen',
-            'external_date_created': 'externalDateCreated',
-            'external_date_expires': 'externalDateExpires',
-            'external_last_modified': 'externalLastModified',
-            'from_addr': 'from',
-            'publish_date': 'publishDate',
-            'to_addr': 'to',
-        }
-
-    def add_file(self, filename: str, file_content: bytes | Callable[[str], Any] | str):
+    def add_file(
+        self,
+        filename: str,
+        file_content: bytes | Callable[[str], Any] | Iterable[bytes] | Path | str,
+    ):
         """Add a file for Document and Report types.
 
         Example::
@@ -91,7 +114,8 @@ class Group:
 
         Args:
             filename: The name of the file.
-            file_content: The contents of the file or callback to get contents.
+            file_content: The contents of the file, a Path or iterable of bytes to stream the
+                contents from, or callback to get contents.
         """
         self._group_data['fileName'] = filename
         self._file_content = file_content
@@ -111,16 +135,7 @@ class Group:
             value: The field value to add to the JSON batch data.
         """
         key = self._metadata_map.get(key, key)
-        if key in {
-            'dateAdded',
-            'eventDate',
-            'firstSeen',
-            'lastSeen',
-            'externalDateCreated',
-            'externalDateExpires',
-            'externalLastModified',
-            'publishDate',
-        }:
+        if key in self._datetime_fields:
             if value is not None:
                 self._group_data[key] = self.util.any_to_datetime(value).strftime(
                     '%Y-%m-%dT%H:%M:%SZ'
@@ -168,6 +183,9 @@ class Group:
             Attribute: An instance of the Attribute class.
         """
         attr = Attribute(attr_type, attr_value, displayed, source, formatter)
+        if self._attributes is None:
+            self._attributes = []
+
         if unique == 'Type':
             for attribute_data in self._attributes:
                 if attribute_data.type == attr_type:
@@ -326,6 +344,8 @@ class Group:
             SecurityLabel: An instance of the SecurityLabel class.
         """
         label = SecurityLabel(name, description, color)
+        if self._labels is None:
+            self._labels = []
         for label_data in self._labels:
             if label_data.name == name:
                 label = label_data
@@ -345,6 +365,8 @@ class Group:
             Tag: An instance of the Tag class.
         """
         tag = Tag(name, formatter)
+        if self._tags is None:
+            self._tags = []
         for tag_data in self._tags:
             if tag_data.name == name:
                 tag = tag_data
@@ -2,9 +2,10 @@
 
 # standard library
 import json
+import sys
 import uuid
 from collections.abc import Callable
-from typing import ForwardRef
+from typing import ClassVar, ForwardRef
 
 # first-party
 from tcex.api.tc.v2.batch.attribute import Attribute
@@ -49,7 +50,12 @@ def custom_indicator_class_factory(indicator_type, base_class, class_dict, value
 
 
 class Indicator:
-    """ThreatConnect Batch Indicator Object"""
+    """ThreatConnect Batch Indicator Object
+
+    To keep the memory footprint of large batch jobs low, all indicators share a single Util
+    instance and metadata map, and the attribute, file action, file occurrence, label, and tag
+    lists are only created when the first item is added.
+    """
 
     __slots__ = [
         '_attributes',
@@ -57,12 +63,37 @@ class Indicator:
         '_indicator_data',
         '_labels',
         '_occurrences',
-        '_summary',
         '_tags',
-        '_type',
-        'util',
     ]
 
+    # fields that are converted to a datetime string
+    _datetime_fields: ClassVar[frozenset[str]] = frozenset(
+        {
+            'dateAdded',
+            'lastModified',
+            'firstSeen',
+            'lastSeen',
+            'externalDateCreated',
+            'externalDateExpires',
+            'externalLastModified',
+        }
+    )
+
+    # metadata map for Indicator objects
+    _metadata_map: ClassVar[dict[str, str]] = {
+        'date_added': 'dateAdded',
+        'dnsActive': 'flag1',
+        'dns_active': 'flag1',
+        'last_modified': 'lastModified',
+        'private_flag': 'privateFlag',
+        'size': 'intValue1',
+        'whoisActive': 'flag2',
+        'whois_active': 'flag2',
+    }
+
+    # shared utility instance
+    util: ClassVar[Util] = Util()
+
     def __init__(self, indicator_type: str, summary: str, **kwargs):
         """Initialize instance properties.
 
@@ -80,20 +111,17 @@ class Indicator:
             rating (str, kwargs): The threat rating for this Indicator.
             xid (str, kwargs): The external id for this Indicator.
         """
-        self._summary = summary
-        self._type = indicator_type
         self._indicator_data: dict[str, bool | dict | float | int | list | str] = {
             'summary': summary,
-            'type': indicator_type,
+            'type': sys.intern(indicator_type),
         }
 
-        # properties
-        self._attributes = []
-        self._file_actions = []
-        self._labels = []
-        self._occurrences = []
-        self._tags = []
-        self.util = Util()
+        # properties (created on first use)
+        self._attributes: list[Attribute] | None = None
+        self._file_actions: list[FileAction] | None = None
+        self._labels: list[SecurityLabel] | None = None
+        self._occurrences: list[FileOccurrence] | None = None
+        self._tags: list[Tag] | None = None
 
         # process all kwargs and update metadata field names
         for arg, value in kwargs.items():
@@ -102,20 +130,6 @@ class Indicator:
         if kwargs.get('xid') is None:
             self._indicator_data['xid'] = str(uuid.uuid4())
 
-    @property
-    def _metadata_map(self) -> dict:
-        """Return metadata map for Indicator objects."""
-        return {
-            'date_added': 'dateAdded',
-            'dnsActive': 'flag1',
-            'dns_active': 'flag1',
-            'last_modified': 'lastModified',
-            'private_flag': 'privateFlag',
-            'size': 'intValue1',
-            'whoisActive': 'flag2',
-            'whois_active': 'flag2',
-        }
-
     def add_key_value(self, key: str, value: str):
         """Add custom field to Indicator object.
 
@@ -134,15 +148,7 @@ class Indicator:
         """
         key = self._metadata_map.get(key, key)
 
-        if key in {
-            'dateAdded',
-            'lastModified',
-            'firstSeen',
-            'lastSeen',
-            'externalDateCreated',
-            'externalDateExpires',
-            'externalLastModified',
-        }:
+        if key in self._datetime_fields:
             self._indicator_data[key] = self.util.any_to_datetime(value).strftime(
                 '%Y-%m-%dT%H:%M:%SZ'
             )
@@ -201,6 +207,9 @@ class Indicator:
             Attribute: An instance of the Attribute class.
         """
         attr = Attribute(attr_type, attr_value, displayed, source, formatter)
+        if self._attributes is None:
+            self._attributes = []
+
         if unique == 'Type':
             for attribute_data in self._attributes:
                 if attribute_data.type == attr_type:
@@ -384,6 +393,8 @@ class Indicator:
             return None
 
         occurrence_obj = FileOccurrence(file_name, path, date)
+        if self._occurrences is None:
+            self._occurrences = []
         self._occurrences.append(occurrence_obj)
         return occurrence_obj
 
@@ -429,6 +440,8 @@ class Indicator:
             SecurityLabel: An instance of the SecurityLabel class.
         """
         label = SecurityLabel(name, description, color)
+        if self._labels is None:
+            self._labels = []
         for label_data in self._labels:
             if label_data.name == name:
                 label = label_data
@@ -448,6 +461,8 @@ class Indicator:
             Tag: An instance of the Tag class.
         """
         tag = Tag(name, formatter)
+        if self._tags is None:
+            self._tags = []
         for tag_data in self._tags:
             if tag_data.name == name:
                 tag = tag_data
@@ -604,6 +619,8 @@ class File(Indicator):
     def action(self, relationship: str) -> 'FileAction':
         """Add a File Action."""
         action_obj = FileAction(self._indicator_data['xid'], relationship)  # type: ignore
+        if self._file_actions is None:
+            self._file_actions = []
         self._file_actions.append(action_obj)
         return action_obj
 
@@ -836,7 +853,10 @@ class FileAction:
 class FileOccurrence:
     """ThreatConnect Batch FileAction Object."""
 
-    __slots__ = ['_occurrence_data', 'util']
+    __slots__ = ['_occurrence_data']
+
+    # shared utility instance
+    util: ClassVar[Util] = Util()
 
     def __init__(
         self,
@@ -853,9 +873,6 @@ class FileOccurrence:
         """
         self._occurrence_data = {}
 
-        # properties
-        self.util = Util()
-
         if file_name is not None:
             self._occurrence_data['fileName'] = file_name
         if path is not None:
@@ -334,12 +334,12 @@ class GenerateObjectABC(GenerateABC, ABC):
         @model.setter
         def model(self, data: dict | IndicatorModel):
             '''Create model using the provided data.'''
-            if isinstance(data, type(self.model)):
+            if isinstance(data, type(self.model).model_class()):
                 # provided data is already a model, nothing required to change
                 self._model = data
             elif isinstance(data, dict):
                 # provided data is raw response, load the model
-                self._model = type(self.model)(**data)
+                self._model = type(self.model).model_class()(**data)
             else:
                 ex_msg = f'Invalid data type: {type(data)} provided.'
                 raise RuntimeError(ex_msg)
@@ -357,12 +357,12 @@ class GenerateObjectABC(GenerateABC, ABC):
                     f'dict | {self.type_.singular().pascal_case()}Model):'
                 ),
                 f'{self.i2}"""Create model using the provided data."""',
-                f'{self.i2}if isinstance(data, type(self.model)):',
+                f'{self.i2}if isinstance(data, type(self.model).model_class()):',
                 f'{self.i3}# provided data is already a model, nothing required to change',
                 f'{self.i3}self._model = data',
                 f'{self.i2}elif isinstance(data, dict):',
                 f'{self.i3}# provided data is raw response, load the model',
-                f'{self.i3}self._model = type(self.model)(**data)',
+                f'{self.i3}self._model = type(self.model).model_class()(**data)',
                 f'{self.i2}else:',
                 f'{self.i3}ex_msg = f"Invalid data type: {{type(data)}} provided."',
                 f'{self.i3}raise RuntimeError(ex_msg)  # noqa: TRY004',
@@ -67,12 +67,12 @@ class Artifact(ObjectABC):
     @model.setter
     def model(self, data: dict | ArtifactModel):
         """Create model using the provided data."""
-        if isinstance(data, type(self.model)):
+        if isinstance(data, type(self.model).model_class()):
             # provided data is already a model, nothing required to change
             self._model = data
         elif isinstance(data, dict):
             # provided data is raw response, load the model
-            self._model = type(self.model)(**data)
+            self._model = type(self.model).model_class()(**data)
         else:
             ex_msg = f'Invalid data type: {type(data)} provided.'
             raise RuntimeError(ex_msg)  # noqa: TRY004
@@ -5,6 +5,7 @@ from requests import Session
 
 # first-party
 from tcex.api.tc.v3.case_attributes.case_attribute import CaseAttribute, CaseAttributes
+from tcex.api.tc.v3.response_json import response_json
 
 
 class CaseManagement:
@@ -232,7 +233,7 @@ class CaseManagement:
         obj.create()
         data = {'status_code': obj.request.status_code}
         if obj.request.ok:
-            data.update(obj.request.json().get('data', {}))
+            data.update(response_json(obj.request).get('data', {}))
             data['main_type'] = 'Case_Management'
             data['sub_type'] = entity_type
             data['owner'] = owner
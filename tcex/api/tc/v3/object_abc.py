@@ -9,11 +9,13 @@ from collections.abc import Generator
 from typing import Self
 
 # third-party
+from pydantic.fields import ModelField
 from requests import Response, Session
 from requests.exceptions import ProxyError, RetryError
 
 # first-party
 from tcex.api.tc.v3.object_collection_abc import ObjectCollectionABC
+from tcex.api.tc.v3.response_json import response_json
 from tcex.api.tc.v3.tql.tql_operator import TqlOperator
 from tcex.api.tc.v3.v3_model_abc import V3ModelABC
 from tcex.exit.error_code import handle_error
@@ -39,6 +41,7 @@ class ObjectABC(ABC):  # noqa: B024
         self._session: Session = session
 
         # properties
+        self._included_fields: frozenset[str] = frozenset()  # see ObjectCollectionABC.include
         self._parent_data = {}
         self._remove_objects = {
             'associations': [],
@@ -84,6 +87,16 @@ class ObjectABC(ABC):  # noqa: B024
         # determine the filter type and value based on the available object fields.
         unique_id_data = self._calculate_unique_id()
 
+        # use the nested models when they were included in the payload of the object
+        nested_field = self._sublist_field(sublist, custom_associations)
+        if nested_field is not None and nested_field.alias in self._included_fields:
+            nested = getattr(self.model, nested_field.name)
+            sublist._preloaded = [  # noqa: SLF001
+                model
+                for model in (getattr(nested, 'data', None) or [])
+                if not model._staged  # noqa: SLF001
+            ]
+
         # id!=2984993+AND+hasGroup(typename="all"+AND+isGroup+=+false+AND+hasIndicator(id=2984993))
         # add the filter (e.g., group.has_indicator.id(TqlOperator.EQ, 123)) for the parent object.
         if custom_associations is True:
@@ -106,7 +119,9 @@ class ObjectABC(ABC):  # noqa: B024
                 'unique_id': unique_id_data.get('value'),
             }
             yield obj
-        self.request = sublist.request
+
+        if sublist._preloaded is None:  # noqa: SLF001
+            self.request = sublist.request
 
     @property
     def _max_logging_segment(self) -> int:
@@ -172,6 +187,19 @@ class ObjectABC(ABC):  # noqa: B024
         if content_type == 'application/json':
             self.log_response(self.request)
 
+    def _sublist_field(
+        self, sublist: ObjectCollectionABC, custom_associations: bool = False
+    ) -> ModelField | None:
+        """Return the model field of the object holding the nested objects of the sublist."""
+        if custom_associations is True:
+            return type(self.model).__fields__.get('custom_associations')
+
+        sublist_model = type(sublist.model)
+        for name, field in type(self.model).__fields__.items():
+            if name != 'custom_associations' and field.outer_type_ is sublist_model:
+                return field
+        return None
+
     @staticmethod
     def _validate_id(id_: int | str | None, url: str):
         """Raise exception is id is not provided."""
@@ -207,10 +235,10 @@ class ObjectABC(ABC):  # noqa: B024
         )
 
         # get the response data from nested data object or full response
-        response_json = self.request.json()
+        data = response_json(self.request)
 
         # update the model with the response from the API
-        self.model = type(self.model)(**response_json.get('data'))
+        self.model = type(self.model).model_class()(**data.get('data'))
 
         return self.request
 
@@ -235,7 +263,7 @@ class ObjectABC(ABC):  # noqa: B024
         _fields = []
         r = self._session.options(f'{self._api_endpoint}/fields', params={})
         if r.ok:
-            _fields = r.json().get('data', [])
+            _fields = response_json(r).get('data', [])
         return _fields
 
     def gen_params(self, params: dict) -> dict:
@@ -293,7 +321,7 @@ class ObjectABC(ABC):  # noqa: B024
         self._request(method, self.url(method, unique_id), body, params)
 
         # update model
-        self.model = self.request.json().get('data')
+        self.model = response_json(self.request).get('data')
 
         return self.request
 
@@ -315,12 +343,27 @@ class ObjectABC(ABC):  # noqa: B024
         )
 
     def log_response(self, response: Response):
-        """Log the response text."""
-        max_log_segment = self._max_logging_segment
+        """Log the response text.
 
-        body = response.text
-        if body is not None and len(body) > (max_log_segment * 2):
-            body = body[:max_log_segment] + '... [truncated] ...' + body[-max_log_segment:]
+        Only the logged segments of the body are decoded (large bodies are sliced as bytes),
+        and the body is not read when the INFO level is not enabled.
+        """
+        if not self.log.isEnabledFor(logging.INFO):
+            return
+
+        max_log_segment = self._max_logging_segment
+        encoding = response.encoding or 'utf-8'
+
+        body = None
+        content = response.content
+        if content is not None and len(content) > (max_log_segment * 2):
+            body = (
+                content[:max_log_segment].decode(encoding, errors='replace')
+                + '... [truncated] ...'
+                + content[-max_log_segment:].decode(encoding, errors='replace')
+            )
+        elif content is not None:
+            body = content.decode(encoding, errors='replace')
 
         self.log.info(
             f'feature=api-tc-v3, response-status={response.status_code}, '
@@ -336,12 +379,12 @@ class ObjectABC(ABC):  # noqa: B024
     @model.setter
     def model(self, data: dict | V3ModelABC):
         """Create model using the provided data."""
-        if isinstance(data, type(self.model)):
+        if isinstance(data, type(self.model).model_class()):
             # provided data is already a model, nothing required to change
             self._model = data
         elif isinstance(data, dict):
             # provided data is raw response, load the model
-            self._model = type(self.model)(**data)
+            self._model = type(self.model).model_class()(**data)
         else:
             ex_msg = f'Invalid data type: {type(data)} provided.'
             raise RuntimeError(ex_msg)  # noqa: TRY004
@@ -360,7 +403,7 @@ class ObjectABC(ABC):  # noqa: B024
                 headers={'content-type': 'application/json'},
             )
             if r.ok:
-                _properties = r.json()
+                _properties = response_json(r)
         except (ConnectionError, ProxyError):
             handle_error(
                 code=951,
@@ -386,7 +429,7 @@ class ObjectABC(ABC):  # noqa: B024
         status = True
         if r.ok:
             try:
-                if r.json().get('status') != 'Success':  # pragma: no cover
+                if response_json(r).get('status') != 'Success':  # pragma: no cover
                     status = False
             except Exception:  # pragma: no cover
                 status = False
@@ -404,13 +447,21 @@ class ObjectABC(ABC):  # noqa: B024
         """Set the current timeout value for all requests."""
         self._timeout = timeout
 
-    def update(self, mode: str | None = None, params: dict | None = None) -> Response:
+    def update(
+        self, mode: str | None = None, params: dict | None = None, updated_only: bool = False
+    ) -> Response:
         """Create or Update the Case Management object.
 
         This is determined based on if the id is already present in the object.
+
+        Args:
+            mode: The update mode (e.g., append, delete, replace) for nested objects.
+            params: The query params for the request.
+            updated_only: If True, only the fields updated after the model was retrieved are
+                sent. Models built locally have no retrieved baseline and should leave it off.
         """
         method = 'PUT'
-        body = self.model.gen_body_json(method=method, mode=mode)
+        body = self.model.gen_body_json(method=method, mode=mode, updated_only=updated_only)
         params = self.gen_params(params) if params else None
 
         # get the unique id value for id, xid, summary, etc ...
@@ -428,9 +479,9 @@ class ObjectABC(ABC):  # noqa: B024
         )
 
         # get the response data from nested data object or full response
-        response_json = self.request.json()
+        data = response_json(self.request)
 
-        self.model = type(self.model)(**response_json.get('data'))
+        self.model = type(self.model).model_class()(**data.get('data'))
 
         return self.request
 
@@ -3,26 +3,60 @@
 # standard library
 import json
 import logging
+import math
+import queue
+import threading
+import time
 import urllib.parse
 from abc import ABC
-from collections.abc import Generator
-from typing import Any
+from collections.abc import Generator, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any
 
 # third-party
 from requests import Response, Session
 from requests.exceptions import ProxyError, RetryError
 
 # first-party
+from tcex.api.tc.v3.response_json import response_json
 from tcex.api.tc.v3.tql.tql import Tql
+from tcex.api.tc.v3.tql.tql_operator import TqlOperator
 from tcex.exit.error_code import handle_error
 from tcex.logger.trace_logger import TraceLogger
 from tcex.pleb.cached_property import cached_property
 from tcex.util import Util
 
+if TYPE_CHECKING:  # pragma: no cover
+    # first-party
+    from tcex.api.tc.v3.object_abc import ObjectABC  # CIRCULAR-IMPORT
+
 # get tcex logger
 _logger: TraceLogger = logging.getLogger(__name__.split('.', maxsplit=1)[0])  # type: ignore
 
 
+class BulkResult:
+    """The result of a single object of a bulk create/update.
+
+    Args:
+        obj: The CM/TI object (e.g., Indicator), updated with the API response on success.
+    """
+
+    __slots__ = ['attempts', 'error', 'obj', 'response']
+
+    def __init__(self, obj: 'ObjectABC'):
+        """Initialize instance properties."""
+        self.attempts = 0
+        self.error: Exception | None = None
+        self.obj = obj
+        self.response: Response | None = None
+
+    @property
+    def success(self) -> bool:
+        """Return True if the object was created/updated."""
+        return self.error is None and self.response is not None
+
+
 class ObjectCollectionABC(ABC):  # noqa: B024
     """Case Management Collection Abstract Base Class
 
@@ -47,6 +81,13 @@ class ObjectCollectionABC(ABC):  # noqa: B024
         self.log = _logger
         self.request: Response
         self.tql = Tql()
+        self._include: list[str] = []
+        self._lazy_models = False
+        self._log_responses = True
+        self._partition_ordered = False
+        self._partition_workers = 1
+        self._prefetch = 0
+        self._preloaded: list | None = None  # nested models included in a parent payload
         self._timeout = None
         self._model = None
         self.type_ = None  # defined in child class
@@ -73,14 +114,16 @@ class ObjectCollectionABC(ABC):  # noqa: B024
             if k_ not in parameters:
                 parameters[k_] = v
 
-        self._request(
-            'GET',
-            self._api_endpoint,
-            body=None,
-            params=parameters,
-            headers={'content-type': 'application/json'},
+        data = response_json(
+            self._request(
+                'GET',
+                self._api_endpoint,
+                body=None,
+                params=parameters,
+                headers={'content-type': 'application/json'},
+            )
         )
-        return self.request.json().get('count', len(self.request.json().get('data', [])))
+        return data.get('count', len(data.get('data', [])))
 
     @property
     def _api_endpoint(self):  # pragma: no cover
@@ -108,7 +151,7 @@ class ObjectCollectionABC(ABC):  # noqa: B024
         body: bytes | str | None = None,
         params: dict | None = None,
         headers: dict | None = None,
-    ):
+    ) -> Response:
         """Handle standard request with error checking."""
         max_param_length = 2_000
         if method == 'GET' and body is None and params is not None and params:
@@ -121,9 +164,11 @@ class ObjectCollectionABC(ABC):  # noqa: B024
 
         try:
             self.log_request(method, url, body, params)
-            self.request = self._session.request(
+            # the local response is used as iterate may send requests from multiple threads
+            response = self._session.request(
                 method, url, data=body, headers=headers, params=params, timeout=self.timeout
             )
+            self.request = response
         except (ConnectionError, ProxyError, RetryError):  # pragma: no cover
             handle_error(
                 code=951,
@@ -135,20 +180,289 @@ class ObjectCollectionABC(ABC):  # noqa: B024
                 ],
             )
 
-        if not self.success(self.request):
-            err = self.request.text or self.request.reason
+        if not self.success(response):
+            err = response.text or response.reason
             handle_error(
                 code=950,
                 message_values=[
-                    self.request.request.method,
-                    self.request.status_code,
+                    response.request.method,
+                    response.status_code,
                     err,
-                    self.request.url,
+                    response.url,
                 ],
             )
 
         # log content for debugging
-        self.log_response(self.request)
+        self.log_response(response)
+        return response
+
+    def _bulk(
+        self, action: str, objects: Iterable['ObjectABC'], workers: int, retries: int, **kwargs
+    ) -> list[BulkResult]:
+        """Run the create/update action of each object concurrently.
+
+        Requests rejected by the rate limit (HTTP 429) are retried after the Retry-After delay,
+        which pauses all workers, so that the pool backs off together.
+        """
+        results = [BulkResult(obj) for obj in objects]
+        lock = threading.Lock()
+        resume_at = 0.0
+
+        def run(result: BulkResult):
+            """Create/update a single object."""
+            nonlocal resume_at
+            for attempt in range(retries + 1):
+                with lock:
+                    delay = resume_at - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+
+                result.attempts += 1
+                result.obj.request = None  # type: ignore
+                try:
+                    result.response = getattr(result.obj, action)(**kwargs)
+                    result.error = None
+                except Exception as ex:
+                    result.error = ex
+                    response = result.obj.request
+                    if (
+                        response is None
+                        or response.status_code != HTTPStatus.TOO_MANY_REQUESTS
+                        or attempt == retries
+                    ):
+                        return
+
+                    wait = self._retry_after(response) or float(2**attempt)
+                    with lock:
+                        resume_at = max(resume_at, time.monotonic() + wait)
+                    self.log.warning(
+                        f'feature=api-tc-v3, event=bulk-rate-limited, action={action}, '
+                        f'retry-after={wait}, attempt={attempt + 1}'
+                    )
+                else:
+                    return
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(
+            max_workers=max(1, int(workers)), thread_name_prefix='collection-bulk'
+        ) as pool:
+            list(pool.map(run, results))
+
+        errors = sum(1 for result in results if not result.success)
+        self.log.info(
+            f'feature=api-tc-v3, event=bulk-complete, action={action}, count={len(results)}, '
+            f'errors={errors}, workers={workers}, elapsed={time.perf_counter() - start:.3f}'
+        )
+        return results
+
+    def _iterate_pages(self, url: str, params: dict) -> Iterator[list[dict]]:
+        """Yield the data of each page, following the next url."""
+        while True:
+            response = response_json(
+                self._request(
+                    'GET',
+                    body=None,
+                    url=url,
+                    headers={'content-type': 'application/json'},
+                    params=params,
+                )
+            )
+
+            # reset some vars
+            params = {}
+            url = response.get('next')
+
+            yield response.get('data', [])
+
+            # break out of pagination if no next url present in results
+            if not url:
+                break
+
+    def _iterate_pages_prefetch(self, pages: Iterator[list[dict]]) -> Iterator[list[dict]]:
+        """Yield the pages fetched by a background thread, up to prefetch pages ahead.
+
+        The next page is requested and decoded while the current page is being consumed. Any
+        error raised fetching a page is raised in the consuming thread. The background thread
+        stops when the consumer stops iterating (e.g., break or close).
+        """
+        done = object()
+        pages_queue: queue.Queue = queue.Queue(maxsize=self.prefetch)
+        stop = threading.Event()
+
+        def fetch():
+            """Fetch pages until the last page is reached or the consumer stops."""
+            try:
+                for page in pages:
+                    if not self._queue_put(pages_queue, page, stop):
+                        return
+            except Exception as ex:
+                self._queue_put(pages_queue, ex, stop)
+                return
+            self._queue_put(pages_queue, done, stop)
+
+        thread = threading.Thread(target=fetch, name='collection-prefetch', daemon=True)
+        thread.start()
+        try:
+            while True:
+                item = pages_queue.get()
+                if item is done:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+
+    def _iterate_partitions(self, url: str, params: dict) -> Iterator[list[dict]]:
+        """Yield the pages of each id range partition, fetched concurrently.
+
+        When partition_ordered is enabled, the pages are yielded in id order (partitions are
+        consumed in order and each partition is sorted by id). Otherwise pages are yielded in
+        the order they are received.
+        """
+        ranges = self._partition_ranges(url, params)
+        if len(ranges) <= 1:
+            # too few results to partition
+            yield from self._iterate_pages(url, params)
+            return
+
+        done = object()
+        ordered = self.partition_ordered
+        # ordered: a queue per partition, consumed in order; unordered: a single shared queue
+        queues: list[queue.Queue] = (
+            [queue.Queue(maxsize=2) for _ in ranges]
+            if ordered
+            else [queue.Queue(maxsize=2 * self.partition_workers)]
+        )
+        stop = threading.Event()
+        base_tql = params.get('tql')
+
+        def fetch(index: int, low: int, high: int):
+            """Fetch the pages of a single partition."""
+            pages_queue = queues[index] if ordered else queues[0]
+            tql = f'id >= {low} and id < {high}'
+            if base_tql:
+                tql = f'({base_tql}) and {tql}'
+            partition_params = {**params, 'tql': tql}
+            if ordered:
+                partition_params['sorting'] = 'id ASC'
+
+            try:
+                for page in self._iterate_pages(url, partition_params):
+                    if not self._queue_put(pages_queue, page, stop):
+                        return
+            except Exception as ex:
+                self._queue_put(pages_queue, ex, stop)
+                return
+            self._queue_put(pages_queue, done, stop)
+
+        self.log.info(
+            f'feature=api-tc-v3, event=partitioned-iterate, partitions={len(ranges)}, '
+            f'workers={self.partition_workers}, ordered={ordered}'
+        )
+        pool = ThreadPoolExecutor(
+            max_workers=self.partition_workers, thread_name_prefix='collection-partition'
+        )
+        for index, (low, high) in enumerate(ranges):
+            pool.submit(fetch, index, low, high)
+
+        try:
+            remaining = len(ranges)
+            while remaining:
+                pages_queue = queues[len(ranges) - remaining] if ordered else queues[0]
+                item = pages_queue.get()
+                if item is done:
+                    remaining -= 1
+                    continue
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _partition_ranges(self, url: str, params: dict) -> list[tuple[int, int]]:
+        """Return the disjoint id ranges (low inclusive, high exclusive) for the query.
+
+        The result count and the min/max id are discovered with the count request used by
+        __len__. The number of partitions is a multiple of the worker count (to balance
+        uneven id distributions), limited by the number of pages of results.
+        """
+        if self.type_ and self.type_.lower() in {'exclusion_lists'}:
+            # count is not supported for the endpoint
+            return []
+
+        def id_bound(order: str) -> tuple[int, int | None]:
+            parameters = {**params, 'count': True, 'resultLimit': 1, 'sorting': f'id {order}'}
+            response = response_json(
+                self._request(
+                    'GET',
+                    url,
+                    body=None,
+                    params=parameters,
+                    headers={'content-type': 'application/json'},
+                )
+            )
+            data = response.get('data') or []
+            return response.get('count', len(data)), (data[0].get('id') if data else None)
+
+        count, min_id = id_bound('ASC')
+        _, max_id = id_bound('DESC')
+        if not count or min_id is None or max_id is None:
+            return []
+
+        page_size = int(params.get('resultLimit') or 100)
+        partitions = min(self.partition_workers * 4, math.ceil(count / page_size))
+        width = math.ceil((max_id - min_id + 1) / max(partitions, 1))
+        return [(low, min(low + width, max_id + 1)) for low in range(min_id, max_id + 1, width)]
+
+    def _include_fields(self) -> list[str]:
+        """Return the include fields (camel case), validated against the available fields."""
+        include = [self.util.snake_to_camel(field) for field in self.include]
+        available_fields = self.available_fields
+        invalid = sorted(set(include) - set(available_fields))
+        if available_fields and invalid:
+            ex_msg = (
+                f'Invalid include field(s) for {self.type_}: {", ".join(invalid)}. '
+                f'Available fields: {", ".join(sorted(available_fields))}.'
+            )
+            raise ValueError(ex_msg)
+        return include
+
+    @staticmethod
+    def _queue_put(queue_: queue.Queue, item: Any, stop: threading.Event) -> bool:
+        """Put an item in the queue, returning False if the consumer stopped."""
+        while not stop.is_set():
+            try:
+                queue_.put(item, timeout=0.1)
+            except queue.Full:
+                continue
+            else:
+                return True
+        return False
+
+    @staticmethod
+    def _retry_after(response: Response) -> float:
+        """Return the Retry-After delay in seconds of a rate limited response (0 if unknown)."""
+        try:
+            return max(0.0, float(response.headers.get('Retry-After', 0)))
+        except ValueError:
+            # the HTTP-date format is not used by the ThreatConnect API
+            return 0.0
+
+    @property
+    def available_fields(self) -> list[str]:
+        """Return the available query param field names for this collection."""
+        return [fd['name'] for fd in self.fields]
+
+    @cached_property
+    def fields(self) -> list[dict[str, str]]:
+        """Return the field data for this collection."""
+        _fields = []
+        r = self._session.options(f'{self._api_endpoint}/fields', params={})
+        if r.ok:
+            _fields = response_json(r).get('data', [])
+        return _fields
 
     @property
     def filter(self):  # pragma: no cover
@@ -174,12 +488,28 @@ class ObjectCollectionABC(ABC):  # noqa: B024
         )
 
     def log_response(self, response: Response):
-        """Log the response text."""
-        max_log_segment = self._max_logging_segment
+        """Log the response text.
 
-        body = response.text
-        if body is not None and len(body) > (max_log_segment * 2):
-            body = body[:max_log_segment] + '... [truncated] ...' + body[-max_log_segment:]
+        Only the logged segments of the body are decoded (large bodies are sliced as bytes),
+        and the body is not read when the INFO level is not enabled. The response logging can
+        be disabled for the collection with log_responses.
+        """
+        if not self.log_responses or not self.log.isEnabledFor(logging.INFO):
+            return
+
+        max_log_segment = self._max_logging_segment
+        encoding = response.encoding or 'utf-8'
+
+        body = None
+        content = response.content
+        if content is not None and len(content) > (max_log_segment * 2):
+            body = (
+                content[:max_log_segment].decode(encoding, errors='replace')
+                + '... [truncated] ...'
+                + content[-max_log_segment:].decode(encoding, errors='replace')
+            )
+        elif content is not None:
+            body = content.decode(encoding, errors='replace')
 
         self.log.info(
             f'feature=api-tc-v3, response-status={response.status_code}, '
@@ -187,6 +517,47 @@ class ObjectCollectionABC(ABC):  # noqa: B024
             f'response-url={response.request.url}'
         )
 
+    @property
+    def include(self) -> list[str]:
+        """Return the nested fields included in the results (e.g., attributes, tags).
+
+        The fields are requested with the "fields" query param, so the nested objects are
+        returned in the page payload and hydrated on the object models. The sublist properties
+        of the objects (e.g., Indicator.attributes) then yield the included nested objects
+        instead of sending a query per object. The fields are validated against the available
+        fields of the collection (OPTIONS /fields) when iterating.
+        """
+        return self._include
+
+    @include.setter
+    def include(self, fields: list[str]):
+        """Set the nested fields included in the results."""
+        self._include = list(fields)
+
+    @property
+    def lazy_models(self) -> bool:
+        """Return True if the models of the iterated objects are validated on first access.
+
+        The API data is validated (and the model is initialized) when a model field is first
+        accessed or updated, so objects that are only passed through are not validated.
+        """
+        return self._lazy_models
+
+    @lazy_models.setter
+    def lazy_models(self, lazy: bool):
+        """Set whether the models of the iterated objects are validated on first access."""
+        self._lazy_models = lazy
+
+    @property
+    def log_responses(self) -> bool:
+        """Return True if the responses (status, truncated body, elapsed) are logged."""
+        return self._log_responses
+
+    @log_responses.setter
+    def log_responses(self, enabled: bool):
+        """Set whether the responses are logged (e.g., disabled for large exports)."""
+        self._log_responses = enabled
+
     @property
     def model(self):
         """Return the model."""
@@ -194,18 +565,180 @@ class ObjectCollectionABC(ABC):  # noqa: B024
 
     @model.setter
     def model(self, data):
-        self._model = type(self.model)(**data)
+        self._model = type(self.model).model_class()(**data)
+
+    def as_dicts(self) -> Iterator[dict]:
+        """Iterate over the raw API data (dicts) without creating CM/TI objects.
+
+        This mode is intended for read-only exports, where the validation of each object is
+        not required.
+        """
+        return self.iterate(base_class=None, raw=True)
+
+    def create_many(
+        self,
+        objects: Iterable['ObjectABC'],
+        workers: int = 4,
+        params: dict | None = None,
+        retries: int = 3,
+    ) -> list[BulkResult]:
+        """Create the objects concurrently (one API request per object).
+
+        The model of each created object is updated with the API response. Errors are returned
+        per object (BulkResult.error) instead of being raised.
+
+        Args:
+            objects: The CM/TI objects to create (e.g., tcex.api.tc.v3.indicator(**kwargs)).
+            workers: The number of concurrent requests. Values greater than the connection
+                pool size of the session open additional (unpooled) connections.
+            params: The query params for each request.
+            retries: The number of retries for requests rejected by the rate limit (HTTP 429).
+
+        Returns:
+            list[BulkResult]: The result of each object, in the input order.
+        """
+        return self._bulk('create', objects, workers, retries, params=params)
+
+    def fan_out(
+        self,
+        parents: Iterable['ObjectABC'],
+        workers: int = 4,
+        parent_field: str | None = None,
+        batch_size: int = 100,
+    ) -> list[tuple['ObjectABC', list['ObjectABC']]]:
+        """Return the objects of the collection type for each parent, fetched concurrently.
+
+        By default a query per parent is sent (the query used by the parent sublist property,
+        e.g., Indicator.tags), and the queries are sent concurrently. When the objects of the
+        collection contain the parent id (e.g., IndicatorAttributeModel.indicator_id), the
+        parent_field enables batched queries (e.g., indicatorId IN (1,2,3)), and the results
+        are joined back to the parents using the parent id.
+
+        >>> attributes = IndicatorAttributes(session=session)
+        >>> results = attributes.fan_out(
+        ...     indicators, parent_field='indicator_id'
+        ... )
+        >>> for indicator, indicator_attributes in results:
+        ...     print(
+        ...         indicator.model.summary,
+        ...         [a.model.value for a in indicator_attributes],
+        ...     )
+
+        Args:
+            parents: The parent CM/TI objects (e.g., Indicator).
+            workers: The number of concurrent queries.
+            parent_field: The model field (and filter) containing the parent id for batched
+                queries (e.g., indicator_id).
+            batch_size: The max number of parents in a batched query.
+
+        Returns:
+            list[tuple]: The (parent, objects) tuples, in the parents order.
+        """
+        parents = list(parents)
+        results: list[list[ObjectABC]] = [[] for _ in parents]
+
+        def fetch_parent(index: int):
+            """Fetch the objects of a single parent."""
+            parent = parents[index]
+            results[index] = [
+                obj
+                for obj in parent._iterate_over_sublist(type(self))  # type: ignore # noqa: SLF001
+                # ensure the parent is not returned as its own association
+                if not (type(obj) is type(parent) and obj.model.id == parent.model.id)
+            ]
+
+        def fetch_batch(indexes: list[int]):
+            """Fetch the objects of a batch of parents with a single query."""
+            collection = type(self)(session=self._session, params=dict(self.params))
+            collection.tql.filters = list(self.tql.filters)
+            getattr(collection.filter, parent_field)(  # type: ignore
+                TqlOperator.IN, [parents[index].model.id for index in indexes]
+            )
+
+            objects: dict[int, list] = {}
+            for obj in collection:
+                parent_id = getattr(obj.model, parent_field, None)  # type: ignore
+                if parent_id is None:
+                    # the parent id was not returned, fall back to a query per parent
+                    self.log.warning(
+                        f'feature=api-tc-v3, event=fan-out-batch-fallback, '
+                        f'parent-field={parent_field}'
+                    )
+                    for index in indexes:
+                        fetch_parent(index)
+                    return
+                objects.setdefault(parent_id, []).append(obj)
+
+            for index in indexes:
+                parent = parents[index]
+                results[index] = objects.get(parent.model.id, [])
+                for obj in results[index]:
+                    obj._parent_data = {  # noqa: SLF001
+                        'api_endpoint': parent._api_endpoint,  # noqa: SLF001
+                        'type': parent.type_,
+                        'unique_id': parent.model.id,
+                    }
+
+        # parents without an id are queried individually (e.g., by xid or summary)
+        batched = [i for i, parent in enumerate(parents) if parent_field and parent.model.id]
+        batched_indexes = set(batched)
+        tasks = [
+            (fetch_batch, batched[i : i + max(1, batch_size)])
+            for i in range(0, len(batched), max(1, batch_size))
+        ]
+        tasks.extend(
+            (fetch_parent, index) for index in range(len(parents)) if index not in batched_indexes
+        )
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(
+            max_workers=max(1, int(workers)), thread_name_prefix='collection-fan-out'
+        ) as pool:
+            for future in [pool.submit(func, arg) for func, arg in tasks]:
+                future.result()
+
+        self.log.info(
+            f'feature=api-tc-v3, event=fan-out-complete, type={self.type_}, '
+            f'parents={len(parents)}, queries={len(tasks)}, '
+            f'elapsed={time.perf_counter() - start:.3f}'
+        )
+        return list(zip(parents, results, strict=True))
 
     def iterate(
         self,
         base_class: Any,
         api_endpoint: str | None = None,
         params: dict | None = None,
+        raw: bool = False,
     ) -> Generator:
-        """Iterate over CM/TI objects."""
+        """Iterate over CM/TI objects.
+
+        Args:
+            base_class: The CM/TI object class.
+            api_endpoint: The API endpoint, defaults to the collection API endpoint.
+            params: The query params, defaults to the collection params.
+            raw: If True, the raw API data (dicts) is returned instead of CM/TI objects.
+        """
+        if self._preloaded is not None:
+            # the nested models were included in the parent payload (see include)
+            for model in self._preloaded:
+                if raw is True:
+                    yield model.dict(by_alias=True, exclude_none=True)
+                    continue
+                obj = base_class(session=self._session)
+                obj.model = model
+                yield obj
+            return
+
         url = api_endpoint or self._api_endpoint
         params = params or self.params
 
+        included: frozenset[str] = frozenset()
+        if self.include and api_endpoint is None:
+            included = frozenset(self._include_fields())
+            fields = params.setdefault('fields', [])
+            fields.extend(field for field in sorted(included) if field not in fields)
+
         # special parameter for indicators to enable the return the the indicator fields
         # (value1, value2, value3) on std-custom/custom-custom indicator types.
         if self.type_ == 'Indicators' and api_endpoint is None:
@@ -221,28 +754,68 @@ class ObjectCollectionABC(ABC):  # noqa: B024
         if tql_string:
             params['tql'] = tql_string
 
-        while True:
-            self._request(
-                'GET',
-                body=None,
-                url=url,
-                headers={'content-type': 'application/json'},
-                params=params,
-            )
-
-            # reset some vars
-            params = {}
+        if self.partition_workers > 1 and api_endpoint is None:
+            pages = self._iterate_partitions(url, params)
+        else:
+            pages = self._iterate_pages(url, params)
+            if self.prefetch > 0:
+                pages = self._iterate_pages_prefetch(pages)
 
-            response = self.request.json()
-            data = response.get('data', [])
-            url = response.pop('next', None)
+        if raw is True:
+            for data in pages:
+                yield from data
+            return
 
+        lazy = self.lazy_models
+        for data in pages:
             for result in data:
-                yield base_class(session=self._session, **result)  # type: ignore
+                if lazy:
+                    obj = base_class(session=self._session, _lazy=True, **result)
+                else:
+                    obj = base_class(session=self._session, **result)  # type: ignore
+                if included:
+                    obj._included_fields = included  # noqa: SLF001
+                yield obj
 
-            # break out of pagination if no next url present in results
-            if not url:
-                break
+    @property
+    def partition_ordered(self) -> bool:
+        """Return True if partitioned iteration returns the results in id order."""
+        return self._partition_ordered
+
+    @partition_ordered.setter
+    def partition_ordered(self, ordered: bool):
+        """Set whether partitioned iteration returns the results in id order."""
+        self._partition_ordered = ordered
+
+    @property
+    def partition_workers(self) -> int:
+        """Return the number of concurrent workers for partitioned iteration (1 disables).
+
+        When enabled, the query is split into disjoint id ranges that are fetched concurrently
+        and merged into a single stream of results. Results created after the iteration starts
+        with an id greater than the max id discovered are not returned.
+        """
+        return self._partition_workers
+
+    @partition_workers.setter
+    def partition_workers(self, workers: int):
+        """Set the number of concurrent workers for partitioned iteration."""
+        self._partition_workers = max(1, int(workers))
+
+    @property
+    def prefetch(self) -> int:
+        """Return the number of pages fetched ahead of the consumer (0 disables prefetch).
+
+        When enabled, the next page of results is requested in a background thread while the
+        current page is being consumed, overlapping the API latency with the processing of the
+        results. The collection session is used from the background thread.
+        """
+        return self._prefetch
+
+    @prefetch.setter
+    def prefetch(self, pages: int):
+        """Set the number of pages fetched ahead of the consumer."""
+        self._prefetch = max(0, int(pages))
 
     @property
     def params(self) -> dict:
@@ -267,7 +840,7 @@ class ObjectCollectionABC(ABC):  # noqa: B024
         status = True
         if r.ok:
             try:
-                if r.json().get('status') != 'Success':  # pragma: no cover
+                if response_json(r).get('status') != 'Success':  # pragma: no cover
                     status = False
             except Exception:  # pragma: no cover
                 status = False
@@ -291,10 +864,46 @@ class ObjectCollectionABC(ABC):  # noqa: B024
         _data = []
         r = self._session.options(f'{self._api_endpoint}/tql', params={})
         if r.ok:
-            _data = r.json()['data']
+            _data = response_json(r)['data']
         return _data
 
     @property
     def tql_keywords(self):
         """Return supported TQL keywords."""
         return [to.get('keyword') for to in self.tql_options]
+
+    def update_many(
+        self,
+        objects: Iterable['ObjectABC'],
+        workers: int = 4,
+        mode: str | None = None,
+        params: dict | None = None,
+        retries: int = 3,
+        updated_only: bool = False,
+    ) -> list[BulkResult]:
+        """Update the objects concurrently (one API request per object).
+
+        The model of each updated object is updated with the API response. Errors are returned
+        per object (BulkResult.error) instead of being raised.
+
+        Args:
+            objects: The CM/TI objects to update.
+            workers: The number of concurrent requests.
+            mode: The update mode (e.g., append, delete, replace) for nested objects.
+            params: The query params for each request.
+            retries: The number of retries for requests rejected by the rate limit (HTTP 429).
+            updated_only: If True, only the fields updated after the model was retrieved are
+                sent (see ObjectABC.update).
+
+        Returns:
+            list[BulkResult]: The result of each object, in the input order.
+        """
+        return self._bulk(
+            'update',
+            objects,
+            workers,
+            retries,
+            mode=mode,
+            params=params,
+            updated_only=updated_only,
+        )
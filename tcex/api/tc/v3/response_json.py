@@ -0,0 +1,58 @@
+"""TcEx Framework Module"""
+
+# standard library
+import json
+from collections.abc import Callable
+from typing import Any
+
+# third-party
+from requests import Response
+
+try:
+    # third-party
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+# the response attribute holding the decoded body
+_JSON_ATTR = '_tcex_json'
+
+# the default decoder, orjson is used when installed (it accepts the raw response bytes)
+_default_loads: Callable[[bytes | str], Any] = orjson.loads if orjson is not None else json.loads
+_loads = _default_loads
+
+
+def response_json(response: Response) -> Any:
+    """Return the decoded JSON body of the response, decoding the body only once.
+
+    The decoded body is cached on the response, so that the success check, the pagination,
+    and the model update of the v3 request paths share a single decode. The returned data
+    must be treated as read-only by the caller.
+
+    Args:
+        response: The response object.
+
+    Raises:
+        ValueError: If the response body is not valid JSON.
+    """
+    try:
+        return response.__dict__[_JSON_ATTR]
+    except KeyError:
+        pass
+
+    data = _loads(response.content)
+    response.__dict__[_JSON_ATTR] = data
+    return data
+
+
+def set_json_loads(loads: Callable[[bytes | str], Any] | None = None):
+    """Set the JSON decoder used for v3 responses (None restores the default decoder).
+
+    The decoder is called with the raw response bytes and must raise a ValueError (e.g.,
+    json.JSONDecodeError) on invalid JSON.
+
+    Args:
+        loads: The decoder (e.g., ujson.loads).
+    """
+    global _loads  # noqa: PLW0603
+    _loads = loads or _default_loads
@@ -15,6 +15,7 @@ from tcex.api.tc.v3.indicator_attributes.indicator_attribute import (
     IndicatorAttributes,
 )
 from tcex.api.tc.v3.indicators.indicator import Indicator, Indicators
+from tcex.api.tc.v3.response_json import response_json
 from tcex.api.tc.v3.security_labels.security_label import SecurityLabel
 from tcex.api.tc.v3.tags.mitre_tags import MitreTags
 from tcex.api.tc.v3.tags.naics_tags import NAICSTags
@@ -69,7 +70,7 @@ class ThreatIntelligence:
         r = obj.create()
         data: dict[str, int | str] = {'status_code': r.status_code}
         if r.ok:
-            data.update(r.json().get('data', {}))
+            data.update(response_json(r).get('data', {}))
             data['main_type'] = main_type
             data['sub_type'] = entity_type
             data['owner'] = owner
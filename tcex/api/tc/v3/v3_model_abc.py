@@ -5,6 +5,7 @@ import datetime
 import hashlib
 import json
 import logging
+import threading
 from abc import ABC
 from json import JSONEncoder
 from typing import Any, Self
@@ -19,6 +20,103 @@ from tcex.logger.trace_logger import TraceLogger
 
 _logger: TraceLogger = logging.getLogger(__name__.split('.', maxsplit=1)[0])  # type: ignore
 
+# key used to hold the unvalidated data of a lazy model
+_LAZY_DATA = '__lazy_data__'
+
+# lazy model classes, keyed by model class
+_lazy_classes: dict[type, type] = {}
+
+# lock for the validation of lazy models on first access
+_lazy_lock = threading.RLock()
+
+# the kind of field value (container, list, model, or scalar) for change tracking, keyed by type
+_value_kinds: dict[type, str] = {list: 'list', type(None): 'scalar'}
+
+# indicator fields that cannot be provided once the indicator has an id (updatable is false)
+_INDICATOR_SUMMARY_FIELDS = frozenset(
+    [
+        'address',
+        'file',
+        'hostName',
+        'ip',
+        'md5',
+        'sha1',
+        'sha256',
+        'text',
+        'url',
+        'value1',
+        'value2',
+        'value3',
+    ]
+)
+
+
+class BodyFieldPlan:
+    """The precomputed inclusion rules of a model field for gen_body.
+
+    Args:
+        title: The field title (the API field name).
+        property_: The field properties from the model schema.
+        method: The HTTP method used for the METHOD RULE.
+        mode: The PUT mode for nested objects (append, delete, replace).
+        nested: If True, the model is nested in a parent model.
+        indicator: If True, the model is an Indicator Model.
+    """
+
+    __slots__ = [
+        'conditional_read_only',
+        'excluded',
+        'id_field',
+        'in_methods',
+        'nested_model',
+        'summary_field',
+        'title',
+    ]
+
+    def __init__(
+        self,
+        title: str,
+        property_: dict,
+        method: str,
+        mode: str | None,
+        nested: bool,
+        indicator: bool,
+    ):
+        """Initialize instance properties."""
+        self.title = title
+
+        # nested models (non-read-only) are handled by the nested inclusion rules
+        self.nested_model = property_.get('read_only') is False
+
+        # INDICATOR ID RULE: If an indicator has a ID set, then the indicator fields
+        #     cannot be provided (updateable is false) or the API request will fail.
+        #     Since Note model CAN update the `text` field we need to specifically state
+        #     that this test is for the `Indicator Model` only.
+        self.summary_field = indicator and title in _INDICATOR_SUMMARY_FIELDS
+
+        # MODE DELETE RULE: The "id" should be the only field included when delete mode
+        #     is enabled. "relationship" is required for FileActions upon delete mode as well.
+        self.excluded = (
+            mode == 'delete' and nested is True and title not in ['id', 'name', 'relationship']
+        )
+
+        # ID RULE: The "id" should not be included for ANY HTTP method on parent object,
+        #     but for nested objects the "id" field should be included when available.
+        #     PLAT-4074 - updating nested object using "replace"
+        self.id_field = title == 'id' and nested is True
+
+        # EXCLUSION RULE: If the property "conditional_read_only" is set and the current type
+        #    is in the list the field should be excluded.
+        self.conditional_read_only = property_.get('conditional_read_only') or None
+
+        # METHOD RULE: If the current method is in the property "methods" list the
+        #     field should be included when available.
+        self.in_methods = method in property_.get('methods', [])
+
+
+# gen_body plans (field name -> field plan), keyed by (model class, method, mode, nested)
+_body_plans: dict[tuple[type, str, str | None, bool], dict[str, BodyFieldPlan]] = {}
+
 
 class CustomJSONEncoder(JSONEncoder):
     """Format object in JSON data."""
@@ -41,14 +139,25 @@ class V3ModelABC(BaseModel, ABC, allow_population_by_field_name=True):
 
     _associated_type = PrivateAttr(default=False)
     _cm_type = PrivateAttr(default=False)
-    _dict_hash: str = PrivateAttr()
+    _dirty: set[str] | None = PrivateAttr(default=None)  # fields assigned after initialization
+    _initial_items: dict[str, Any] | None = PrivateAttr(default=None)  # list/container items
     _log = _logger
     _shared_type = PrivateAttr(default=False)
     _staged = PrivateAttr(default=False)
     id: int | None = None
 
+    def __new__(cls, *args, **kwargs):  # noqa: ARG004
+        """Return a lazily validated model when the "_lazy" keyword argument is True.
+
+        A lazy model stores the data without validation. The model is validated and initialized
+        when an attribute is first accessed (e.g., reading or updating a field), at which point
+        it becomes a regular instance of the model class.
+        """
+        return super().__new__(cls.lazy_class() if kwargs.get('_lazy') is True else cls)
+
     def __init__(self, **kwargs):
         """Initialize instance properties."""
+        kwargs.pop('_lazy', None)
         super().__init__(**kwargs)
 
         # when "id" field is present it indicates that the data was returned from the
@@ -63,50 +172,27 @@ class V3ModelABC(BaseModel, ABC, allow_population_by_field_name=True):
         ):
             self._staged = True
 
-        # store initial dict hash of model
-        self._dict_hash = self.gen_model_hash(self.json(sort_keys=True))
-
-    def _calculate_field_inclusion(
-        self, field: str, method: str, mode: str | None, nested: bool, property_: dict, value: Any
-    ) -> bool:
-        """Return True if the field is calculated to be included."""
-
-        # INDICATOR ID RULE: If an indicator has a ID set, then the indicator fields
-        #     cannot be provided (updateable is false) or the API request will fail.
-        #     Since Note model CAN update the `text` field we need to specifically state
-        #     that this test is for the `Indicator Model` only.
-        if (
-            self.__config__.title == 'Indicator Model'
-            and self.id is not None
-            and field
-            in [
-                'address',
-                'file',
-                'hostName',
-                'ip',
-                'md5',
-                'sha1',
-                'sha256',
-                'text',
-                'url',
-                'value1',
-                'value2',
-                'value3',
-            ]
-        ):
-            return False
-
-        # MODE DELETE RULE: The "id" should be the only field included when delete mode
-        #     is enabled. "relationship" is required for FileActions upon delete mode as well.
-        if mode == 'delete' and nested is True and field not in ['id', 'name', 'relationship']:
-            return False
-
-        # ID RULE: The "id" should not be included for ANY HTTP method on parent object,
-        #     but for nested objects the "id" field should be included when available.
-        #     PLAT-4074 - updating nested object using "replace"
-        if field == 'id' and nested is True and value:
-            return True
-
+        # store the initial items of list and container (e.g., TagsModel) fields, so that added,
+        # removed, or replaced items are detected without hashing the full model
+        initial_items = {
+            name: items
+            for name in self.__fields_set__
+            if (items := self._items(self.__dict__.get(name))) is not None
+        }
+        if initial_items:
+            self._initial_items = initial_items
+
+    def __setattr__(self, name: str, value: Any):
+        """Set the field value (validated) and track the field as updated."""
+        super().__setattr__(name, value)
+        if not name.startswith('_'):
+            if self._dirty is None:
+                self._dirty = {name}
+            else:
+                self._dirty.add(name)
+
+    def _body_method(self, method: str, nested: bool) -> str:
+        """Return the HTTP method used to evaluate the METHOD RULE of the fields."""
         # NESTED RULE: For nested objects the body should use the valid POST fields
         #    instead of the PUT fields if id is not available. This handles including
         #    artifact type, attributes and other fields that are needed on the nested object.
@@ -119,17 +205,55 @@ class V3ModelABC(BaseModel, ABC, allow_population_by_field_name=True):
         if method == 'POST' and nested is True and self._shared_type is True:
             method = 'PUT'
 
-        # EXCLUSION RULE: If the property "conditional_read_only" is set and the current type
-        #    is in the list the field should be excluded.
-        conditional_read_only = property_.get('conditional_read_only')
-        ti_type = getattr(self, 'type', None)
-        if conditional_read_only and ti_type in conditional_read_only:
+        return method
+
+    @classmethod
+    def _body_plan(cls, method: str, mode: str | None, nested: bool) -> dict[str, BodyFieldPlan]:
+        """Return the gen_body plan for the model class (computed once per combination).
+
+        Args:
+            method: The HTTP method used for the METHOD RULE (see _body_method).
+            mode: The PUT mode for nested objects (append, delete, replace).
+            nested: If True, the model is nested in a parent model.
+        """
+        key = (cls, method, mode, nested)
+        plan = _body_plans.get(key)
+        if plan is None:
+            indicator = cls.__config__.title == 'Indicator Model'
+            plan = {
+                name: BodyFieldPlan(property_['title'], property_, method, mode, nested, indicator)
+                for name, property_ in cls._properties().items()
+            }
+            _body_plans[key] = plan
+        return plan
+
+    def _calculate_field_inclusion(self, field_plan: BodyFieldPlan, value: Any) -> bool:
+        """Return True if the field is calculated to be included.
+
+        The static rules are evaluated once per model class by the BodyFieldPlan, the rules
+        that depend on the model values are evaluated here.
+        """
+        # INDICATOR ID RULE
+        if field_plan.summary_field and self.id is not None:
             return False
 
-        # METHOD RULE: If the current method is in the property "methods" list the
-        #     field should be included when available.
+        # MODE DELETE RULE
+        if field_plan.excluded:
+            return False
+
+        # ID RULE
+        if field_plan.id_field and value:
+            return True
+
+        # EXCLUSION RULE
+        if field_plan.conditional_read_only and getattr(self, 'type', None) in (
+            field_plan.conditional_read_only
+        ):
+            return False
+
+        # METHOD RULE
         # DEFAULT RULE -> Fields should not be included unless the match a previous rule.
-        return bool(method in property_.get('methods', []) and (value or value in [0, False]))
+        return bool(field_plan.in_methods and (value or value in [0, False]))
 
     def _calculate_nested_inclusion(  # noqa: PLR0911
         self, method: str, mode: str | None, model: Self
@@ -327,12 +451,137 @@ class V3ModelABC(BaseModel, ABC, allow_population_by_field_name=True):
                 return data
         return None
 
-    def _properties(self) -> dict[str, dict[str, str]]:
+    def _field_updated(self, name: str, value: Any) -> bool:
+        """Return True if the field was updated after initialization.
+
+        A field is updated when it was assigned, when a nested model was updated, or when items
+        were added to, removed from, or replaced in a list field (e.g., staged tags).
+        """
+        if self._dirty is not None and name in self._dirty:
+            return True
+
+        kind = self._value_kind(value)
+        if kind == 'scalar':
+            # scalar values can only be updated by assignment
+            return False
+
+        if kind == 'model':
+            return value.updated
+
+        # the field may not have been provided on initialization (e.g., the default empty list)
+        initial_fields, initial_items = (self._initial_items or {}).get(name) or (0, ())
+        fields, items = self._items(value)  # type: ignore
+        if (
+            fields != initial_fields
+            or len(items) != len(initial_items)
+            or any(item is not initial for item, initial in zip(items, initial_items, strict=True))
+        ):
+            return True
+
+        return any(self._value_kind(item) == 'model' and item.updated for item in items)
+
+    @classmethod
+    def _items(cls, value: Any) -> tuple[int, tuple] | None:
+        """Return the (fields set, items) of a list or container (e.g., TagsModel), else None.
+
+        The items are referenced (not copied), so that replaced items are detected by identity.
+        For containers the number of fields set is included, so that an assigned mode is
+        detected (the containers are not V3 models and do not track changes).
+        """
+        kind = cls._value_kind(value)
+        if kind == 'list':
+            return 0, tuple(value)
+        if kind == 'container':
+            data = value.__dict__.get('data')
+            return len(value.__fields_set__), tuple(data) if isinstance(data, list) else ()
+        return None
+
+    @staticmethod
+    def _value_kind(value: Any) -> str:
+        """Return the kind of value for change tracking (cached by type)."""
+        type_ = type(value)
+        kind = _value_kinds.get(type_)
+        if kind is None:
+            if issubclass(type_, V3ModelABC):
+                kind = 'model'
+            elif issubclass(type_, BaseModel):
+                kind = 'container'
+            elif issubclass(type_, list):
+                kind = 'list'
+            else:
+                kind = 'scalar'
+            _value_kinds[type_] = kind
+        return kind
+
+    @classmethod
+    def _properties(cls) -> dict[str, dict[str, str]]:
         """Return properties of the current model."""
-        schema = self.schema(by_alias=False)
+        schema = cls.schema(by_alias=False)
         if schema.get('properties') is not None:
             return schema.get('properties', {})
-        return schema.get('definitions', {}).get(self.__class__.__name__, {}).get('properties', {})
+        return schema.get('definitions', {}).get(cls.__name__, {}).get('properties', {})
+
+    @classmethod
+    def model_class(cls) -> type[Self]:
+        """Return the model class, which for a lazy model is the class of the validated model.
+
+        The class is read from the type (e.g., type(model).model_class()), which does not
+        validate a lazy model.
+        """
+        return cls
+
+    @classmethod
+    def lazy_class(cls) -> type[Self]:
+        """Return the lazy model class for the model (see __new__).
+
+        The lazy class is created with the type constructor so that the pydantic metaclass
+        does not add slots, which allows the instance to be switched to the model class.
+        """
+        lazy_class = _lazy_classes.get(cls)
+        if lazy_class is not None:
+            return lazy_class  # type: ignore
+
+        model_class = cls
+
+        def lazy_model_class(_cls) -> type[Self]:
+            """Return the model class that a lazy model becomes once validated."""
+            return model_class  # type: ignore
+
+        def __init__(self, **kwargs):  # noqa: N807
+            """Store the data for validation on first access."""
+            kwargs.pop('_lazy', None)
+            object.__setattr__(self, '__dict__', {_LAZY_DATA: kwargs})
+
+        def __getattribute__(self, name: str) -> Any:  # noqa: N807
+            """Validate and initialize the model, then return the attribute.
+
+            The data is validated into a separate model, whose state is then moved to this
+            instance under a lock. Concurrent first reads validate the data once, and a
+            validation error leaves the lazy state in place.
+            """
+            with _lazy_lock:
+                state = object.__getattribute__(self, '__dict__')
+                if _LAZY_DATA in state:
+                    model = model_class(**state[_LAZY_DATA])
+                    model_class.__setstate__(self, model_class.__getstate__(model))
+                    object.__setattr__(self, '__class__', model_class)
+            return getattr(self, name)
+
+        lazy_class = type.__new__(
+            type(cls),
+            f'Lazy{cls.__name__}',
+            (cls,),
+            {
+                '__getattribute__': __getattribute__,
+                '__init__': __init__,
+                '__module__': cls.__module__,
+                'model_class': classmethod(lazy_model_class),
+                '__qualname__': f'Lazy{cls.__qualname__}',
+                '__slots__': (),
+            },
+        )
+        _lazy_classes[cls] = lazy_class
+        return lazy_class  # type: ignore
 
     @staticmethod
     def gen_model_hash(json_: str) -> str:
@@ -349,21 +598,31 @@ class V3ModelABC(BaseModel, ABC, allow_population_by_field_name=True):
         mode: str | None = None,
         exclude_none: bool = True,
         nested: bool = False,
+        updated_only: bool = False,
     ) -> dict:
         """Return the generated body.
 
         The field included in the body depend on the HTTP Method and whether or not the object
         is nested. For example the ID should not be send on the parent object on a POST or PUT,
         but should be added for a PUT on a nested object.
+
+        When updated_only is enabled for a PUT, only the fields updated after the model was
+        initialized (e.g., from the API response) are included.
         """
+        updated_only = updated_only and method == 'PUT'
         _body = {}
-        schema_properties = self._properties()
+        # the body method is resolved first, as it validates a lazy model (see lazy_class)
+        body_plan = type(self)._body_plan(self._body_method(method, nested), mode, nested)
         for name, value in self:
             if exclude_none is True and value is None:
                 continue
 
-            # get the current field from the schema to us in validating method membership.
-            if schema_properties.get(name) is None:
+            if updated_only and not self._field_updated(name, value):
+                continue
+
+            # get the current field plan to us in validating method membership.
+            field_plan = body_plan.get(name)
+            if field_plan is None:
                 # a field not being available does not indicate a failure, it could simple
                 # be the incorrect field was passed to the object, which will be dropped.
                 self._log.warning(
@@ -372,9 +631,8 @@ class V3ModelABC(BaseModel, ABC, allow_population_by_field_name=True):
                 )
                 continue
 
-            property_ = schema_properties.get(name, {})
-            key = property_['title']
-            if isinstance(value, BaseModel) and property_.get('read_only') is False:
+            key = field_plan.title
+            if field_plan.nested_model and self._value_kind(value) in ('container', 'model'):
                 value: Self  # type: ignore
                 # Handle nested model that should be included in the body (non-read-only).
 
@@ -409,7 +667,7 @@ class V3ModelABC(BaseModel, ABC, allow_population_by_field_name=True):
                     if _data:
                         _body[key] = _data
 
-            elif self._calculate_field_inclusion(key, method, mode, nested, property_, value):
+            elif self._calculate_field_inclusion(field_plan, value):
                 # Handle non-nested fields and their values based on well defined rules.
                 if value and isinstance(value, list) and isinstance(value[0], BaseModel):
                     value: list[Self]
@@ -431,13 +689,14 @@ class V3ModelABC(BaseModel, ABC, allow_population_by_field_name=True):
         mode: str | None = None,
         indent: int | None = None,
         sort_keys: bool = False,
+        updated_only: bool = False,
     ) -> str:
         """Wrap gen_body method returning JSON instead of dict."""
         # ensure mode is set to lower case if provided on gen_body entry point
         if mode is not None:
             mode = mode.lower()
 
-        body = self.gen_body(method, mode)
+        body = self.gen_body(method, mode, updated_only=updated_only)
         return json.dumps(
             body,
             cls=CustomJSONEncoder,
@@ -446,6 +705,8 @@ class V3ModelABC(BaseModel, ABC, allow_population_by_field_name=True):
         )
 
     @property
-    def updated(self):
+    def updated(self) -> bool:
         """Return True if model values have changed, else False."""
-        return self._dict_hash != self.gen_model_hash(self.json(sort_keys=True))
+        if self._dirty:
+            return True
+        return any(self._field_updated(name, value) for name, value in self.__dict__.items())
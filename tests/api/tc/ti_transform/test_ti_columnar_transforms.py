@@ -0,0 +1,137 @@
+"""Tests for the columnar TiTransforms mode."""
+
+# third-party
+import pytest
+
+# first-party
+from tcex.api.tc.ti_transform import (
+    ProcessingFunctions,
+    TiColumnarTransforms,
+    TiTransforms,
+    TransformException,
+)
+from tcex.api.tc.ti_transform.model import IndicatorTransformModel
+
+functions = ProcessingFunctions(None)
+
+
+def label(value: str, ti_dict: dict) -> str:
+    """Return the label prefixed with the feed name (not element-wise)."""
+    return f'{ti_dict["feed"]}: {value}'
+
+
+TRANSFORM = IndicatorTransformModel(
+    **{
+        'type': {
+            'path': 'type',
+            'transform': [{'static_map': {'domain': 'Host', 'ip_address': 'Address'}}],
+        },
+        'value1': {'path': 'indicator', 'transform': {'method': functions.to_lowercase}},
+        'xid': {'path': 'id'},
+        'rating': {
+            'default': 0,
+            'path': 'confidence',
+            'transform': [{'static_map': {'high': 5, 'medium': 4, 'low': 2}}],
+        },
+        'attributes': [
+            {
+                'type': 'Description',
+                'value': {
+                    'path': 'description',
+                    'transform': {'method': functions.prepend, 'kwargs': {'prefix': 'Feed: '}},
+                },
+            },
+        ],
+        'tags': [
+            {'value': {'path': 'threat_type', 'transform': {'for_each': label}}},
+            {
+                'value': {
+                    'path': 'threat_type',
+                    'transform': [
+                        {'filter_map': {'criminal': 'Crime'}},
+                        {'for_each': functions.to_titlecase},
+                    ],
+                }
+            },
+        ],
+    }
+)
+
+
+def columns(count: int) -> dict[str, list]:
+    """Return the columns of a tabular feed."""
+    return {
+        'confidence': [('high', 'medium', 'low', None)[i % 4] for i in range(count)],
+        'description': [f'indicator {i % 3}' for i in range(count)],
+        'feed': ['tabular'] * count,
+        'id': [f'domain_{i}' for i in range(count)],
+        'indicator': [f'HOST-{i}.example.com' for i in range(count)],
+        'threat_type': [('criminal', 'targeted')[i % 2] for i in range(count)],
+        'type': ['domain'] * count,
+    }
+
+
+def rows(data: dict[str, list]) -> list[dict]:
+    """Return the TI dicts of the columns."""
+    return [dict(zip(data, values)) for values in zip(*data.values())]
+
+
+def test_columnar_matches_rows():
+    """Test that the columnar mode returns the batch entities of the row mode."""
+    data = columns(20)
+    batch = TiColumnarTransforms(data, [TRANSFORM]).batch
+
+    assert batch == TiTransforms(rows(data), [TRANSFORM]).batch
+    assert batch['indicator'][1]['rating'] == 4.0
+    assert batch['indicator'][0]['summary'] == 'host-0.example.com'
+    assert [t['name'] for t in batch['indicator'][0]['tag']] == ['tabular: criminal', 'Crime']
+
+
+def test_columnar_transform_error():
+    """Test that a column-wise transform error is only reported for the rows with the value."""
+    data = columns(6)
+    data['indicator'][2] = 5
+    data['indicator'][4] = 5
+
+    batch = TiColumnarTransforms(data, [TRANSFORM]).batch
+    assert batch == TiTransforms(rows(data), [TRANSFORM]).batch
+    assert [i['xid'] for i in batch['indicator']] == [f'domain_{i}' for i in (0, 1, 3, 5)]
+
+    # the cached error is raised as in row mode, as a new exception for each row
+    transforms = TiColumnarTransforms(data, [TRANSFORM], raise_exceptions=True)
+    errors = []
+    for _ in range(2):
+        with pytest.raises(TypeError, match="'lower'") as ex:
+            _ = transforms.batch
+        errors.append(ex.value)
+    assert errors[0] is not errors[1]
+
+    with pytest.raises(TypeError, match="'lower'"):
+        _ = TiTransforms(rows(data), [TRANSFORM], raise_exceptions=True).batch
+
+
+def test_columnar_transform_error_field():
+    """Test that a column-wise transform error is reported for the field as in row mode."""
+    transform = IndicatorTransformModel(
+        **{
+            'type': {'default': 'Host'},
+            'value1': {'path': 'indicator'},
+            'rating': {'path': 'confidence', 'transform': {'method': functions.to_lowercase}},
+        }
+    )
+    data = columns(4)
+    data['confidence'] = ['1', 5, '2', '3']
+
+    errors = []
+    for ti_dicts, transforms in ((data, TiColumnarTransforms), (rows(data), TiTransforms)):
+        with pytest.raises(TransformException) as ex:
+            _ = transforms(ti_dicts, [transform], raise_exceptions=True).batch
+        errors.append(ex.value)
+    assert [e.field for e in errors] == ['Rating', 'Rating']
+    assert [type(e.cause) for e in errors] == [TypeError, TypeError]
+
+
+def test_columnar_invalid_columns():
+    """Test that columns with different lengths are rejected."""
+    with pytest.raises(ValueError, match='same length'):
+        TiColumnarTransforms({'id': ['a', 'b'], 'indicator': ['a']}, [TRANSFORM])
@@ -0,0 +1,108 @@
+"""Tests for the multiprocess TiTransforms mode."""
+
+# standard library
+import logging
+import multiprocessing
+
+# third-party
+import pytest
+
+# first-party
+from tcex.api.tc.ti_transform import TiTransforms, TransformException
+from tcex.api.tc.ti_transform.model import IndicatorTransformModel
+
+
+def adhoc_host(value: str, transform) -> str:
+    """Add an adhoc indicator for the value and return the tag name."""
+    transform.add_indicator({'summary': f'adhoc.{value}', 'type': 'Host'})
+    return f'tag-{value}'
+
+
+def fail_on_bad(value: str) -> str:
+    """Return the value, failing on a bad value."""
+    if value == 'bad':
+        ex_msg = 'bad value'
+        raise ValueError(ex_msg)
+    return value
+
+
+def transform(**transforms) -> IndicatorTransformModel:
+    """Return an indicator transform.
+
+    Args:
+        **transforms: The tags and rating transforms.
+    """
+    return IndicatorTransformModel(
+        **{
+            'type': {'default': 'Host'},
+            'value1': {'path': 'indicator'},
+            'xid': {'path': 'indicator'},
+            'tags': [{'value': {'path': 'indicator', 'transform': transforms['tags']}}],
+            'rating': {'path': 'rating', 'transform': transforms.get('rating', {'method': str})},
+        }
+    )
+
+
+def ti_dicts(count: int) -> list[dict]:
+    """Return TI dicts."""
+    return [{'indicator': f'host{i}.example.com', 'rating': '1'} for i in range(count)]
+
+
+@pytest.mark.parametrize(
+    ('tags', 'fork'),
+    [
+        pytest.param({'for_each': adhoc_host}, False, id='picklable'),
+        pytest.param(
+            {'for_each': lambda v, transform: adhoc_host(v, transform)},
+            True,
+            id='lambda-fork',
+            marks=pytest.mark.skipif(
+                'fork' not in multiprocessing.get_all_start_methods(), reason='fork not available'
+            ),
+        ),
+    ],
+)
+def test_parallel_matches_serial(tags: dict, fork: bool, caplog: pytest.LogCaptureFixture):
+    """Test that the parallel mode (spawn, unless fork is enabled) returns the serial results."""
+    serial = TiTransforms(ti_dicts(25), [transform(tags=tags)]).batch
+    with caplog.at_level(logging.WARNING):
+        parallel = TiTransforms(ti_dicts(25), [transform(tags=tags)], processes=2, fork=fork).batch
+
+    # the transforms were processed by the workers, not serially
+    assert 'transform-not-picklable' not in caplog.text
+    assert parallel == serial
+    assert [i['summary'] for i in parallel['indicator'][:4]] == [
+        'host0.example.com',
+        'adhoc.host0.example.com',
+        'host1.example.com',
+        'adhoc.host1.example.com',
+    ]
+
+
+def test_parallel_transform_error():
+    """Test that transform errors from the workers are reported by the parent process."""
+    data = ti_dicts(10)
+    data[3]['rating'] = 'bad'
+    model = transform(tags={'for_each': str}, rating={'method': fail_on_bad})
+
+    batch = TiTransforms(data, [model], processes=2).batch
+    assert len(batch['indicator']) == 9
+
+    with pytest.raises(TransformException) as ex:
+        _ = TiTransforms(data, [model], raise_exceptions=True, processes=2).batch
+    assert ex.value.field == 'Rating'
+    assert str(ex.value.cause) == 'bad value'
+    assert ex.value.context['path'] == 'rating'
+
+
+def test_parallel_unpicklable_serial(caplog: pytest.LogCaptureFixture):
+    """Test that unpicklable transforms are processed serially unless fork is enabled."""
+    model = transform(tags={'for_each': lambda v, transform: adhoc_host(v, transform)})
+    transforms = TiTransforms(ti_dicts(5), [model], processes=2)
+
+    with caplog.at_level(logging.WARNING, logger='tcex'):
+        batch = transforms.batch
+
+    assert 'reason=transform-not-picklable' in caplog.text
+    assert len(batch['indicator']) == 10
+    assert len(transforms.transformed_collection) == 5
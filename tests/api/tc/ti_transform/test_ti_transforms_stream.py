@@ -0,0 +1,97 @@
+"""Tests for the streaming TiTransforms API."""
+
+# standard library
+import json
+from collections.abc import Iterator
+from pathlib import Path
+
+# first-party
+from tcex.api.tc.ti_transform import TiTransforms, read_jsonl
+from tcex.api.tc.ti_transform.model import IndicatorTransformModel
+
+
+def adhoc_group(value: str, transform) -> str:
+    """Add an adhoc group for the value and return the tag name."""
+    transform.add_group({'name': f'group {value}', 'type': 'Adversary', 'xid': value})
+    return value
+
+
+TRANSFORM = IndicatorTransformModel(
+    **{
+        'type': {'default': 'Host'},
+        'value1': {'path': 'indicator'},
+        'xid': {'path': 'indicator'},
+        'tags': [{'value': {'path': 'actor', 'transform': {'for_each': adhoc_group}}}],
+    }
+)
+
+
+class Feed:
+    """A TI dict generator that counts the TI dicts read."""
+
+    def __init__(self, count: int):
+        """Initialize instance properties."""
+        self.count = count
+        self.read = 0
+
+    def __iter__(self) -> Iterator[dict]:
+        """Yield the TI dicts."""
+        for i in range(self.count):
+            self.read += 1
+            yield {'actor': f'actor-{i}', 'indicator': f'host{i}.example.com'}
+
+
+def test_stream_reads_incrementally():
+    """Test that the TI dicts are read as the entities are consumed."""
+    feed = Feed(100)
+    stream = TiTransforms(iter(feed), [TRANSFORM]).stream_batch()
+
+    assert next(stream) == ('indicator', TiTransforms(Feed(1), [TRANSFORM]).batch['indicator'][0])
+    assert next(stream)[0] == 'group'
+    assert feed.read == 1
+    assert sum(1 for _ in stream) == 198
+    assert feed.read == 100
+
+
+def test_stream_jsonl_matches_batch(tmp_path: Path):
+    """Test that streaming a JSON lines file returns the entities of the batch property."""
+    fqfn = tmp_path / 'feed.jsonl'
+    fqfn.write_text(''.join(f'{json.dumps(ti_dict)}\n' for ti_dict in Feed(20)))
+
+    batch = TiTransforms(list(Feed(20)), [TRANSFORM]).batch
+    streamed: dict[str, list] = {'group': [], 'indicator': []}
+    for section, data in TiTransforms(read_jsonl(fqfn), [TRANSFORM]).stream_batch():
+        streamed[section].append(data)
+    assert streamed == batch
+
+    parallel = list(TiTransforms(read_jsonl(fqfn), [TRANSFORM], processes=2).stream_batch())
+    assert parallel == list(TiTransforms(read_jsonl(fqfn), [TRANSFORM]).stream_batch())
+
+
+class RecordingBatch:
+    """A batch writer stand-in that records the added entities."""
+
+    def __init__(self):
+        """Initialize instance properties."""
+        self.entities: dict[str, list] = {'association': [], 'group': [], 'indicator': []}
+
+    def add_association(self, association: dict):
+        """Record an association."""
+        self.entities['association'].append(association)
+
+    def add_group(self, group_data: dict):
+        """Record a group."""
+        self.entities['group'].append(group_data)
+
+    def add_indicator(self, indicator_data: dict):
+        """Record an indicator."""
+        self.entities['indicator'].append(indicator_data)
+
+
+def test_write_batch_matches_batch():
+    """Test that the direct batch sink adds the entities of the batch property."""
+    batch = RecordingBatch()
+    count = TiTransforms(Feed(20), [TRANSFORM]).write_batch(batch)  # type: ignore
+
+    assert count == 40
+    assert batch.entities == {**TiTransforms(Feed(20), [TRANSFORM]).batch, 'association': []}
@@ -0,0 +1,60 @@
+"""Tests for the compiled transform plan."""
+
+# first-party
+from tcex.api.tc.ti_transform import TiTransforms
+from tcex.api.tc.ti_transform.model import IndicatorTransformModel
+from tcex.api.tc.ti_transform.transform_plan import TransformPlan
+
+
+def transform(callback, **kwargs) -> IndicatorTransformModel:
+    """Return an indicator transform with a tag callable.
+
+    Args:
+        callback: The for_each callable of the tag transform.
+        **kwargs: The kwargs of the tag transform.
+    """
+    return IndicatorTransformModel(
+        **{
+            'type': {'default': 'Host'},
+            'value1': {'path': 'indicator'},
+            'xid': {'path': 'id'},
+            'tags': [
+                {
+                    'value': {
+                        'path': 'labels[]',
+                        'transform': {'for_each': callback, 'kwargs': kwargs},
+                    }
+                },
+            ],
+        }
+    )
+
+
+def test_plan_compiled_once():
+    """Test that the paths and callables are compiled when the plan is created."""
+    plan = TransformPlan(transform(str.upper))
+    assert set(plan._expressions) == {'id', 'indicator', 'labels[]'}
+    assert len(plan._callables) == 1
+    assert plan.search('labels[]', {'labels': ['a', 'b']}) == ['a', 'b']
+
+
+def test_plan_shared_by_items():
+    """Test that TiTransforms shares one plan across all TI dicts."""
+
+    def label(value: str, ti_dict: dict, prefix: str = '') -> str:
+        """Return the label with the indicator."""
+        return f'{prefix}{value}:{ti_dict["indicator"]}'
+
+    model = transform(label, prefix='L-')
+    ti_dicts = [
+        {'id': f'id-{i}', 'indicator': f'host{i}.example.com', 'labels': ['x']} for i in range(3)
+    ]
+    transforms = TiTransforms(ti_dicts, [model])
+    batch = transforms.batch
+
+    assert all(t.plan is transforms.plans[0] for t in transforms.transformed_collection)
+    assert [i['tag'] for i in batch['indicator']] == [
+        [{'name': f'L-x:host{i}.example.com'}] for i in range(3)
+    ]
+    # the static kwargs of the transform are not modified by the per item arguments
+    assert model.tags[0].value.transform[0].kwargs == {'prefix': 'L-'}  # type: ignore
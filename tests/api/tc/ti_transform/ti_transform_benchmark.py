@@ -0,0 +1,273 @@
+"""Benchmark of TiTransforms throughput on a synthetic indicator feed.
+
+Usage:
+    python -m tests.api.tc.ti_transform.ti_transform_benchmark --count 100000 --processes 4
+
+The report contains the number of TI dicts transformed per second into batch format (use
+--stream to consume the entities from stream_batch with a generator feed). With --sink, the
+entities are added to a Batch (served by the in-process fake batch API) using the batch property
+and using write_batch, and the traced memory per entity is reported for each pipeline. With
+--columnar, a tabular feed is transformed by TiTransforms (per row) and TiColumnarTransforms.
+"""
+
+# standard library
+import argparse
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+# first-party
+from tcex.api.tc.ti_transform import ProcessingFunctions, TiColumnarTransforms, TiTransforms
+from tcex.api.tc.ti_transform.model import IndicatorTransformModel
+from tcex.api.tc.v2.batch.batch import Batch
+from tests.api.tc.v2.batch.batch_benchmark import FakeBatchAdapter, FakeBatchSession
+
+
+def epoch_to_datetime(value: int) -> str:
+    """Return the epoch value as a TC datetime."""
+    return datetime.fromtimestamp(int(value), tz=UTC).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def label(value: str, ti_dict: dict) -> str:
+    """Return the label prefixed with the feed name (callable with the ti_dict argument)."""
+    return f'{ti_dict["feed"]}: {value}'
+
+
+TRANSFORM = IndicatorTransformModel(
+    **{
+        'type': {
+            'path': 'type',
+            'transform': [{'static_map': {'domain': 'Host', 'ip_address': 'Address'}}],
+        },
+        'value1': {'path': 'indicator'},
+        'xid': {'path': 'id'},
+        'confidence': {
+            'default': 0,
+            'path': 'malicious_confidence',
+            'transform': [{'static_map': {'high': 95, 'medium': 75, 'low': 40}}],
+        },
+        'rating': {
+            'default': 0,
+            'path': 'malicious_confidence',
+            'transform': [{'static_map': {'high': 5, 'medium': 4, 'low': 2}}],
+        },
+        'attributes': [
+            {'type': 'External ID', 'value': {'path': 'id'}},
+            {
+                'type': 'External Date Last Modified',
+                'value': {'path': 'last_updated', 'transform': {'method': epoch_to_datetime}},
+            },
+            {'type': 'Description', 'value': {'path': 'description'}},
+        ],
+        'tags': [
+            {'value': {'path': 'labels[].name', 'transform': {'for_each': label}}},
+            {'value': {'path': 'threat_types[]', 'transform': {'for_each': str.title}}},
+        ],
+        'date_added': {'path': 'published_date'},
+        'last_modified': {'path': 'last_updated'},
+    }
+)
+
+
+functions = ProcessingFunctions(None)
+
+TABULAR_TRANSFORM = IndicatorTransformModel(
+    **{
+        'type': {
+            'path': 'type',
+            'transform': [{'static_map': {'domain': 'Host', 'ip_address': 'Address'}}],
+        },
+        'value1': {'path': 'indicator', 'transform': {'method': functions.to_lowercase}},
+        'xid': {'path': 'id'},
+        'confidence': {
+            'default': 0,
+            'path': 'malicious_confidence',
+            'transform': [{'static_map': {'high': 95, 'medium': 75, 'low': 40}}],
+        },
+        'rating': {
+            'default': 0,
+            'path': 'malicious_confidence',
+            'transform': [{'static_map': {'high': 5, 'medium': 4, 'low': 2}}],
+        },
+        'attributes': [
+            {'type': 'External ID', 'value': {'path': 'id'}},
+            {
+                'type': 'Description',
+                'value': {
+                    'path': 'description',
+                    'transform': {'method': functions.prepend, 'kwargs': {'prefix': 'Feed: '}},
+                },
+            },
+        ],
+        'tags': [
+            {'value': {'path': 'label', 'transform': {'for_each': label}}},
+            {'value': {'path': 'threat_types', 'transform': {'method': functions.split}}},
+        ],
+    }
+)
+
+
+def feed(count: int) -> Iterator[dict]:
+    """Yield a synthetic indicator feed.
+
+    Args:
+        count: The number of TI dicts in the feed.
+    """
+    return (
+        {
+            'description': f'indicator {i} description',
+            'feed': 'benchmark',
+            'id': f'domain_{i}',
+            'indicator': f'host-{i}.example.com',
+            'labels': [{'name': 'KillChain/C2'}, {'name': f'Malware/Family{i % 10}'}],
+            'last_updated': 1_665_008_920 + i,
+            'malicious_confidence': ('high', 'medium', 'low')[i % 3],
+            'published_date': 1_664_913_028 + i,
+            'threat_types': ['criminal', 'targeted'],
+            'type': 'domain',
+        }
+        for i in range(count)
+    )
+
+
+def tabular_feed(count: int) -> dict[str, list]:
+    """Return a synthetic tabular (column-oriented) indicator feed.
+
+    Args:
+        count: The number of rows in the feed.
+    """
+    return {
+        'description': [f'family {i % 10} infrastructure' for i in range(count)],
+        'feed': ['benchmark'] * count,
+        'id': [f'domain_{i}' for i in range(count)],
+        'indicator': [f'HOST-{i}.example.com' for i in range(count)],
+        'label': [f'Malware/Family{i % 10}' for i in range(count)],
+        'malicious_confidence': [('high', 'medium', 'low')[i % 3] for i in range(count)],
+        'threat_types': ['criminal, targeted'] * count,
+        'type': ['domain'] * count,
+    }
+
+
+def run(count: int = 100_000, processes: int = 1, stream: bool = False) -> dict[str, float | int]:
+    """Return the throughput of TiTransforms.batch (or stream_batch) on a feed.
+
+    Args:
+        count: The number of TI dicts in the feed.
+        processes: The number of worker processes.
+        stream: If True, the entities are consumed from stream_batch.
+    """
+    ti_dicts = feed(count) if stream else list(feed(count))
+
+    start = time.perf_counter()
+    transforms = TiTransforms(ti_dicts, [TRANSFORM], processes=processes)
+    if stream:
+        indicators = sum(1 for section, _ in transforms.stream_batch() if section == 'indicator')
+    else:
+        indicators = len(transforms.batch['indicator'])
+    elapsed = time.perf_counter() - start
+
+    return {
+        'elapsed_seconds': round(elapsed, 2),
+        'indicators': indicators,
+        'items_per_second': round(count / elapsed),
+    }
+
+
+def run_columnar(count: int = 100_000) -> dict[str, dict[str, float | int] | bool]:
+    """Return the throughput of TiTransforms and TiColumnarTransforms on a tabular feed.
+
+    Args:
+        count: The number of rows in the feed.
+    """
+    columns = tabular_feed(count)
+    report: dict[str, dict[str, float | int] | bool] = {}
+    batches = []
+    for mode in ('rows', 'columnar'):
+        start = time.perf_counter()
+        if mode == 'rows':
+            ti_dicts = [dict(zip(columns, values)) for values in zip(*columns.values())]
+            batch = TiTransforms(ti_dicts, [TABULAR_TRANSFORM]).batch
+        else:
+            batch = TiColumnarTransforms(columns, [TABULAR_TRANSFORM]).batch
+        elapsed = time.perf_counter() - start
+
+        batches.append(batch)
+        report[mode] = {
+            'elapsed_seconds': round(elapsed, 2),
+            'indicators': len(batch['indicator']),
+            'items_per_second': round(count / elapsed),
+        }
+    report['equal'] = batches[0] == batches[1]
+    return report
+
+
+def run_sink(count: int = 100_000) -> dict[str, dict[str, float | int]]:
+    """Return the traced memory per entity of adding the transformed feed to a Batch.
+
+    * batch - TiTransforms.batch then Batch.add_indicator for each indicator.
+    * write_batch - TiTransforms.write_batch (direct sink).
+
+    Args:
+        count: The number of TI dicts in the feed.
+    """
+    report = {}
+    for pipeline in ('batch', 'write_batch'):
+        ti_dicts = list(feed(count))
+        with tempfile.TemporaryDirectory() as temp_path:
+            inputs = SimpleNamespace(model=SimpleNamespace(tc_temp_path=Path(temp_path)))
+            session = FakeBatchSession(FakeBatchAdapter())
+            batch = Batch(inputs, session, owner='Benchmark')  # type: ignore
+
+            tracemalloc.start()
+            blocks = sys.getallocatedblocks()
+            start = time.perf_counter()
+            transforms = TiTransforms(ti_dicts, [TRANSFORM])
+            if pipeline == 'batch':
+                for indicator in transforms.batch['indicator']:
+                    batch.add_indicator(indicator)
+            else:
+                transforms.write_batch(batch)
+            del transforms
+            elapsed = time.perf_counter() - start
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            entities = len(batch.indicators)
+            report[pipeline] = {
+                'items_per_second': round(count / elapsed),
+                'peak_bytes_per_entity': round(peak / entities),
+                'retained_blocks_per_entity': round(
+                    (sys.getallocatedblocks() - blocks) / entities, 1
+                ),
+                'retained_bytes_per_entity': round(current / entities),
+            }
+            batch.close()
+    return report
+
+
+def main():
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n', 1)[0])
+    parser.add_argument('--count', default=100_000, type=int)
+    parser.add_argument('--processes', default=1, type=int)
+    parser.add_argument('--stream', action='store_true')
+    parser.add_argument('--sink', action='store_true')
+    parser.add_argument('--columnar', action='store_true')
+    args = parser.parse_args()
+    if args.columnar:
+        report = run_columnar(args.count)
+    elif args.sink:
+        report = run_sink(args.count)
+    else:
+        report = run(args.count, args.processes, args.stream)
+    print(json.dumps(report, indent=2))  # noqa: T201
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,425 @@
+"""Batch throughput benchmark using an in-process stand-in for the ThreatConnect batch API.
+
+Usage:
+    python -m tests.api.tc.v2.batch.batch_benchmark --indicators 100000 --groups 1000
+
+The benchmark drives Batch (BatchWriter/BatchSubmit) and BatchCleaner against FakeBatchAdapter,
+a requests transport adapter that implements the /v2/batch endpoints in-process, so that the
+full request encoding is measured without a live ThreatConnect server. The report contains the
+entities/sec, the peak RSS, the bytes serialized/uploaded, and the time spent per phase
+(accumulate, chunk, clean, upload, and poll).
+"""
+
+# standard library
+import argparse
+import contextlib
+import itertools
+import json
+import random
+import re
+import resource
+import tempfile
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from types import SimpleNamespace
+
+# third-party
+from requests import PreparedRequest, Response, Session
+from requests.adapters import BaseAdapter
+
+# first-party
+from tcex.api.tc.v2.batch.batch import Batch
+from tcex.api.tc.v2.batch.batch_cleaner import BatchCleaner
+
+BASE_URL = 'https://tc.benchmark/api'
+
+# attribute types returned to the BatchCleaner (used for truncation)
+ATTRIBUTE_TYPES = {
+    'Description': {'maxSize': 500},
+    'Source': {'maxSize': 100},
+}
+
+# indicator types and value templates used for the synthetic feed
+INDICATOR_TEMPLATES = (
+    ('Address', lambda i: f'10.{(i >> 16) & 255}.{(i >> 8) & 255}.{i & 255}'),
+    ('EmailAddress', lambda i: f'user-{i}@bench.example.com'),
+    ('Host', lambda i: f'host-{i}.bench.example.com'),
+    ('URL', lambda i: f'https://bench.example.com/path/{i}'),
+)
+
+
+class FakeBatchAdapter(BaseAdapter):
+    """In-process stand-in for the ThreatConnect /v2/batch API.
+
+    Batch jobs are processed at a simulated throughput, so the successCount/unprocessCount
+    reported on each status check increase over time (a throughput of 0 completes immediately).
+
+    Args:
+        throughput: The simulated number of entities processed per second.
+        error_rate: The fraction of entities reported as errors.
+        keep_content: If True, the content of each batch job is kept in jobs (for tests).
+    """
+
+    def __init__(
+        self, throughput: float = 0.0, error_rate: float = 0.0, keep_content: bool = False
+    ):
+        """Initialize instance properties."""
+        super().__init__()
+        self.error_rate = error_rate
+        self.keep_content = keep_content
+        self.throughput = throughput
+
+        self._ids = itertools.count(1)
+        self._jobs: dict[int, dict] = {}
+        self._lock = threading.Lock()
+
+        # request stats
+        self.bytes_received = 0
+        self.requests: dict[str, int] = {}
+
+    def close(self):
+        """Close the adapter (nothing to release)."""
+
+    @staticmethod
+    def _multipart(body: bytes, content_type: str) -> dict[str, bytes]:
+        """Return the parts of a multipart/form-data body."""
+        boundary = content_type.split('boundary=', 1)[-1].encode()
+        parts = {}
+        for part in body.split(b'--' + boundary):
+            header, _, data = part.partition(b'\r\n\r\n')
+            name = re.search(rb'name="([^"]+)"', header)
+            if name:
+                parts[name.group(1).decode()] = data[:-2]  # strip the trailing CRLF
+        return parts
+
+    @staticmethod
+    def _response(request: PreparedRequest, data: dict | list, status_code: int = 200) -> Response:
+        """Return a JSON response."""
+        response = Response()
+        response._content = json.dumps(data).encode()
+        response.encoding = 'utf-8'
+        response.headers['Content-Type'] = 'application/json'
+        response.request = request
+        response.status_code = status_code
+        response.url = request.url or ''
+        return response
+
+    def _create_job(self, content: bytes | str | None, batch_id: int | None = None) -> int:
+        """Create a batch job for the uploaded content and return the batch id."""
+        data = json.loads(content or '{}')
+        count = len(data.get('group') or []) + len(data.get('indicator') or [])
+        with self._lock:
+            if batch_id is None:
+                batch_id = next(self._ids)
+            self._jobs[batch_id] = {'count': count, 'start': time.monotonic()}
+            if self.keep_content:
+                self._jobs[batch_id]['content'] = data
+        return batch_id
+
+    @property
+    def contents(self) -> list[dict]:
+        """Return the content of each batch job in batch id order (keep_content only)."""
+        return [job['content'] for _, job in sorted(self._jobs.items()) if 'content' in job]
+
+    def _job_status(self, batch_id: int) -> dict:
+        """Return the batch status of a job at the current time."""
+        job = self._jobs.get(batch_id, {'count': 0, 'start': 0.0})
+        count = job['count']
+        processed = count
+        if self.throughput > 0:
+            processed = min(count, int((time.monotonic() - job['start']) * self.throughput))
+        errors = int(processed * self.error_rate)
+        return {
+            'errorCount': errors,
+            'errorGroupCount': 0,
+            'errorIndicatorCount': errors,
+            'id': batch_id,
+            'status': 'Completed' if processed >= count else 'Running',
+            'successCount': processed - errors,
+            'unprocessCount': count - processed,
+        }
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:  # noqa: ARG002
+        """Handle a request to the batch API."""
+        path = (request.path_url or '').split('?', 1)[0].removeprefix('/api')
+        body = request.body or b''
+        if isinstance(body, str):
+            body = body.encode()
+        with self._lock:
+            self.bytes_received += len(body)
+            key = f'{request.method} ' + re.sub(r'/\d+', '/{id}', path)
+            self.requests[key] = self.requests.get(key, 0) + 1
+
+        if request.method == 'GET' and path == '/v2/types/indicatorTypes':
+            return self._response(request, {'data': {'indicatorType': []}, 'status': 'Success'})
+
+        if request.method == 'POST' and path == '/v2/batch/createAndUpload':
+            parts = self._multipart(body, request.headers.get('Content-Type', ''))
+            batch_id = self._create_job(parts.get('content'))
+            status = {'id': batch_id, 'status': 'Queued'}
+            return self._response(request, {'data': {'batchStatus': status}, 'status': 'Success'})
+
+        if request.method == 'POST' and path == '/v2/batch':
+            with self._lock:
+                batch_id = next(self._ids)
+            return self._response(request, {'data': {'batchId': batch_id}, 'status': 'Success'})
+
+        if match := re.fullmatch(r'/v2/batch/(\d+)', path):
+            batch_id = int(match.group(1))
+            if request.method == 'POST':
+                # submit data for a job created with POST /v2/batch (delete action)
+                self._create_job(body, batch_id)
+                return self._response(request, {'status': 'Queued'})
+            status = self._job_status(batch_id)
+            return self._response(request, {'data': {'batchStatus': status}, 'status': 'Success'})
+
+        if re.fullmatch(r'/v2/batch/\d+/errors', path):
+            return self._response(request, [])
+
+        if path.endswith('/upload'):
+            return self._response(request, {'status': 'Success'})
+
+        return self._response(request, {'message': f'Not found: {path}'}, status_code=404)
+
+
+class FakeBatchSession(Session):
+    """A requests Session for relative ThreatConnect API paths served by FakeBatchAdapter.
+
+    Args:
+        adapter: The fake batch API adapter.
+    """
+
+    def __init__(self, adapter: FakeBatchAdapter):
+        """Initialize instance properties."""
+        super().__init__()
+        self.adapter = adapter
+        self.mount(BASE_URL, adapter)
+
+    def request(self, method, url, *args, **kwargs):  # pylint: disable=arguments-differ
+        """Prepend the base URL to the request path."""
+        return super().request(method, f'{BASE_URL}{url}', *args, **kwargs)
+
+
+def generate_feed(
+    indicators: int = 10_000,
+    groups: int = 100,
+    attributes: int = 2,
+    tags: int = 2,
+    association_ratio: float = 0.5,
+    duplicate_ratio: float = 0.0,
+    seed: int = 1,
+) -> Iterator[tuple[str, dict]]:
+    """Yield a synthetic feed of groups and indicators.
+
+    Args:
+        indicators: The number of indicators.
+        groups: The number of groups.
+        attributes: The number of attributes per entity.
+        tags: The number of tags per entity.
+        association_ratio: The fraction of indicators associated to a group.
+        duplicate_ratio: The fraction of indicators repeated with a new xid (removed by the
+            BatchCleaner).
+        seed: The random seed, so the same feed is generated for each run.
+
+    Yields:
+        tuple: The section (group or indicator) and the entity data.
+    """
+    rand = random.Random(seed)  # nosec
+
+    def entity_extras(index: int) -> dict:
+        extras = {}
+        if attributes:
+            extras['attribute'] = [
+                {
+                    'type': 'Description' if a == 0 else 'Source',
+                    'value': f'benchmark attribute {a} for entity {index} ' * (1 + a % 3),
+                }
+                for a in range(attributes)
+            ]
+        if tags:
+            extras['tag'] = [{'name': f'bench-tag-{rand.randrange(50)}'} for _ in range(tags)]
+        return extras
+
+    for index in range(groups):
+        yield (
+            'group',
+            {
+                'name': f'bench-adversary-{index}',
+                'type': 'Adversary',
+                'xid': f'bench-group-{index}',
+                **entity_extras(index),
+            },
+        )
+
+    for index in range(indicators):
+        type_, template = INDICATOR_TEMPLATES[index % len(INDICATOR_TEMPLATES)]
+        indicator = {
+            'confidence': rand.randrange(100),
+            'rating': rand.randrange(6),
+            'summary': template(index),
+            'type': type_,
+            'xid': f'bench-indicator-{index}',
+            **entity_extras(index),
+        }
+        if groups and rand.random() < association_ratio:
+            indicator['associatedGroups'] = [{'groupXid': f'bench-group-{rand.randrange(groups)}'}]
+        yield 'indicator', indicator
+
+        if rand.random() < duplicate_ratio:
+            yield 'indicator', {**indicator, 'xid': f'bench-indicator-{index}-dup'}
+
+
+def peak_rss_mb() -> float:
+    """Return the peak resident set size of the process in MB."""
+    # ru_maxrss is reported in KB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+class BatchBenchmark:
+    """Run a batch job against the fake batch API and report the time spent per phase.
+
+    Args:
+        adapter: The fake batch API adapter.
+        temp_path: The directory for the batch shelf files.
+        clean: If True, the BatchCleaner is run on each chunk before upload.
+        max_chunk: The max number of entities per chunk.
+        poll: If True, poll each batch job for completion.
+    """
+
+    phases = ('accumulate', 'chunk', 'clean', 'upload', 'poll')
+
+    def __init__(
+        self,
+        adapter: FakeBatchAdapter,
+        temp_path: Path,
+        clean: bool = True,
+        max_chunk: int = 5_000,
+        poll: bool = True,
+    ):
+        """Initialize instance properties."""
+        self.adapter = adapter
+        self.clean = clean
+        self.poll = poll
+
+        inputs = SimpleNamespace(model=SimpleNamespace(tc_temp_path=temp_path))
+        self.batch = Batch(inputs, FakeBatchSession(adapter), owner='Benchmark')  # type: ignore
+        self.batch._batch_max_chunk = max_chunk  # pylint: disable=protected-access
+        self.cleaner = BatchCleaner(
+            fetch_attribute_types=lambda: ATTRIBUTE_TYPES,
+            fetch_mitre_tags=dict,
+            deduplicate_attributes=True,
+            deduplicate_groups=True,
+            deduplicate_indicators=True,
+            truncate_attributes=True,
+        )
+        self.timings = dict.fromkeys(self.phases, 0.0)
+
+    @contextlib.contextmanager
+    def _phase(self, name: str):
+        """Accumulate the time spent in a phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] += time.perf_counter() - start
+
+    def run(self, feed: Iterator[tuple[str, dict]]) -> dict:
+        """Run the benchmark and return the report.
+
+        Args:
+            feed: The (section, data) entities to add to the batch job.
+        """
+        start = time.perf_counter()
+        entities = 0
+        with self._phase('accumulate'):
+            for section, data in feed:
+                if section == 'group':
+                    self.batch.add_group(data)
+                else:
+                    self.batch.add_indicator(data)
+                entities += 1
+
+        bytes_serialized = chunks = 0
+        while True:
+            with self._phase('chunk'):
+                content, encoder = self.batch.data_chunk()
+            if not content.get('group') and not content.get('indicator'):
+                break
+            content.pop('file', None)
+            chunks += 1
+
+            payload = encoder.payload
+            if self.clean:
+                with self._phase('clean'):
+                    content = self.cleaner.clean(content)
+                    payload = json.dumps(content).encode()
+            bytes_serialized += len(payload)
+
+            with self._phase('upload'):
+                batch_status = (
+                    self.batch.submit_create_and_upload(content=content, payload=payload)
+                    .get('data', {})
+                    .get('batchStatus', {})
+                )
+            if self.poll and batch_status.get('id') is not None:
+                with self._phase('poll'):
+                    self.batch.submit_poll(batch_status['id'])
+
+        elapsed = time.perf_counter() - start
+        self.batch.close()
+        return {
+            'bytes_serialized': bytes_serialized,
+            'bytes_uploaded': self.adapter.bytes_received,
+            'chunks': chunks,
+            'elapsed': round(elapsed, 3),
+            'entities': entities,
+            'entities_per_sec': round(entities / elapsed, 1) if elapsed else 0.0,
+            'peak_rss_mb': round(peak_rss_mb(), 1),
+            'phases': {name: round(value, 3) for name, value in self.timings.items()},
+            'poll_stats': self.batch.poll_stats.as_dict(),
+            'requests': dict(sorted(self.adapter.requests.items())),
+        }
+
+
+def main():
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n', 1)[0])
+    parser.add_argument('--indicators', default=10_000, type=int)
+    parser.add_argument('--groups', default=100, type=int)
+    parser.add_argument('--attributes', default=2, type=int)
+    parser.add_argument('--tags', default=2, type=int)
+    parser.add_argument('--association-ratio', default=0.5, type=float)
+    parser.add_argument('--duplicate-ratio', default=0.0, type=float)
+    parser.add_argument('--max-chunk', default=5_000, type=int)
+    parser.add_argument('--throughput', default=0.0, type=float, help='simulated entities/sec')
+    parser.add_argument('--error-rate', default=0.0, type=float)
+    parser.add_argument('--no-clean', action='store_true')
+    parser.add_argument('--no-poll', action='store_true')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_path:
+        benchmark = BatchBenchmark(
+            FakeBatchAdapter(throughput=args.throughput, error_rate=args.error_rate),
+            Path(temp_path),
+            clean=not args.no_clean,
+            max_chunk=args.max_chunk,
+            poll=not args.no_poll,
+        )
+        benchmark.batch.poll_first_check = 0 if args.throughput <= 0 else 1.0
+        report = benchmark.run(
+            generate_feed(
+                indicators=args.indicators,
+                groups=args.groups,
+                attributes=args.attributes,
+                tags=args.tags,
+                association_ratio=args.association_ratio,
+                duplicate_ratio=args.duplicate_ratio,
+            )
+        )
+    print(json.dumps(report, indent=2))  # noqa: T201
+
+
+if __name__ == '__main__':
+    main()
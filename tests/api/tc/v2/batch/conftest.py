@@ -0,0 +1,29 @@
+"""Fixtures for the batch tests."""
+
+# standard library
+from collections.abc import Iterator
+from pathlib import Path
+from types import SimpleNamespace
+
+# third-party
+import pytest
+
+# first-party
+from tcex.api.tc.v2.batch.batch import Batch
+from tests.api.tc.v2.batch.batch_benchmark import FakeBatchAdapter, FakeBatchSession
+
+
+@pytest.fixture
+def batch_api() -> FakeBatchAdapter:
+    """Return the in-process stand-in for the batch API."""
+    return FakeBatchAdapter(keep_content=True)
+
+
+@pytest.fixture
+def batch(batch_api: FakeBatchAdapter, tmp_path: Path) -> Iterator[Batch]:
+    """Return a Batch instance served by the fake batch API."""
+    inputs = SimpleNamespace(model=SimpleNamespace(tc_temp_path=tmp_path))
+    batch = Batch(inputs, FakeBatchSession(batch_api), owner='Test')  # type: ignore
+    batch.poll_first_check = 0
+    yield batch
+    batch.close()
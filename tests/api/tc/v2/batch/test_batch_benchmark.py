@@ -0,0 +1,37 @@
+"""Smoke tests for the batch throughput benchmark."""
+
+# standard library
+from pathlib import Path
+
+# first-party
+from tests.api.tc.v2.batch.batch_benchmark import BatchBenchmark, FakeBatchAdapter, generate_feed
+
+
+def test_benchmark_report(tmp_path: Path):
+    """Test that the benchmark submits every chunk and reports each phase."""
+    adapter = FakeBatchAdapter()
+    benchmark = BatchBenchmark(adapter, tmp_path, max_chunk=100)
+    benchmark.batch.poll_first_check = 0
+    report = benchmark.run(generate_feed(indicators=250, groups=10, duplicate_ratio=0.2))
+
+    chunks = -(-report['entities'] // 100)
+    assert report['entities'] > 260
+    assert report['chunks'] == chunks
+    assert report['requests']['POST /v2/batch/createAndUpload'] == chunks
+    assert report['requests']['GET /v2/batch/{id}'] == chunks
+    assert report['bytes_uploaded'] > report['bytes_serialized'] > 0
+    assert set(report['phases']) == set(BatchBenchmark.phases)
+    assert report['poll_stats']['jobs'] == chunks
+
+
+def test_fake_adapter_progress(tmp_path: Path):
+    """Test that the fake batch API reports progress at the simulated throughput."""
+    adapter = FakeBatchAdapter(throughput=500)
+    benchmark = BatchBenchmark(adapter, tmp_path, clean=False)
+    benchmark.batch.poll_first_check = 0.1
+    report = benchmark.run(generate_feed(indicators=200, groups=0))
+
+    # the job takes ~0.4s, so more than one status check is required
+    assert report['requests']['GET /v2/batch/{id}'] > 1
+    assert report['phases']['clean'] == 0.0
+    assert report['phases']['poll'] > 0.3
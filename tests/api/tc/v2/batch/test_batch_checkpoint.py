@@ -0,0 +1,109 @@
+"""Tests for BatchCheckpoint."""
+
+# standard library
+import json
+from pathlib import Path
+
+# first-party
+from tcex.api.tc.v2.batch.batch_checkpoint import BatchCheckpoint
+
+
+def make_payload(xid: str) -> bytes:
+    """Build an encoded content payload with a single indicator.
+
+    Args:
+        xid: The indicator xid.
+
+    Returns:
+        The encoded content payload.
+    """
+    content = {'group': [], 'indicator': [{'summary': xid, 'type': 'Host', 'xid': xid}]}
+    return json.dumps(content).encode()
+
+
+def test_chunk_lifecycle(tmp_path: Path):
+    """Test that a chunk moves from built to uploaded to completed."""
+    checkpoint = BatchCheckpoint(tmp_path / 'checkpoint')
+    payload = make_payload('i1')
+    payload_hash = checkpoint.hash(payload)
+
+    chunk = checkpoint.record_built(payload, payload_hash)
+    assert checkpoint.load(chunk) == payload
+    assert [c['state'] for c in checkpoint.pending] == ['built']
+
+    checkpoint.record_uploaded(chunk, 123)
+    assert checkpoint.pending[0]['batch_id'] == 123
+
+    checkpoint.record_completed(chunk, {'id': 123, 'status': 'Completed', 'errors': []})
+    assert checkpoint.pending == []
+    assert checkpoint.is_completed(payload_hash)
+    assert not checkpoint.chunk_fqfn(chunk).exists()
+
+
+def test_abandoned(tmp_path: Path):
+    """Test that an abandoned chunk is not pending and its payload is removed."""
+    path = tmp_path / 'checkpoint'
+    checkpoint = BatchCheckpoint(path)
+    payload = make_payload('i1')
+    payload_hash = checkpoint.hash(payload)
+    chunk = checkpoint.record_built(payload, payload_hash)
+
+    checkpoint.record_abandoned(chunk, 'upload-failed')
+    assert checkpoint.pending == []
+    assert not checkpoint.is_completed(payload_hash)
+    assert not checkpoint.chunk_fqfn(chunk).exists()
+    assert BatchCheckpoint(path).pending == []
+
+
+def test_replay(tmp_path: Path):
+    """Test that the chunk state is rebuilt from the journal."""
+    path = tmp_path / 'checkpoint'
+    checkpoint = BatchCheckpoint(path)
+    payloads = [make_payload(f'i{index}') for index in range(3)]
+    chunks = [checkpoint.record_built(p, checkpoint.hash(p)) for p in payloads]
+    checkpoint.record_uploaded(chunks[0], 1)
+    checkpoint.record_completed(chunks[0])
+    checkpoint.record_uploaded(chunks[1], 2)
+
+    replayed = BatchCheckpoint(path)
+    assert replayed.is_completed(replayed.hash(payloads[0]))
+    assert [(c['chunk'], c['state']) for c in replayed.pending] == [
+        (chunks[1], 'uploaded'),
+        (chunks[2], 'built'),
+    ]
+    assert replayed.pending[0]['batch_id'] == 2
+    assert replayed.load(chunks[2]) == payloads[2]
+
+    # new chunk ids continue after the journaled chunks
+    assert replayed.record_built(b'{}', replayed.hash(b'{}')) == chunks[2] + 1
+
+
+def test_replay_truncated_record(tmp_path: Path):
+    """Test that a partially written journal record is ignored."""
+    path = tmp_path / 'checkpoint'
+    checkpoint = BatchCheckpoint(path)
+    payload = make_payload('i1')
+    chunk = checkpoint.record_built(payload, checkpoint.hash(payload))
+    with checkpoint.journal_fqfn.open('a', encoding='utf-8') as fh:
+        fh.write('{"chunk": 1, "event": "uplo')
+
+    replayed = BatchCheckpoint(path)
+    assert [(c['chunk'], c['state']) for c in replayed.pending] == [(chunk, 'built')]
+
+    # records appended after the partial record are not lost
+    replayed.record_uploaded(chunk, 1)
+    assert BatchCheckpoint(path).pending[0]['state'] == 'uploaded'
+
+
+def test_clear(tmp_path: Path):
+    """Test that clear removes the journal and payloads."""
+    path = tmp_path / 'checkpoint'
+    checkpoint = BatchCheckpoint(path)
+    payload = make_payload('i1')
+    checkpoint.record_built(payload, checkpoint.hash(payload))
+    checkpoint.clear()
+    assert not path.exists()
+    assert checkpoint.pending == []
+
+    # the checkpoint can still be used after clear
+    assert checkpoint.record_built(payload, checkpoint.hash(payload)) == 1
@@ -0,0 +1,98 @@
+"""Tests for BatchChunkEncoder."""
+
+# standard library
+import json
+from typing import Any
+
+# third-party
+import pytest
+
+# first-party
+from tcex.api.tc.v2.batch.batch_chunk_encoder import BatchChunkEncoder
+
+
+def make_content(
+    groups: list[dict[str, Any]] | None = None,
+    indicators: list[dict[str, Any]] | None = None,
+    associations: list[dict[str, Any]] | None = None,
+) -> dict[str, list[dict[str, Any]]]:
+    """Build a batch content dictionary in the same section order as Batch.data.
+
+    Args:
+        groups: List of group dicts.
+        indicators: List of indicator dicts.
+        associations: List of association dicts.
+
+    Returns:
+        A dict with ``group``, ``indicator``, and ``association`` keys.
+    """
+    return {
+        'group': groups or [],
+        'indicator': indicators or [],
+        'association': associations or [],
+    }
+
+
+def encode_content(content: dict[str, list[dict[str, Any]]]) -> BatchChunkEncoder:
+    """Add every entity in the content dict to a new encoder.
+
+    Args:
+        content: The batch content dictionary.
+
+    Returns:
+        The populated encoder.
+    """
+    encoder = BatchChunkEncoder()
+    for section, items in content.items():
+        for item in items:
+            encoder.add(section, item)
+    return encoder
+
+
+@pytest.mark.parametrize(
+    'content',
+    [
+        make_content(),
+        make_content(indicators=[{'summary': '1.1.1.1', 'type': 'Address', 'xid': 'a'}]),
+        make_content(
+            groups=[
+                {'name': 'adversary', 'type': 'Adversary', 'xid': 'g1'},
+                {'name': 'snowman ☃', 'type': 'Campaign', 'xid': 'g2'},
+            ],
+            indicators=[
+                {'summary': '1.1.1.1', 'type': 'Address', 'rating': 5.0, 'xid': 'i1'},
+                {'summary': 'example.com', 'type': 'Host', 'tag': [{'name': 'x'}], 'xid': 'i2'},
+            ],
+            associations=[{'associationType': 'Adversary', 'ref_1': 'g1', 'ref_2': 'i1'}],
+        ),
+    ],
+    ids=['empty', 'single-indicator', 'all-sections'],
+)
+def test_payload_matches_json_dumps(content: dict[str, list[dict[str, Any]]]) -> None:
+    """Verify the assembled payload is identical to serializing the whole content dict.
+
+    Args:
+        content: The batch content dictionary.
+    """
+    encoder = encode_content(content)
+    expected = json.dumps(content).encode()
+
+    assert encoder.payload == expected
+    assert encoder.size == len(expected)
+    assert len(encoder) == sum(len(items) for items in content.values())
+
+
+def test_size_tracks_each_add() -> None:
+    """Verify the size is exact after every add, not only once the chunk is complete."""
+    content = make_content()
+    encoder = BatchChunkEncoder()
+    for index in range(25):
+        item = {'summary': f'10.0.0.{index}', 'type': 'Address', 'xid': str(index)}
+        added = encoder.add('indicator', item)
+        content['indicator'].append(item)
+
+        assert encoder.size == len(json.dumps(content).encode())
+        assert added == len(json.dumps(item)) + (2 if index > 0 else 0)
+
+    assert encoder.count('indicator') == 25
+    assert encoder.count('group') == 0
@@ -0,0 +1,133 @@
+"""Tests for BatchChunkPlanner."""
+
+# standard library
+from typing import Any
+
+# first-party
+from tcex.api.tc.v2.batch.association import Association
+from tcex.api.tc.v2.batch.batch_chunk_planner import BatchChunkPlan, BatchChunkPlanner
+
+
+def make_group(xid: str, *associated: str) -> dict[str, Any]:
+    """Build a group dict with optional group associations.
+
+    Args:
+        xid: The group xid.
+        *associated: The xids of associated groups.
+
+    Returns:
+        A dict representing a batch group.
+    """
+    group: dict[str, Any] = {'name': xid, 'type': 'Adversary', 'xid': xid}
+    if associated:
+        group['associatedGroupXid'] = list(associated)
+    return group
+
+
+def make_indicator(xid: str, *groups: str) -> dict[str, Any]:
+    """Build an indicator dict with optional group associations.
+
+    Args:
+        xid: The indicator xid.
+        *groups: The xids of associated groups.
+
+    Returns:
+        A dict representing a batch indicator.
+    """
+    indicator: dict[str, Any] = {'summary': xid, 'type': 'Host', 'xid': xid}
+    if groups:
+        indicator['associatedGroups'] = [{'groupXid': group} for group in groups]
+    return indicator
+
+
+def chunk_of(plan: BatchChunkPlan) -> dict[str, int]:
+    """Return a mapping of xid to chunk index.
+
+    Args:
+        plan: The chunk plan.
+
+    Returns:
+        A dict mapping each group/indicator xid to the index of its chunk.
+    """
+    return {
+        key: index
+        for index, chunk in enumerate(plan.chunks)
+        for section, key in chunk
+        if section != 'association'
+    }
+
+
+def test_components_kept_together():
+    """Test that associated entities are planned into the same chunk."""
+    planner = BatchChunkPlanner(max_chunk=4, max_size=1_000_000)
+    planner.add_group('g1', make_group('g1'))
+    planner.add_group('g2', make_group('g2'))
+    planner.add_indicator('i1', make_indicator('i1'))
+    planner.add_indicator('i2', make_indicator('i2', 'g1'))
+    planner.add_indicator('i3', make_indicator('i3'))
+    planner.add_indicator('i4', make_indicator('i4', 'g2'))
+    planner.add_association(Association(ref_1='i1', ref_2='g2', type_1='Host', type_2='Adversary'))
+
+    plan = planner.plan()
+    chunks = chunk_of(plan)
+    assert chunks['g1'] == chunks['i2']
+    assert chunks['g2'] == chunks['i4'] == chunks['i1']
+    assert plan.report['refs_cross_chunk'] == 0
+    assert plan.report['components'] == 3
+    assert sum(len(chunk) for chunk in plan.chunks) == 7
+    assert all(len(chunk) <= 4 for chunk in plan.chunks)
+
+
+def test_external_references_ignored():
+    """Test that references to xids outside of the batch job are ignored."""
+    planner = BatchChunkPlanner(max_chunk=10, max_size=1_000_000)
+    planner.add_indicator('i1', make_indicator('i1', 'existing-group'))
+    plan = planner.plan()
+    assert plan.report['refs_total'] == 0
+    assert len(plan) == 1
+
+
+def test_section_order_within_chunk():
+    """Test that groups are ordered ahead of indicators and associations in a chunk."""
+    planner = BatchChunkPlanner(max_chunk=10, max_size=1_000_000)
+    planner.add_indicator('i1', make_indicator('i1', 'g1'))
+    planner.add_association(Association(ref_1='i1', ref_2='g1'))
+    planner.add_group('g1', make_group('g1'))
+    plan = planner.plan()
+    assert [section for section, _ in plan.chunks[0]] == ['group', 'indicator', 'association']
+
+
+def test_oversized_component_split_groups_first():
+    """Test that a component larger than a chunk is split with groups first."""
+    planner = BatchChunkPlanner(max_chunk=3, max_size=1_000_000)
+    for index in range(5):
+        planner.add_indicator(f'i{index}', make_indicator(f'i{index}', 'g1'))
+    planner.add_group('g1', make_group('g1', 'g2'))
+    planner.add_group('g2', make_group('g2'))
+
+    plan = planner.plan()
+    chunks = chunk_of(plan)
+    assert chunks['g1'] == chunks['g2'] == 0
+    assert plan.report['components_split'] == 1
+    assert plan.report['refs_forward'] == 0
+    assert plan.report['refs_cross_chunk'] == 4
+    assert all(len(chunk) <= 3 for chunk in plan.chunks)
+
+
+def test_max_size_respected():
+    """Test that the max chunk size is respected."""
+    planner = BatchChunkPlanner(max_chunk=1_000, max_size=300)
+    for index in range(10):
+        planner.add_indicator(f'i{index}', make_indicator(f'i{index}'))
+    plan = planner.plan()
+    assert plan.report['max_chunk_bytes'] <= 300
+    assert len(plan) > 1
+
+
+def test_duplicate_xid_planned_once():
+    """Test that a duplicate xid is only planned once."""
+    planner = BatchChunkPlanner(max_chunk=10, max_size=1_000_000)
+    planner.add_group('g1', make_group('g1'))
+    planner.add_group('g1', make_group('g1'))
+    plan = planner.plan()
+    assert plan.report['entities'] == 1
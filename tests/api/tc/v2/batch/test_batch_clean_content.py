@@ -13,7 +13,9 @@ from deepdiff.diff import DeepDiff
 
 # first-party
 from tcex import TcEx
+from tcex.api.tc.v2.batch.batch import Batch
 from tcex.api.tc.v2.batch.batch_cleaner import BatchCleaner
+from tests.api.tc.v2.batch.batch_benchmark import FakeBatchAdapter
 
 # ---------------------------------------------------------------------------
 # Test hashes (valid lengths: md5=32, sha1=40, sha256=64)
@@ -1148,6 +1150,102 @@ def test_normalize_tags_noop_when_both_flags_disabled() -> None:
     assert tags[1]['name'] == '11'
 
 
+# ---------------------------------------------------------------------------
+# Incremental index (index_add / index_match / merge)
+# ---------------------------------------------------------------------------
+def test_incremental_dedup_indicators_across_chunks(batch: Batch) -> None:
+    """Verify duplicates are merged into the stored item regardless of chunk boundaries."""
+    batch.incremental_cleaner = batch.cleaner(deduplicate_indicators=True)
+    for i in range(10):
+        batch.add_indicator(
+            make_indicator('1.1.1.1', xid=f'x{i}', rating=i % 5, tag=[{'name': f't{i % 2}'}])
+        )
+        batch.add_indicator(make_indicator(f'2.2.2.{i}', xid=f'y{i}'))
+
+    assert len(batch.indicators) == 11
+    assert batch.indicators['x0']['rating'] == 4
+    assert batch.indicators['x0']['tag'] == [{'name': 't0'}, {'name': 't1'}]
+
+
+def test_incremental_file_hash_reindex(batch: Batch) -> None:
+    """Verify combined File hashes are added to the index after a merge."""
+    batch.incremental_cleaner = batch.cleaner(deduplicate_indicators=True)
+    batch.add_indicator(make_file_indicator(MD5, xid='f1'))
+    batch.add_indicator(make_file_indicator(f'{MD5} : {SHA1}', xid='f2'))
+    stored = batch.add_indicator(make_file_indicator(SHA1, xid='f3'))
+
+    assert list(batch.indicators) == ['f1']
+    assert stored is batch.indicators['f1']
+    assert stored['summary'] == f'{MD5} : {SHA1}'
+
+
+def test_incremental_dedup_groups_by_xid(batch: Batch) -> None:
+    """Verify groups with the same xid are merged when deduplicate_groups is enabled."""
+    batch.incremental_cleaner = batch.cleaner(deduplicate_groups=True)
+    batch.add_group(make_group('g', xid='g1', tag=[{'name': 'a'}]))
+    batch.add_group(make_group('g', xid='g1', tag=[{'name': 'b'}]))
+    assert batch.groups['g1']['tag'] == [{'name': 'a'}, {'name': 'b'}]
+
+
+def test_incremental_merge_into_shelf(batch: Batch) -> None:
+    """Verify a duplicate of a spilled entity is merged and written back to the shelf."""
+    batch.incremental_cleaner = batch.cleaner(deduplicate_indicators=True)
+    batch.add_indicator(make_indicator('1.1.1.1', xid='x1', tag=[{'name': 'a'}]))
+    batch.spill()
+    assert 'x1' not in batch.indicators
+
+    stored = batch.add_indicator(make_indicator('1.1.1.1', xid='x2', tag=[{'name': 'b'}]))
+
+    assert stored['xid'] == 'x1'
+    assert not batch.indicators
+    assert batch.indicators_shelf['x1']['tag'] == [{'name': 'a'}, {'name': 'b'}]
+
+
+def test_incremental_replace_submitted(batch: Batch, batch_api: FakeBatchAdapter) -> None:
+    """Verify a duplicate of a submitted entity replaces it in the index."""
+    batch.incremental_cleaner = batch.cleaner(deduplicate_indicators=True)
+    batch.add_indicator(make_indicator('1.1.1.1', xid='x1', tag=[{'name': 'a'}]))
+    batch.submit_all(poll=False)
+
+    stored = batch.add_indicator(make_indicator('1.1.1.1', xid='x2', tag=[{'name': 'b'}]))
+    batch.add_indicator(make_indicator('1.1.1.1', xid='x3', tag=[{'name': 'c'}]))
+    assert stored is batch.indicators['x2']
+    batch.submit_all(poll=False)
+
+    assert [
+        (i['xid'], i['tag']) for content in batch_api.contents for i in content['indicator']
+    ] == [('x1', [{'name': 'a'}]), ('x2', [{'name': 'b'}, {'name': 'c'}])]
+
+
+def test_incremental_disabled_flags_do_not_index() -> None:
+    """Verify nothing is indexed when the dedup flags are disabled."""
+    cleaner = _make_cleaner()
+    item = make_indicator('1.1.1.1', xid='x1')
+    cleaner.index_add(item, 'indicator', 'x1')
+    assert cleaner.index_match(item, 'indicator') is None
+
+    cleaner = _make_cleaner(deduplicate_indicators=True)
+    cleaner.index_add(item, 'indicator', 'x1')
+    cleaner.index_clear()
+    assert cleaner.index_match(item, 'indicator') is None
+
+
+def test_incremental_merge_cleans_attributes() -> None:
+    """Verify merged attributes are deduplicated and truncated immediately."""
+    cleaner = _make_cleaner(
+        fetch_attribute_types=lambda: ATTRIBUTE_CONFIG,
+        deduplicate_indicators=True,
+        deduplicate_attributes=True,
+        truncate_attributes=True,
+    )
+    existing = make_indicator('1.1.1.1', xid='x1', attribute=make_attributes(('Source', 'a')))
+    incoming = make_indicator(
+        '1.1.1.1', xid='x2', attribute=make_attributes(('Source', 'a'), ('Source', 'b' * 30))
+    )
+    cleaner.merge(incoming, existing, 'indicator')
+    assert [a['value'] for a in existing['attribute']] == ['a', 'b' * 17 + '...']
+
+
 # ---------------------------------------------------------------------------
 # E2E - batch_data.json
 # ---------------------------------------------------------------------------
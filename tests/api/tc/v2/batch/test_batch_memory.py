@@ -0,0 +1,102 @@
+"""Tests for the memory footprint of batch Group and Indicator objects."""
+
+# standard library
+import gc
+import tracemalloc
+from collections.abc import Callable
+
+# first-party
+from tcex.api.tc.v2.batch.group import Adversary, Group
+from tcex.api.tc.v2.batch.indicator import Address, Indicator
+
+# upper bound on the retained bytes of a minimal entity relative to a plain dict with the same
+# data (~1.4x, the per-instance Util and eager lists were ~2.3x)
+MAX_RATIO_TO_DICT = 1.75
+
+
+def bytes_per_entity(factory: Callable[[int], object], count: int = 5_000) -> float:
+    """Return the average number of bytes retained per entity.
+
+    Args:
+        factory: A callable that returns a new entity for the provided index.
+        count: The number of entities to create.
+
+    Returns:
+        The average number of traced bytes per entity.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        entities = [factory(i) for i in range(count)]
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert len(entities) == count
+    return current / count
+
+
+def read_data(entity: Group | Indicator) -> Group | Indicator:
+    """Return the entity after reading the batch data."""
+    _ = entity.data
+    return entity
+
+
+def test_group_bytes_per_entity():
+    """Test that a minimal group stays close to the size of its data."""
+    size = bytes_per_entity(lambda i: Adversary(f'adversary-{i}', xid=f'g-{i}'))
+    baseline = bytes_per_entity(
+        lambda i: {'name': f'adversary-{i}', 'type': 'Adversary', 'xid': f'g-{i}'}
+    )
+    assert size < baseline * MAX_RATIO_TO_DICT, f'{size:.0f} vs {baseline:.0f} bytes per group'
+
+
+def test_group_lazy_lists():
+    """Test that group lists are only created on first use."""
+    size = bytes_per_entity(lambda i: Adversary(f'adversary-{i}', xid=f'g-{i}'))
+    read = bytes_per_entity(lambda i: read_data(Adversary(f'adversary-{i}', xid=f'g-{i}')))
+    assert read <= size * 1.05, f'{read:.0f} vs {size:.0f} bytes per group'
+
+    group = Adversary('adversary', xid='g-1')
+    assert set(group.data) == {'name', 'type', 'xid'}
+
+    group.tag('tag-1')
+    assert group.data['tag'] == [{'name': 'tag-1'}]
+
+
+def test_indicator_bytes_per_entity():
+    """Test that a minimal indicator stays close to the size of its data."""
+    size = bytes_per_entity(lambda i: Address(f'10.0.{i // 256}.{i % 256}', xid=f'i-{i}'))
+    baseline = bytes_per_entity(
+        lambda i: {'summary': f'10.0.{i // 256}.{i % 256}', 'type': 'Address', 'xid': f'i-{i}'}
+    )
+    assert size < baseline * MAX_RATIO_TO_DICT, f'{size:.0f} vs {baseline:.0f} bytes per indicator'
+
+
+def test_indicator_lazy_lists():
+    """Test that indicator lists are only created on first use."""
+    size = bytes_per_entity(lambda i: Address(f'10.0.{i // 256}.{i % 256}', xid=f'i-{i}'))
+    read = bytes_per_entity(
+        lambda i: read_data(Address(f'10.0.{i // 256}.{i % 256}', xid=f'i-{i}'))
+    )
+    assert read <= size * 1.05, f'{read:.0f} vs {size:.0f} bytes per indicator'
+
+    indicator = Address('10.0.0.1', xid='i-1')
+    assert set(indicator.data) == {'summary', 'type', 'xid'}
+
+    indicator.attribute('Description', 'description')
+    assert indicator.data['attribute'] == [{'type': 'Description', 'value': 'description'}]
+
+
+def test_shared_class_state():
+    """Test that the Util instance is shared across instances."""
+    indicator_1 = Address('10.0.0.1')
+    indicator_2 = Address('10.0.0.2')
+    assert indicator_1.util is indicator_2.util is Indicator.util
+
+    group_1 = Adversary('adversary-1')
+    group_2 = Adversary('adversary-2')
+    assert group_1.util is group_2.util is Group.util
+
+    # type strings are interned so all entities reference the same string object
+    assert indicator_1.type is indicator_2.type
+    assert group_1.type is group_2.type
@@ -0,0 +1,175 @@
+"""Tests for BatchPollEstimator and BatchPollStats."""
+
+# standard library
+import json
+import time
+
+# third-party
+import pytest
+
+# first-party
+from tcex.api.tc.v2.batch.batch import Batch
+from tcex.api.tc.v2.batch.batch_poll import BatchPollEstimator, BatchPollStats
+from tests.api.tc.v2.batch.batch_benchmark import FakeBatchAdapter
+
+
+def make_status(success: int = 0, error: int = 0, unprocessed: int | None = None) -> dict:
+    """Build a batchStatus dict.
+
+    Args:
+        success: The successCount value.
+        error: The errorCount value.
+        unprocessed: The unprocessCount value (omitted when None).
+
+    Returns:
+        A batchStatus dict.
+    """
+    status = {'errorCount': error, 'status': 'Running', 'successCount': success}
+    if unprocessed is not None:
+        status['unprocessCount'] = unprocessed
+    return status
+
+
+def test_first_interval_early_check():
+    """Test that an explicit first check overrides the estimate."""
+    estimator = BatchPollEstimator(count=100_000, throughput=100.0)
+    assert estimator.first_interval(0.5) == 0.5
+
+
+def test_first_interval_from_throughput():
+    """Test that the first interval uses the throughput of previous jobs."""
+    estimator = BatchPollEstimator(count=500, throughput=100.0, interval_min=1, interval_max=20)
+    assert estimator.first_interval() == pytest.approx(5.0)
+
+    # clamped to the max interval
+    estimator = BatchPollEstimator(count=500_000, throughput=100.0, interval_max=20)
+    assert estimator.first_interval() == 20
+
+
+def test_first_interval_early_check_learned():
+    """Test that the early check is used unless the job is estimated to take longer."""
+    estimator = BatchPollEstimator(count=50, throughput=100.0, interval_min=1)
+    assert estimator.first_interval(early_check=0) == 0
+
+    estimator = BatchPollEstimator(count=500, throughput=100.0, interval_min=1)
+    assert estimator.first_interval(early_check=1) == pytest.approx(5.0)
+
+    # no learned throughput
+    estimator = BatchPollEstimator(count=500, retry_seconds=5)
+    assert estimator.first_interval(early_check=1) == 1
+
+
+def test_first_interval_default():
+    """Test that the first interval falls back to the retry seconds."""
+    estimator = BatchPollEstimator(retry_seconds=5)
+    assert estimator.first_interval() == 5
+
+
+def test_next_interval_back_off_without_progress():
+    """Test that the linear back off is used when no progress is reported."""
+    estimator = BatchPollEstimator(retry_seconds=5, back_off=2.5, interval_max=20)
+    estimator.update({'status': 'Running'}, now=1.0)
+    assert estimator.next_interval() == pytest.approx(7.5)
+    estimator.update({'status': 'Running'}, now=9.0)
+    assert estimator.next_interval() == pytest.approx(10.0)
+    for now in range(10, 20):
+        estimator.update({'status': 'Running'}, now=float(now))
+    assert estimator.next_interval() == 20
+
+
+def test_next_interval_from_progress():
+    """Test that the interval is estimated from the server reported progress."""
+    estimator = BatchPollEstimator(interval_min=1, interval_max=60)
+    estimator.update(make_status(success=100, unprocessed=900), now=0.0)
+    estimator.update(make_status(success=250, error=50, unprocessed=700), now=2.0)
+
+    # 200 entities in 2 seconds with 700 remaining
+    assert estimator.rate == pytest.approx(100.0)
+    assert estimator.remaining_time == pytest.approx(7.0)
+    assert estimator.next_interval() == pytest.approx(7.0)
+
+
+def test_job_count():
+    """Test the job count from the batch status and the fallback count."""
+    estimator = BatchPollEstimator(count=10)
+    assert estimator.job_count(make_status(success=5, error=2, unprocessed=1)) == 8
+    assert estimator.job_count({'status': 'Completed'}) == 10
+
+
+def test_wasted_time():
+    """Test the wasted time estimate is bounded by the last interval."""
+    estimator = BatchPollEstimator(interval_min=1, interval_max=60)
+    estimator.update(make_status(success=100, unprocessed=100), now=0.0)
+    estimator.update(make_status(success=200, unprocessed=100), now=1.0)
+    interval = estimator.next_interval()
+    assert interval == pytest.approx(1.0)
+
+    # job expected to complete at 2.0, completed status received at 2.0
+    assert estimator.wasted_time(now=2.0) == pytest.approx(0.0)
+    # bounded by the last interval
+    assert estimator.wasted_time(now=10.0) == pytest.approx(1.0)
+
+    # without progress information half of the last interval is used
+    estimator = BatchPollEstimator()
+    estimator.first_interval(4)
+    assert estimator.wasted_time(now=4.0) == pytest.approx(2.0)
+
+
+def test_poll_stats():
+    """Test the poll stats accumulate and smooth the throughput."""
+    stats = BatchPollStats()
+    stats.record_poll(1.0)
+    stats.record_poll(2.5)
+    stats.record_job(count=1_000, elapsed=11.0, wasted=1.0)
+    assert stats.as_dict() == {
+        'calls': 2,
+        'jobs': 1,
+        'sleep_time': 3.5,
+        'throughput': 100.0,
+        'wasted_sleep_time': 1.0,
+    }
+
+    stats.record_job(count=2_000, elapsed=10.0, wasted=0.0)
+    assert stats.throughput == pytest.approx(0.3 * 200 + 0.7 * 100)
+    assert stats.jobs == 2
+
+
+def test_rate_from_start_time():
+    """Test that the rate is measured on the first status check when the start is known."""
+    estimator = BatchPollEstimator(interval_min=0.5, interval_max=60, start=10.0)
+    estimator.update(make_status(success=50, unprocessed=250), now=10.5)
+    assert estimator.rate == pytest.approx(100.0)
+    assert estimator.next_interval() == pytest.approx(2.5)
+
+
+def test_poll_first_interval_learned(
+    batch: Batch, batch_api: FakeBatchAdapter, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that the first status check uses the learned throughput once it is known."""
+    clock = [0.0]
+    sleeps: list[float] = []
+
+    def sleep(seconds: float):
+        """Record the sleep and advance the clock."""
+        sleeps.append(seconds)
+        clock[0] += seconds
+
+    monkeypatch.setattr(time, 'monotonic', lambda: clock[0])
+    monkeypatch.setattr(time, 'sleep', sleep)
+    batch_api.throughput = 100.0
+    batch.poll_first_check = 1.0
+
+    def create_job(count: int) -> int:
+        """Create a batch job with count indicators and return the batch id."""
+        content = json.dumps({'indicator': [{}] * count})
+        return batch_api._create_job(content)  # pylint: disable=protected-access
+
+    # the first job is checked early, then the job completes after 5 seconds
+    batch.poll(create_job(500), count=500)
+    assert sleeps == [1.0, pytest.approx(4.0)]
+    assert batch.poll_stats.throughput == pytest.approx(100.0)
+
+    # the second job is first checked when it is estimated to complete
+    sleeps.clear()
+    batch.poll(create_job(300), count=300)
+    assert sleeps == [pytest.approx(3.0)]
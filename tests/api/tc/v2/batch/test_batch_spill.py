@@ -0,0 +1,39 @@
+"""Tests for the memory budget spilling of Batch."""
+
+# first-party
+from tcex.api.tc.v2.batch.batch import Batch
+from tests.api.tc.v2.batch.batch_benchmark import FakeBatchAdapter
+
+
+def test_spill_keeps_added_entity(batch: Batch, batch_api: FakeBatchAdapter):
+    """Test that the entity that was just added is kept in memory and can be updated."""
+    batch.memory_budget = 1
+
+    group = batch.adversary('adversary-1', xid='g-1')
+    indicator = batch.address('10.0.0.1', xid='i-1')
+    indicator.tag('tag-1')
+
+    assert list(batch.indicators) == ['i-1']
+    assert not batch.groups
+    assert batch.groups_shelf['g-1'].data == group.data
+
+    batch.submit_all(poll=False)
+    (content,) = batch_api.contents
+    assert content['indicator'][0]['tag'] == [{'name': 'tag-1'}]
+    assert content['group'][0]['xid'] == 'g-1'
+
+
+def test_spill_oldest_first(batch: Batch):
+    """Test that the oldest entities are spilled across groups and indicators."""
+    batch.memory_budget = 1_000_000_000
+    batch.address('10.0.0.1', xid='i-1')
+    batch.adversary('adversary-1', xid='g-1')
+    batch.address('10.0.0.2', xid='i-2')
+    batch.adversary('adversary-2', xid='g-2')
+
+    batch.spill(2)
+
+    assert list(batch.indicators) == ['i-2']
+    assert list(batch.groups) == ['g-2']
+    assert 'i-1' in batch.indicators_shelf
+    assert 'g-1' in batch.groups_shelf
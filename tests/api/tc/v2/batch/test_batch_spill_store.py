@@ -0,0 +1,106 @@
+"""Tests for BatchSpillStore."""
+
+# standard library
+from pathlib import Path
+
+# first-party
+from tcex.api.tc.v2.batch.batch_spill_store import BatchSpillStore, popitems
+
+
+def make_store(tmp_path: Path, count: int = 0, batch_size: int = 10) -> BatchSpillStore:
+    """Return a spill store populated with indicator dicts.
+
+    Args:
+        tmp_path: The pytest temporary directory.
+        count: The number of indicators to add.
+        batch_size: The number of writes to buffer before committing.
+
+    Returns:
+        The populated store.
+    """
+    store = BatchSpillStore(tmp_path / 'indicators', batch_size=batch_size)
+    for index in range(count):
+        store[f'xid-{index}'] = {'summary': f'10.0.0.{index}', 'type': 'Address'}
+    return store
+
+
+def test_mapping_interface(tmp_path: Path) -> None:
+    """Verify the store behaves like the shelf it replaces."""
+    store = make_store(tmp_path, count=25)
+
+    assert len(store) == 25
+    assert 'xid-3' in store
+    assert 'xid-99' not in store
+    assert store['xid-3'] == {'summary': '10.0.0.3', 'type': 'Address'}
+    assert store.get('xid-99') is None
+
+    # replacing an entity keeps a single entry
+    store['xid-3'] = {'summary': 'updated', 'type': 'Address'}
+    assert store['xid-3']['summary'] == 'updated'
+    assert len(store) == 25
+
+    del store['xid-3']
+    assert 'xid-3' not in store
+    assert len(store) == 24
+    store.close()
+
+
+def test_insertion_order_survives_update(tmp_path: Path) -> None:
+    """Verify entities are returned in insertion order, even after being replaced."""
+    store = make_store(tmp_path, count=15, batch_size=4)
+    store['xid-0'] = {'summary': 'updated', 'type': 'Address'}
+
+    assert list(store) == [f'xid-{index}' for index in range(15)]
+    store.close()
+
+
+def test_popitems_removes_only_consumed(tmp_path: Path) -> None:
+    """Verify popitems removes consumed entities, including when the consumer stops early."""
+    store = make_store(tmp_path, count=30, batch_size=7)
+
+    items = popitems(store)
+    consumed = [next(items)[0] for _ in range(12)]
+    items.close()
+
+    assert consumed == [f'xid-{index}' for index in range(12)]
+    assert len(store) == 18
+    assert [xid for xid, _ in popitems(store)] == [f'xid-{index}' for index in range(12, 30)]
+    assert len(store) == 0
+    store.close()
+
+
+def test_popitems_dict() -> None:
+    """Verify popitems works for the in-memory dict containers."""
+    container = {f'xid-{index}': {'summary': str(index)} for index in range(5)}
+
+    assert [xid for xid, _ in popitems(container)] == [f'xid-{index}' for index in range(5)]
+    assert not container
+
+
+def test_delete_many_and_compact(tmp_path: Path) -> None:
+    """Verify bulk delete removes pending and committed entities."""
+    store = make_store(tmp_path, count=23, batch_size=10)
+    store.delete_many([f'xid-{index}' for index in range(0, 23, 2)] + ['missing'])
+    store.compact()
+
+    assert list(store) == [f'xid-{index}' for index in range(1, 23, 2)]
+    store.close()
+
+
+def test_delete_after_overwrite(tmp_path: Path) -> None:
+    """Verify deleting a replaced entity removes the committed value too."""
+    store = make_store(tmp_path)
+    store['a'] = {'v': 1}
+    store['b'] = {'v': 1}
+    store.flush()
+    store['a'] = {'v': 2}
+    store['b'] = {'v': 2}
+
+    del store['a']
+    store.delete_many(['b'])
+
+    assert 'a' not in store
+    assert 'b' not in store
+    assert store.get('a') is None
+    assert len(store) == 0
+    store.close()
@@ -0,0 +1,189 @@
+"""Tests for the Document/Report file uploads of the batch submit."""
+
+# standard library
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+# third-party
+import pytest
+from requests import PreparedRequest, Response
+
+# first-party
+from tcex.api.tc.v2.batch.batch import Batch
+from tests.api.tc.v2.batch.batch_benchmark import FakeBatchAdapter
+
+
+class UploadAdapter(FakeBatchAdapter):
+    """A fake batch API that returns scripted responses for file uploads.
+
+    Each upload is answered with the next (status code, headers) response, and with a 200
+    response once all responses have been used.
+    """
+
+    def __init__(self):
+        """Initialize instance properties."""
+        super().__init__()
+        self.responses: list[tuple[int, dict]] = []
+        self.uploads: list[tuple[str, bytes]] = []
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        """Record the (streamed) upload body and return the next scripted response."""
+        if not (request.path_url or '').split('?', 1)[0].endswith('/upload'):
+            return super().send(request, **kwargs)
+
+        body = request.body
+        if hasattr(body, 'read'):
+            body = body.read()  # type: ignore
+        elif body is not None and not isinstance(body, bytes | str):
+            body = b''.join(body)  # type: ignore
+        if isinstance(body, str):
+            body = body.encode()
+        with self._lock:
+            self.uploads.append((request.method or '', body or b''))
+            status_code, headers = self.responses.pop(0) if self.responses else (200, {})
+
+        response = self._response(request, {'status': 'Success'}, status_code=status_code)
+        response.headers.update(headers)
+        return response
+
+
+@pytest.fixture
+def batch_api() -> UploadAdapter:
+    """Return a fake batch API with scripted file upload responses."""
+    return UploadAdapter()
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Return the retry delays, recorded instead of sleeping."""
+    delays: list[float] = []
+    monkeypatch.setattr(time, 'sleep', delays.append)
+    return delays
+
+
+def upload(batch: Batch, content) -> dict:
+    """Upload the content of a Document and return the upload status."""
+    (status,) = batch.submit_files({'d-1': {'fileContent': content, 'type': 'Document'}})
+    return status
+
+
+def test_upload_retry_backoff(batch: Batch, batch_api: UploadAdapter, sleeps: list[float]):
+    """Test that uploads are retried with exponential backoff on 429/5xx responses."""
+    batch_api.responses = [(503, {}), (500, {}), (429, {})]
+
+    status = upload(batch, b'file content')
+
+    assert sleeps == [1.0, 2.0, 4.0]
+    assert status == {'attempts': 4, 'status_code': 200, 'uploaded': True, 'xid': 'd-1'}
+    assert [body for _, body in batch_api.uploads] == [b'file content'] * 4
+
+
+def test_upload_retries_exhausted(batch: Batch, batch_api: UploadAdapter, sleeps: list[float]):
+    """Test that the last response is reported once the retries are exhausted."""
+    batch.file_retries = 1
+    batch_api.responses = [(503, {}), (503, {}), (503, {})]
+
+    status = upload(batch, 'file content')
+
+    assert sleeps == [1.0]
+    assert status == {'attempts': 2, 'status_code': 503, 'uploaded': False, 'xid': 'd-1'}
+
+
+def test_upload_retry_after(batch: Batch, batch_api: UploadAdapter, sleeps: list[float]):
+    """Test that the Retry-After header is honored when it exceeds the backoff."""
+    batch_api.responses = [(429, {'Retry-After': '10'}), (503, {'Retry-After': '1'})]
+
+    status = upload(batch, b'file content')
+
+    assert sleeps == [10.0, 2.0]
+    assert status['attempts'] == 3
+
+
+def test_upload_put_on_existing_file(batch: Batch, batch_api: UploadAdapter):
+    """Test that a 401 response switches to PUT without counting as a retry."""
+    batch_api.responses = [(401, {})]
+
+    status = upload(batch, b'file content')
+
+    assert [method for method, _ in batch_api.uploads] == ['POST', 'PUT']
+    assert status == {'attempts': 1, 'status_code': 200, 'uploaded': True, 'xid': 'd-1'}
+
+
+def test_upload_stream_path(
+    batch: Batch, batch_api: UploadAdapter, sleeps: list[float], tmp_path: Path
+):
+    """Test that Path content is streamed from disk and reopened on each retry."""
+    fqfn = tmp_path / 'report.pdf'
+    fqfn.write_bytes(b'%PDF' * 1_000)
+    batch_api.responses = [(503, {})]
+
+    status = upload(batch, fqfn)
+
+    assert sleeps == [1.0]
+    assert status['uploaded'] is True
+    assert [body for _, body in batch_api.uploads] == [b'%PDF' * 1_000] * 2
+
+
+def test_upload_stream_iterable(batch: Batch, batch_api: UploadAdapter, sleeps: list[float]):
+    """Test that iterable content is streamed and not retried."""
+
+    def chunks() -> Iterator[bytes]:
+        """Yield the file content in chunks."""
+        yield from (b'chunk-1', b'chunk-2')
+
+    batch_api.responses = [(503, {})]
+    status = upload(batch, chunks())
+
+    assert not sleeps
+    assert batch_api.uploads == [('POST', b'chunk-1chunk-2')]
+    assert status == {'attempts': 1, 'status_code': 503, 'uploaded': False, 'xid': 'd-1'}
+
+
+def test_close_waits_for_uploads(batch: Batch, batch_api: UploadAdapter):
+    """Test that close waits for the queued uploads to complete."""
+    release = threading.Event()
+
+    def content(xid: str) -> bytes:
+        """Return the file content once released."""
+        release.wait(timeout=5)
+        return f'content {xid}'.encode()
+
+    futures = batch.submit_files_async(
+        {f'd-{i}': {'fileContent': content, 'type': 'Document'} for i in range(3)}
+    )
+    threading.Timer(0.1, release.set).start()
+    batch.close()
+
+    assert all(future.done() for future in futures)
+    assert sorted(body for _, body in batch_api.uploads) == [
+        b'content d-0',
+        b'content d-1',
+        b'content d-2',
+    ]
+
+
+def test_close_after_halt(batch: Batch, batch_api: UploadAdapter):
+    """Test that close skips the queued uploads cancelled when submit_files halts on an error."""
+    batch.file_max_workers = 1
+    batch.file_retries = 0
+    batch.halt_on_file_error = True
+    batch_api.responses = [(500, {})]
+    release = threading.Event()
+
+    def content(xid: str) -> bytes:
+        """Return the file content, the second upload once released."""
+        if xid == 'd-1':
+            release.wait(timeout=5)
+        return f'content {xid}'.encode()
+
+    with pytest.raises(RuntimeError):
+        batch.submit_files(
+            {f'd-{i}': {'fileContent': content, 'type': 'Document'} for i in range(3)}
+        )
+    release.set()
+    batch.close()
+
+    # the failed upload and the upload in progress, the queued upload was cancelled
+    assert sorted(body for _, body in batch_api.uploads) == [b'content d-0', b'content d-1']
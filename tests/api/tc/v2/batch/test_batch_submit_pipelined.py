@@ -0,0 +1,133 @@
+"""Tests for the pipelined batch submit."""
+
+# standard library
+import threading
+
+# third-party
+import pytest
+from requests import PreparedRequest, Response
+
+# first-party
+from tcex.api.tc.v2.batch.batch import Batch
+from tests.api.tc.v2.batch.batch_benchmark import FakeBatchAdapter
+
+
+class FailingStatusAdapter(FakeBatchAdapter):
+    """A fake batch API that fails the status checks of the provided batch ids.
+
+    Args:
+        failed: The batch ids with failing status checks.
+    """
+
+    def __init__(self, failed: set[int]):
+        """Initialize instance properties."""
+        super().__init__(keep_content=True)
+        self.failed = failed
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        """Fail the status check of the failed batch jobs."""
+        path = (request.path_url or '').split('?', 1)[0]
+        if request.method == 'GET' and path.rsplit('/', 1)[-1] in {str(i) for i in self.failed}:
+            return self._response(request, {'message': 'status failed'}, status_code=500)
+        return super().send(request, **kwargs)
+
+
+@pytest.fixture
+def batch_api() -> FakeBatchAdapter:
+    """Return a fake batch API that can fail the status checks of batch jobs."""
+    return FailingStatusAdapter(failed=set())
+
+
+def add_indicators(batch: Batch, count: int = 10, max_chunk: int = 2):
+    """Add indicators to the batch, submitted in chunks of max_chunk indicators."""
+    batch._batch_max_chunk = max_chunk  # pylint: disable=protected-access
+    for i in range(count):
+        batch.add_indicator({'summary': f'10.0.0.{i}', 'type': 'Address', 'xid': f'i-{i}'})
+
+
+def test_pipelined_in_flight_limit(batch: Batch, batch_api: FakeBatchAdapter):
+    """Test that the number of batch jobs polled at the same time is limited."""
+    add_indicators(batch)
+    lock = threading.Lock()
+    window_full = threading.Event()
+    polling = {'active': 0, 'max': 0}
+    submit_poll = batch.submit_poll
+
+    def tracked_poll(batch_id: int, **kwargs) -> dict:
+        """Poll a batch job once the in-flight window has been filled."""
+        with lock:
+            polling['active'] += 1
+            polling['max'] = max(polling['max'], polling['active'])
+            if polling['active'] == 2:
+                window_full.set()
+        window_full.wait(timeout=5)
+        try:
+            return submit_poll(batch_id, **kwargs)
+        finally:
+            with lock:
+                polling['active'] -= 1
+
+    batch.submit_poll = tracked_poll  # type: ignore
+    results = batch.submit_all_pipelined(max_in_flight=2)
+
+    assert polling['max'] == 2
+    assert len(results) == 5
+    assert batch_api.requests['POST /v2/batch/createAndUpload'] == 5
+
+
+def test_pipelined_result_order(batch: Batch):
+    """Test that batch status is returned in submission order when jobs finish out of order."""
+    add_indicators(batch)
+    first_done = threading.Event()
+    later_done = threading.Event()
+    submit_poll = batch.submit_poll
+
+    def out_of_order_poll(batch_id: int, **kwargs) -> dict:
+        """Complete the first batch job after the second one."""
+        if batch_id == 1:
+            later_done.wait(timeout=5)
+        data = submit_poll(batch_id, **kwargs)
+        (first_done if batch_id == 1 else later_done).set()
+        return data
+
+    batch.submit_poll = out_of_order_poll  # type: ignore
+    results = batch.submit_all_pipelined(max_in_flight=3)
+
+    assert first_done.is_set()
+    assert [r['id'] for r in results] == [1, 2, 3, 4, 5]
+
+
+def test_pipelined_halt_on_error(batch: Batch, batch_api: FailingStatusAdapter):
+    """Test that a failed batch job halts the submit and no further chunks are submitted."""
+    add_indicators(batch)
+    batch_api.failed.add(1)
+    batch.halt_on_poll_error = True
+
+    with pytest.raises(RuntimeError):
+        batch.submit_all_pipelined(max_in_flight=2)
+    assert batch_api.requests['POST /v2/batch/createAndUpload'] < 5
+
+
+def test_pipelined_continue_on_error(batch: Batch, batch_api: FailingStatusAdapter):
+    """Test that a failed batch job is reported and the submit continues without halting."""
+    add_indicators(batch)
+    batch_api.failed.add(2)
+
+    results = batch.submit_all_pipelined(max_in_flight=2, halt_on_error=False)
+
+    assert len(results) == 5
+    assert [r.get('id') for r in results] == [1, None, 3, 4, 5]
+
+
+def test_pipelined_delete(batch: Batch, batch_api: FailingStatusAdapter):
+    """Test that a delete batch job submits each chunk with a job and data request."""
+    add_indicators(batch)
+    batch.action = 'Delete'
+
+    results = batch.submit_all_pipelined(max_in_flight=2)
+
+    assert len(results) == 5
+    assert batch_api.requests['POST /v2/batch'] == 5
+    assert batch_api.requests['POST /v2/batch/{id}'] == 5
+    assert 'POST /v2/batch/createAndUpload' not in batch_api.requests
+    assert [len(content['indicator']) for content in batch_api.contents] == [2] * 5
@@ -0,0 +1,142 @@
+"""Tests for resuming an interrupted batch submit from the checkpoint journal."""
+
+# standard library
+from pathlib import Path
+from types import SimpleNamespace
+
+# third-party
+import pytest
+from requests import PreparedRequest, Response
+
+# first-party
+from tcex.api.tc.v2.batch.batch import Batch
+from tests.api.tc.v2.batch.batch_benchmark import FakeBatchAdapter, FakeBatchSession
+
+
+class InterruptAdapter(FakeBatchAdapter):
+    """A fake batch API that fails the selected uploads and status checks.
+
+    Attributes:
+        failed_uploads: The (1-based) createAndUpload requests to fail.
+        failed_status: The batch ids with failing status checks.
+        uploads: The number of createAndUpload requests (including the failed requests).
+    """
+
+    def __init__(self):
+        """Initialize instance properties."""
+        super().__init__(keep_content=True)
+        self.failed_uploads: set[int] = set()
+        self.failed_status: set[int] = set()
+        self.uploads = 0
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        """Fail the selected uploads and status checks."""
+        path = (request.path_url or '').split('?', 1)[0]
+        if path.endswith('/v2/batch/createAndUpload'):
+            self.uploads += 1
+            if self.uploads in self.failed_uploads:
+                return self._response(request, {'message': 'upload failed'}, status_code=500)
+        if request.method == 'GET' and path.rsplit('/', 1)[-1] in {
+            str(i) for i in self.failed_status
+        }:
+            return self._response(request, {'message': 'status failed'}, status_code=500)
+        return super().send(request, **kwargs)
+
+
+@pytest.fixture
+def batch_api() -> InterruptAdapter:
+    """Return a fake batch API that can interrupt the batch submit."""
+    return InterruptAdapter()
+
+
+def run(batch_api: FakeBatchAdapter, tmp_path: Path) -> Batch:
+    """Return a Batch with the checkpoint enabled and the same indicators as each App run."""
+    inputs = SimpleNamespace(model=SimpleNamespace(tc_temp_path=tmp_path))
+    batch = Batch(inputs, FakeBatchSession(batch_api), owner='Test')  # type: ignore
+    batch.poll_first_check = 0
+    batch.halt_on_batch_error = True
+    batch.halt_on_poll_error = True
+    batch._batch_max_chunk = 2  # pylint: disable=protected-access
+    batch.enable_checkpoint('resume')
+    for i in range(6):
+        batch.add_indicator({'summary': f'10.0.0.{i}', 'type': 'Address', 'xid': f'i-{i}'})
+    return batch
+
+
+def submitted(batch_api: FakeBatchAdapter) -> list[str]:
+    """Return the xids of the indicators in each batch job."""
+    return [i['xid'] for content in batch_api.contents for i in content['indicator']]
+
+
+def test_resume_uploaded_chunk(batch_api: InterruptAdapter, tmp_path: Path):
+    """Test that a chunk uploaded before the interrupt is polled, not uploaded again."""
+    batch_api.failed_status.add(2)
+    batch = run(batch_api, tmp_path)
+    with pytest.raises(RuntimeError):
+        batch.submit_all()
+    batch.close()
+    assert [(c['state'], c['batch_id']) for c in batch.checkpoint.pending] == [('uploaded', 2)]
+
+    batch_api.failed_status.clear()
+    batch = run(batch_api, tmp_path)
+    results = batch.submit_all()
+    batch.close()
+
+    assert [r['id'] for r in results] == [2, 3]
+    assert batch_api.uploads == 3
+    assert submitted(batch_api) == [f'i-{i}' for i in range(6)]
+    assert batch.checkpoint.pending == []
+
+
+def test_resume_built_chunk(batch_api: InterruptAdapter, tmp_path: Path):
+    """Test that a chunk built before the interrupt is uploaded from the journaled payload."""
+    batch_api.failed_uploads.add(2)
+    batch = run(batch_api, tmp_path)
+    with pytest.raises(RuntimeError):
+        batch.submit_all()
+    batch.close()
+    assert [c['state'] for c in batch.checkpoint.pending] == ['built']
+
+    batch = run(batch_api, tmp_path)
+    resumed = batch.submit_resume()
+    batch.close()
+
+    assert [r['id'] for r in resumed] == [2]
+    assert batch_api.uploads == 3
+    assert submitted(batch_api) == [f'i-{i}' for i in range(4)]
+
+    # the journal is cleared once nothing is pending
+    assert batch.checkpoint.pending == []
+    assert not batch.checkpoint.journal_fqfn.exists()
+
+
+def test_resume_failed_chunk_not_pending(batch_api: InterruptAdapter, tmp_path: Path):
+    """Test that a chunk that failed to upload without halting is not resumed by later runs."""
+    batch_api.failed_uploads.add(2)
+    for _ in range(2):
+        batch = run(batch_api, tmp_path)
+        batch.halt_on_batch_error = False
+        results = batch.submit_all()
+        batch.close()
+
+        assert len(results) == 3
+        assert batch.checkpoint.pending == []
+        assert not batch.checkpoint.journal_fqfn.exists()
+
+    # the second run submits each chunk once, nothing is resumed from the first run
+    assert batch_api.uploads == 6
+    assert [r.get('id') for r in results] == [3, 4, 5]
+
+
+def test_resume_not_polled_chunk_not_pending(batch_api: InterruptAdapter, tmp_path: Path):
+    """Test that a chunk submitted without polling is not resumed by later runs."""
+    for _ in range(2):
+        batch = run(batch_api, tmp_path)
+        results = batch.submit_all(poll=False)
+        batch.close()
+
+        assert len(results) == 3
+        assert batch.checkpoint.pending == []
+
+    assert batch_api.uploads == 6
+    assert 'GET /v2/batch/{id}' not in batch_api.requests
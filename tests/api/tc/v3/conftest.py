@@ -0,0 +1,27 @@
+"""Fixtures for the v3 tests."""
+
+# standard library
+from collections.abc import Callable
+
+# third-party
+import pytest
+
+# first-party
+from tests.api.tc.v3.fake_session import FakeSession, tag_pages
+
+
+@pytest.fixture
+def fake_session() -> type[FakeSession]:
+    """Return the fake session factory, e.g., fake_session(handler, latency=0.05)."""
+    return FakeSession
+
+
+@pytest.fixture
+def paged_session() -> Callable[..., FakeSession]:
+    """Return a factory of fake sessions serving paged tag results (see tag_pages)."""
+
+    def make(pages: int, page_size: int, fail_page: int = -1) -> FakeSession:
+        """Return a fake session serving paged tag results."""
+        return FakeSession(tag_pages(pages, page_size, fail_page))
+
+    return make
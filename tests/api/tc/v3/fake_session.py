@@ -0,0 +1,103 @@
+"""Fake ThreatConnect API session for the v3 collection tests."""
+
+# standard library
+import json
+import threading
+import time
+from collections.abc import Callable
+from datetime import timedelta
+from typing import Any
+
+# third-party
+from requests import PreparedRequest, Response
+
+# the response of a handler, the body optionally with the status code and headers
+HandlerResult = dict | tuple[dict, int] | tuple[dict, int, dict]
+
+
+class FakeSession:
+    """A session returning the responses of a handler in place of the ThreatConnect API.
+
+    The handler is called with the method, url, and request kwargs (e.g., data and params) of
+    each request, under a lock so it can keep state without synchronization.
+
+    Args:
+        handler: A callable returning the JSON body of the response, optionally with the
+            status code and headers (e.g., (body, 429, {'Retry-After': '1'})).
+        latency: The number of seconds for each request (not counted under the lock).
+    """
+
+    def __init__(self, handler: Callable[..., HandlerResult], latency: float = 0.0):
+        """Initialize instance properties."""
+        self.handler = handler
+        self.latency = latency
+        self.lock = threading.Condition()
+        self.requests: list[tuple[str, str, dict]] = []
+        self.threads: set[str] = set()
+
+    def options(self, url: str, **kwargs) -> Response:
+        """Return the response for an OPTIONS request."""
+        return self.request('OPTIONS', url, **kwargs)
+
+    def request(self, method: str, url: str, **kwargs) -> Response:
+        """Return the response of the handler for the request."""
+        time.sleep(self.latency)
+        with self.lock:
+            self.requests.append((method, url, kwargs))
+            self.threads.add(threading.current_thread().name)
+            result = self.handler(method, url, **kwargs)
+            self.lock.notify_all()
+
+        body, status_code, headers = result, 200, {}
+        if isinstance(result, tuple):
+            body, status_code, *extra = result
+            headers = extra[0] if extra else {}
+
+        response = Response()
+        response._content = json.dumps(body).encode()
+        response.elapsed = timedelta()
+        response.headers['Content-Type'] = 'application/json'
+        response.headers.update(headers)
+        response.request = PreparedRequest()
+        response.request.prepare(method=method, url=f'https://tc.example.com/api{url}')
+        response.status_code = status_code
+        response.url = url
+        return response
+
+    def params(self, name: str) -> list[Any]:
+        """Return the values of a query param (e.g., tql) of the requests that include it."""
+        with self.lock:
+            params = [kwargs.get('params') or {} for _, _, kwargs in self.requests]
+        return [p[name] for p in params if name in p]
+
+    def wait_for(self, predicate: Callable[[str, str, dict], bool], timeout: float) -> bool:
+        """Return True once a request matching the predicate is received, False on timeout."""
+        with self.lock:
+            return self.lock.wait_for(
+                lambda: any(predicate(*request) for request in self.requests), timeout=timeout
+            )
+
+
+def tag_pages(pages: int, page_size: int, fail_page: int = -1) -> Callable[..., HandlerResult]:
+    """Return a handler for paged tag results, linked with a page=<index> next url.
+
+    Args:
+        pages: The number of pages.
+        page_size: The number of results per page.
+        fail_page: A page that returns an error response.
+    """
+
+    def handler(method: str, url: str, **kwargs) -> HandlerResult:  # noqa: ARG001
+        """Return the page for the url."""
+        page = int(url.rsplit('page=', 1)[-1]) if 'page=' in url else 0
+        body: dict = {
+            'data': [
+                {'id': page * page_size + i, 'name': f'tag-{page}-{i}'} for i in range(page_size)
+            ],
+            'status': 'Success',
+        }
+        if page + 1 < pages:
+            body['next'] = f'/v3/tags?page={page + 1}'
+        return body, 500 if page == fail_page else 200
+
+    return handler
@@ -0,0 +1,117 @@
+"""Tests for ObjectCollectionABC bulk create/update."""
+
+# standard library
+import itertools
+import json
+import time
+from collections.abc import Callable
+
+# first-party
+from tcex.api.tc.v3.indicators.indicator import Indicator, Indicators
+from tests.api.tc.v3.fake_session import FakeSession, HandlerResult
+
+
+def create_update(fail_host: str = '', rate_limited: int = 0) -> Callable[..., HandlerResult]:
+    """Return a handler that creates/updates indicators.
+
+    Args:
+        fail_host: A host name that returns an error response.
+        rate_limited: The number of requests rejected by the rate limit (HTTP 429).
+    """
+    ids = itertools.count(1)
+    limited = itertools.count()
+
+    def handler(
+        method: str,
+        url: str,
+        data: str | None = None,
+        **kwargs,  # noqa: ARG001
+    ) -> HandlerResult:
+        """Return the created/updated indicator."""
+        body = json.loads(data or '{}')
+        if next(limited) < rate_limited:
+            return {'message': 'Too many requests', 'status': 'Error'}, 429, {'Retry-After': '0.05'}
+        if body.get('hostName') == fail_host:
+            return {'message': 'Invalid host', 'status': 'Error'}, 400
+
+        id_ = int(url.rsplit('/', 1)[-1]) if method == 'PUT' else next(ids)
+        summary = body.get('hostName')
+        return {'data': {**body, 'id': id_, 'summary': summary}, 'status': 'Success'}
+
+    return handler
+
+
+def make_indicators(session: FakeSession, count: int) -> list[Indicator]:
+    """Return host indicators to create.
+
+    Args:
+        session: The session.
+        count: The number of indicators.
+    """
+    return [
+        Indicator(session=session, host_name=f'host-{i}.example.com', rating=3, type='Host')
+        for i in range(count)
+    ]
+
+
+def test_create_many_concurrent(fake_session: type[FakeSession]):
+    """Test that objects are created concurrently and refreshed from the responses."""
+    session = fake_session(create_update(), latency=0.05)
+    indicators = make_indicators(session, 20)
+
+    start = time.perf_counter()
+    results = Indicators(session=session).create_many(indicators, workers=5)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 20 * 0.05 / 2
+    assert [result.obj for result in results] == indicators
+    assert all(result.success for result in results)
+    assert {indicator.model.id for indicator in indicators} == set(range(1, 21))
+    assert indicators[3].model.summary == 'host-3.example.com'
+
+
+def test_create_many_errors_collected(fake_session: type[FakeSession]):
+    """Test that a failed object is reported without failing the other objects."""
+    session = fake_session(create_update(fail_host='host-2.example.com'))
+    results = Indicators(session=session).create_many(make_indicators(session, 4), workers=2)
+
+    assert [result.success for result in results] == [True, True, False, True]
+    assert isinstance(results[2].error, RuntimeError)
+    assert results[2].attempts == 1
+
+
+def test_create_many_rate_limited(fake_session: type[FakeSession]):
+    """Test that requests rejected by the rate limit are retried after the delay."""
+    session = fake_session(create_update(rate_limited=2))
+    results = Indicators(session=session).create_many(make_indicators(session, 4), workers=2)
+
+    assert all(result.success for result in results)
+    assert sum(result.attempts for result in results) == 6
+
+    # the rate limit is exhausted for the retries
+    session = fake_session(create_update(rate_limited=10))
+    results = Indicators(session=session).create_many(
+        make_indicators(session, 1), workers=1, retries=2
+    )
+    assert results[0].success is False
+    assert results[0].attempts == 3
+
+
+def test_update_many_updated_only(fake_session: type[FakeSession]):
+    """Test that updates only send the updated fields when requested."""
+    session = fake_session(create_update())
+    indicators = [
+        Indicator(session=session, id=i, host_name=f'host-{i}.example.com', rating=3, type='Host')
+        for i in range(1, 4)
+    ]
+    for indicator in indicators:
+        indicator.model.rating = 5
+
+    results = Indicators(session=session).update_many(indicators, updated_only=True)
+    assert all(result.success for result in results)
+    assert sorted(url for _, url, _ in session.requests) == [
+        '/v3/indicators/1',
+        '/v3/indicators/2',
+        '/v3/indicators/3',
+    ]
+    assert all(json.loads(kwargs['data']) == {'rating': 5} for _, _, kwargs in session.requests)
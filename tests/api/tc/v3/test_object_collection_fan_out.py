@@ -0,0 +1,130 @@
+"""Tests for ObjectCollectionABC fan out of nested collections."""
+
+# standard library
+import re
+import time
+from collections.abc import Callable
+
+# first-party
+from tcex.api.tc.v3.indicator_attributes.indicator_attribute import IndicatorAttributes
+from tcex.api.tc.v3.indicators.indicator import Indicator, Indicators
+from tcex.api.tc.v3.tags.tag import Tags
+from tests.api.tc.v3.fake_session import FakeSession, HandlerResult
+
+
+def attributes(indicator_id: int, parent_ids: bool = True) -> list[dict]:
+    """Return the attributes of an indicator.
+
+    Args:
+        indicator_id: The indicator id.
+        parent_ids: If False, the attributes are returned without the indicatorId field.
+    """
+    return [
+        {
+            'id': indicator_id * 10 + i,
+            'type': 'Description',
+            'value': f'{indicator_id}-{i}',
+            **({'indicatorId': indicator_id} if parent_ids else {}),
+        }
+        for i in range(2)
+    ]
+
+
+def nested(parent_ids: bool = True) -> Callable[..., HandlerResult]:
+    """Return a handler returning the tags and attributes of indicators for a TQL query.
+
+    Args:
+        parent_ids: If False, the attributes are returned without the indicatorId field.
+    """
+
+    def handler(
+        method: str,  # noqa: ARG001
+        url: str,
+        params: dict | None = None,
+        **kwargs,  # noqa: ARG001
+    ) -> HandlerResult:
+        """Return the nested objects for the TQL query."""
+        tql = (params or {}).get('tql', '')
+        data = []
+        if match := re.fullmatch(r'indicatorId IN \(([\d,]+)\)', tql):
+            for id_ in match.group(1).split(','):
+                data.extend(attributes(int(id_), parent_ids))
+        elif match := re.fullmatch(r'hasIndicator\(id = (\d+)\)', tql):
+            id_ = int(match.group(1))
+            if url.endswith('/tags'):
+                data = [{'id': id_ * 10 + i, 'name': f'tag-{id_}-{i}'} for i in range(id_ % 3)]
+            elif url.endswith('/indicators'):
+                # the indicator is returned in its own associations
+                data = [{'id': id_, 'summary': f'{id_}.example.com', 'type': 'Host'}]
+            else:
+                data = [{**a, 'indicatorId': None} for a in attributes(id_, parent_ids)]
+        return {'data': data, 'status': 'Success'}
+
+    return handler
+
+
+def make_indicators(session: FakeSession, count: int) -> list[Indicator]:
+    """Return host indicators with ids 1 to count.
+
+    Args:
+        session: The session.
+        count: The number of indicators.
+    """
+    return [
+        Indicator(session=session, id=i, summary=f'{i}.example.com', type='Host')
+        for i in range(1, count + 1)
+    ]
+
+
+def test_fan_out_per_parent_concurrent(fake_session: type[FakeSession]):
+    """Test that the query per parent are sent concurrently and joined to the parents."""
+    session = fake_session(nested(), latency=0.05)
+    indicators = make_indicators(session, 12)
+
+    start = time.perf_counter()
+    results = Tags(session=session).fan_out(indicators, workers=6)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 12 * 0.05 / 2
+    assert len(session.params('tql')) == 12
+    assert [parent for parent, _ in results] == indicators
+    for parent, tags in results:
+        id_ = parent.model.id
+        assert [tag.model.name for tag in tags] == [f'tag-{id_}-{i}' for i in range(id_ % 3)]
+
+
+def test_fan_out_excludes_parent(fake_session: type[FakeSession]):
+    """Test that a parent is not returned as its own association."""
+    session = fake_session(nested())
+    results = Indicators(session=session).fan_out(make_indicators(session, 2))
+    assert all(associated == [] for _, associated in results)
+
+
+def test_fan_out_batched(fake_session: type[FakeSession]):
+    """Test that batched queries are joined to the parents using the parent id."""
+    session = fake_session(nested())
+    indicators = make_indicators(session, 5)
+    results = IndicatorAttributes(session=session).fan_out(
+        indicators, parent_field='indicator_id', batch_size=2
+    )
+
+    assert sorted(session.params('tql')) == [
+        'indicatorId IN (1,2)',
+        'indicatorId IN (3,4)',
+        'indicatorId IN (5)',
+    ]
+    for parent, attributes in results:
+        id_ = parent.model.id
+        assert [attribute.model.value for attribute in attributes] == [f'{id_}-0', f'{id_}-1']
+        assert attributes[0]._parent_data['unique_id'] == parent.model.id  # noqa: SLF001
+
+
+def test_fan_out_batched_fallback(fake_session: type[FakeSession]):
+    """Test that a query per parent is used when the parent id is not returned."""
+    session = fake_session(nested(parent_ids=False))
+    results = IndicatorAttributes(session=session).fan_out(
+        make_indicators(session, 3), parent_field='indicator_id', batch_size=3
+    )
+
+    assert len(session.params('tql')) == 4
+    assert [len(attributes) for _, attributes in results] == [2, 2, 2]
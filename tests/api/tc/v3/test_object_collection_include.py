@@ -0,0 +1,77 @@
+"""Tests for ObjectCollectionABC include (fields expansion)."""
+
+# third-party
+import pytest
+
+# first-party
+from tcex.api.tc.v3.indicators.indicator import Indicators
+from tests.api.tc.v3.fake_session import FakeSession
+
+
+def include(
+    method: str,
+    url: str,
+    params: dict | None = None,
+    **kwargs,  # noqa: ARG001
+) -> dict:
+    """Return the available fields or the indicators, including the nested fields requested."""
+    if method == 'OPTIONS':
+        fields = [{'name': name} for name in ('attributes', 'securityLabels', 'tags')]
+        return {'data': fields, 'status': 'Success'}
+
+    if url != '/v3/indicators':
+        # a sublist query (e.g., /v3/tags?tql=hasIndicator(id = 1))
+        return {'data': [], 'status': 'Success'}
+
+    fields = (params or {}).get('fields', [])
+    data = []
+    for id_ in range(1, 4):
+        indicator = {'id': id_, 'summary': f'{id_}.example.com', 'type': 'Host'}
+        if 'tags' in fields:
+            indicator['tags'] = {'data': [{'id': id_, 'name': f'tag-{id_}'}]}
+        if 'attributes' in fields:
+            indicator['attributes'] = {
+                'data': [{'id': id_, 'type': 'Description', 'value': f'desc-{id_}'}]
+            }
+        data.append(indicator)
+    return {'data': data, 'status': 'Success'}
+
+
+def test_include_hydrates_sublists(fake_session: type[FakeSession]):
+    """Test that the included nested objects are yielded without sublist queries."""
+    session = fake_session(include)
+    indicators = Indicators(session=session)
+    indicators.include = ['attributes', 'tags']
+
+    results = []
+    for indicator in indicators:
+        results.append(
+            (
+                [tag.model.name for tag in indicator.tags],
+                [attribute.model.value for attribute in indicator.attributes],
+            )
+        )
+
+    assert results == [([f'tag-{i}'], [f'desc-{i}']) for i in range(1, 4)]
+    methods = [(method, url) for method, url, _ in session.requests]
+    assert methods == [('OPTIONS', '/v3/indicators/fields'), ('GET', '/v3/indicators')]
+    assert {'attributes', 'tags'} <= set(session.requests[1][2]['params']['fields'])
+
+
+def test_include_not_included_field(fake_session: type[FakeSession]):
+    """Test that a sublist that was not included is still queried per object."""
+    session = fake_session(include)
+    indicators = Indicators(session=session)
+    indicators.include = ['tags']
+
+    indicator = next(iter(indicators))
+    assert list(indicator.security_labels) == []
+    assert session.requests[-1][1] == '/v3/securityLabels'
+
+
+def test_include_invalid_field(fake_session: type[FakeSession]):
+    """Test that an include field that is not available raises a ValueError."""
+    indicators = Indicators(session=fake_session(include))
+    indicators.include = ['tags', 'notAField']
+    with pytest.raises(ValueError, match='notAField'):
+        next(iter(indicators))
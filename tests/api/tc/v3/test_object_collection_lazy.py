@@ -0,0 +1,125 @@
+"""Tests for raw (dict) iteration and lazily validated models."""
+
+# standard library
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+# third-party
+import pytest
+from pydantic import ValidationError
+
+# first-party
+from tcex.api.tc.v3.indicators.indicator import Indicator, Indicators
+from tcex.api.tc.v3.indicators.indicator_model import IndicatorModel
+from tests.api.tc.v3.fake_session import FakeSession, HandlerResult
+
+INDICATOR_DATA = {
+    'confidence': 50,
+    'hostName': 'lazy.example.com',
+    'id': 1,
+    'ownerName': 'Example Org',
+    'rating': 3.0,
+    'summary': 'lazy.example.com',
+    'tags': {'data': [{'name': 'tag-1'}, {'name': 'tag-2'}]},
+    'type': 'Host',
+}
+
+
+def page(results: list[dict]) -> Callable[..., HandlerResult]:
+    """Return a handler returning a single page of indicator results.
+
+    Args:
+        results: The indicator results.
+    """
+    return lambda *args, **kwargs: {'data': results, 'status': 'Success'}  # noqa: ARG005
+
+
+def test_lazy_model_validated_on_access():
+    """Test that a lazy model is validated on first access and matches an eager model."""
+    eager = IndicatorModel(**INDICATOR_DATA)
+    lazy = IndicatorModel(_lazy=True, **INDICATOR_DATA)
+    assert type(lazy).__name__ == 'LazyIndicatorModel'
+    assert isinstance(lazy, IndicatorModel)
+
+    assert lazy.summary == 'lazy.example.com'
+    assert type(lazy) is IndicatorModel
+    assert lazy == eager
+    assert lazy.updated is False
+    assert lazy.tags.data[1].name == 'tag-2'  # type: ignore
+
+
+def test_lazy_model_mutation():
+    """Test that updating a field of a lazy model validates the model first."""
+    lazy = IndicatorModel(_lazy=True, **INDICATOR_DATA)
+    lazy.rating = 5.0
+    assert type(lazy) is IndicatorModel
+    assert lazy.rating == 5.0
+    assert lazy.confidence == 50
+
+    # the update is tracked after the model is validated
+    assert lazy.updated is True
+
+
+def test_collection_as_dicts(fake_session: type[FakeSession]):
+    """Test that as_dicts returns the raw API data."""
+    results = [{**INDICATOR_DATA, 'id': i} for i in range(3)]
+    indicators = Indicators(session=fake_session(page(results)))
+    assert list(indicators.as_dicts()) == results
+
+
+def test_collection_lazy_models(fake_session: type[FakeSession]):
+    """Test that lazy_models returns objects with lazily validated models."""
+    indicators = Indicators(session=fake_session(page([INDICATOR_DATA])))
+    indicators.lazy_models = True
+    indicator = next(iter(indicators))
+    assert isinstance(indicator, Indicator)
+    assert type(indicator._model).__name__ == 'LazyIndicatorModel'  # noqa: SLF001
+    assert indicator.model.summary == 'lazy.example.com'
+    assert type(indicator.model) is IndicatorModel
+
+
+def test_lazy_model_concurrent_access():
+    """Test that concurrent first reads of a lazy model validate it once."""
+    models = [IndicatorModel(_lazy=True, **INDICATOR_DATA) for _ in range(200)]
+    barrier = threading.Barrier(4)
+
+    def read_all() -> list[str | None]:
+        """Read each model once the other threads are ready."""
+        barrier.wait()
+        return [model.summary for model in models]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(read_all) for _ in range(4)]
+        results = [future.result() for future in futures]
+
+    assert results == [['lazy.example.com'] * 200] * 4
+    assert all(type(model) is IndicatorModel and model.updated is False for model in models)
+
+
+def test_lazy_model_validation_error():
+    """Test that a validation error is raised on each access of an invalid lazy model."""
+    lazy = IndicatorModel(_lazy=True, **{**INDICATOR_DATA, 'rating': 'invalid'})
+
+    for _ in range(2):
+        with pytest.raises(ValidationError):
+            _ = lazy.summary
+    assert type(lazy).__name__ == 'LazyIndicatorModel'
+
+
+def test_lazy_model_setter():
+    """Test that the lazy model of an object (as created by a collection) can be replaced."""
+    indicator = Indicator(_lazy=True, **INDICATOR_DATA)
+    indicator.model = IndicatorModel(id=2)
+    assert type(indicator.model) is IndicatorModel
+    assert indicator.model.id == 2
+
+    # a dict is validated into the model class, not a lazy model
+    indicator = Indicator(_lazy=True, **INDICATOR_DATA)
+    indicator.model = {**INDICATOR_DATA, 'id': 3}
+    assert type(indicator.model) is IndicatorModel
+    assert indicator.model.id == 3
+
+    indicator = Indicator(_lazy=True, **INDICATOR_DATA)
+    with pytest.raises(ValidationError):
+        indicator.model = {**INDICATOR_DATA, 'rating': 'invalid'}
@@ -0,0 +1,56 @@
+"""Tests for ObjectCollectionABC response logging."""
+
+# standard library
+import logging
+from datetime import timedelta
+
+# third-party
+import pytest
+from requests import PreparedRequest, Response
+
+# first-party
+from tcex.api.tc.v3.tags.tag import Tags
+
+
+def make_response(content: bytes) -> Response:
+    """Return a response with the provided content.
+
+    Args:
+        content: The response body.
+    """
+    response = Response()
+    response._content = content
+    response.elapsed = timedelta()
+    response.encoding = 'utf-8'
+    response.request = PreparedRequest()
+    response.request.prepare(method='GET', url='https://tc.example.com/api/v3/tags')
+    response.status_code = 200
+    return response
+
+
+def test_log_response_truncated(caplog: pytest.LogCaptureFixture):
+    """Test that a large body is truncated before it is decoded."""
+    tags = Tags(session=None)
+    # multibyte characters are split at the segment boundaries
+    content = ('é' * 5_000_000).encode()
+
+    with caplog.at_level(logging.INFO, logger='tcex'):
+        tags.log_response(make_response(content))
+
+    message = caplog.records[-1].getMessage()
+    assert '... [truncated] ...' in message
+    assert len(message) < 1_000
+
+
+def test_log_response_disabled(caplog: pytest.LogCaptureFixture):
+    """Test that responses are not logged when disabled or below the log level."""
+    tags = Tags(session=None)
+    tags.log_responses = False
+    with caplog.at_level(logging.INFO, logger='tcex'):
+        tags.log_response(make_response(b'{"data": []}'))
+    assert not caplog.records
+
+    tags.log_responses = True
+    with caplog.at_level(logging.WARNING, logger='tcex'):
+        tags.log_response(make_response(b'{"data": []}'))
+    assert not caplog.records
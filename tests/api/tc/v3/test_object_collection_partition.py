@@ -0,0 +1,142 @@
+"""Tests for ObjectCollectionABC partitioned iteration."""
+
+# standard library
+import itertools
+import re
+import time
+from collections.abc import Callable
+
+# third-party
+import pytest
+
+# first-party
+from tcex.api.tc.v3.tags.tag import Tags
+from tests.api.tc.v3.fake_session import FakeSession, HandlerResult
+
+
+def tag_ranges(ids: list[int], fail: int | None = None) -> Callable[..., HandlerResult]:
+    """Return a handler serving tags that supports id range TQL, sorting, count, and paging.
+
+    Args:
+        ids: The ids of the tags.
+        fail: Return an error response for requests with this low id bound.
+    """
+    ids = sorted(ids)
+    cursors: dict[str, tuple[list[int], int, int]] = {}
+    tokens = itertools.count()
+
+    def select(params: dict) -> list[int]:
+        """Return the ids matching the tql and sorting params."""
+        selected = ids
+        for operator, value in re.findall(r'id (>=|<) (\d+)', params.get('tql') or ''):
+            selected = [
+                i for i in selected if (i >= int(value) if operator == '>=' else i < int(value))
+            ]
+        if params.get('sorting') == 'id DESC':
+            selected = selected[::-1]
+        return selected
+
+    def handler(
+        method: str,  # noqa: ARG001
+        url: str,
+        params: dict | None = None,
+        **kwargs,  # noqa: ARG001
+    ) -> HandlerResult:
+        """Return the results for the request."""
+        status_code = 200
+        if url.startswith('/v3/tags/next/'):
+            selected, start, limit = cursors.pop(url)
+        else:
+            params = params or {}
+            selected, start, limit = select(params), 0, int(params.get('resultLimit', 100))
+            if fail is not None and f'id >= {fail} ' in params.get('tql', ''):
+                status_code = 500
+
+        body: dict = {
+            'data': [{'id': i, 'name': f'tag-{i}'} for i in selected[start : start + limit]],
+            'status': 'Success',
+        }
+        if params and params.get('count'):
+            body['count'] = len(selected)
+        elif start + limit < len(selected):
+            next_url = f'/v3/tags/next/{next(tokens)}'
+            cursors[next_url] = (selected, start + limit, limit)
+            body['next'] = next_url
+        return body, status_code
+
+    return handler
+
+
+def make_tags(session: FakeSession, workers: int, ordered: bool = False) -> Tags:
+    """Return a tags collection configured for partitioned iteration.
+
+    Args:
+        session: The session.
+        workers: The number of partition workers.
+        ordered: If True, return the results in id order.
+
+    Returns:
+        The tags collection.
+    """
+    tags = Tags(session=session, params={'result_limit': 10})
+    tags.partition_workers = workers
+    tags.partition_ordered = ordered
+    return tags
+
+
+def test_partitions_disjoint_and_complete(fake_session: type[FakeSession]):
+    """Test that the partitions return every result exactly once."""
+    ids = [i * 7 for i in range(500)] + list(range(10_000, 10_050))
+    session = fake_session(tag_ranges(ids))
+    results = [tag.model.id for tag in make_tags(session, workers=4)]
+    assert sorted(results) == sorted(ids)
+    assert len(results) == len(set(results))
+
+    # 4 workers x 4 partitions (count and min/max id requests have no id range)
+    assert sum(1 for tql in session.params('tql') if tql.startswith('id >= ')) == 16
+
+
+def test_partitions_ordered(fake_session: type[FakeSession]):
+    """Test that ordered partitioned iteration returns the results in id order."""
+    ids = list(range(1, 400, 3))
+    tags = make_tags(fake_session(tag_ranges(ids)), workers=3, ordered=True)
+    results = [tag.model.id for tag in tags]
+    assert results == ids
+
+
+def test_partitions_base_tql(fake_session: type[FakeSession]):
+    """Test that the partition id ranges are combined with the collection TQL."""
+    session = fake_session(tag_ranges(list(range(200))))
+    tags = make_tags(session, workers=2)
+    tags.tql.set_raw_tql('name like "tag%"')
+    assert len(list(tags)) == 200
+    partition_tql = [tql for tql in session.params('tql') if 'id >= ' in tql]
+    assert partition_tql
+    assert all(tql.startswith('(name like "tag%") and id >= ') for tql in partition_tql)
+
+
+def test_partitions_small_result_sequential(fake_session: type[FakeSession]):
+    """Test that a query with a single page of results is not partitioned."""
+    session = fake_session(tag_ranges(list(range(5))))
+    assert [tag.model.id for tag in make_tags(session, workers=4)] == list(range(5))
+    assert not any(tql.startswith('id >= ') for tql in session.params('tql'))
+
+
+def test_partitions_concurrent(fake_session: type[FakeSession]):
+    """Test that the partitions are fetched concurrently."""
+    durations = {}
+    for workers in (1, 4):
+        tags = make_tags(fake_session(tag_ranges(list(range(160))), latency=0.02), workers)
+        start = time.perf_counter()
+        assert len(list(tags)) == 160
+        durations[workers] = time.perf_counter() - start
+
+    # 16 sequential pages vs 4 workers (plus the count requests)
+    assert durations[4] < durations[1] * 0.6
+
+
+def test_partitions_error_raised_in_consumer(fake_session: type[FakeSession]):
+    """Test that an error fetching a partition is raised to the consumer."""
+    tags = make_tags(fake_session(tag_ranges(list(range(200)), fail=0)), workers=2)
+    with pytest.raises(RuntimeError):
+        list(tags)
@@ -0,0 +1,87 @@
+"""Tests for ObjectCollectionABC page prefetch."""
+
+# standard library
+import time
+from collections.abc import Callable
+
+# third-party
+import pytest
+
+# first-party
+from tcex.api.tc.v3.tags.tag import Tags
+from tests.api.tc.v3.fake_session import FakeSession
+
+SessionFactory = Callable[..., FakeSession]
+
+
+def consume(tags: Tags) -> list[int]:
+    """Return the ids of all tags.
+
+    Args:
+        tags: The tags collection.
+
+    Returns:
+        The ids of the tags in iteration order.
+    """
+    return [tag.model.id for tag in tags]
+
+
+def requested(session: FakeSession) -> list[int]:
+    """Return the requested pages in request order."""
+    return [
+        int(url.rsplit('page=', 1)[-1]) if 'page=' in url else 0 for _, url, _ in session.requests
+    ]
+
+
+def test_prefetch_same_results(paged_session: SessionFactory):
+    """Test that prefetch returns the same results in the same order."""
+    expected = consume(Tags(session=paged_session(pages=5, page_size=10)))
+
+    session = paged_session(pages=5, page_size=10)
+    tags = Tags(session=session)
+    tags.prefetch = 2
+    assert consume(tags) == expected == list(range(50))
+    assert requested(session) == [0, 1, 2, 3, 4]
+    assert session.threads == {'collection-prefetch'}
+
+
+def test_prefetch_overlaps_latency(paged_session: SessionFactory):
+    """Test that the next page is fetched while the current page is consumed."""
+    overlapped = {}
+    for prefetch, timeout in ((0, 0.2), (1, 5.0)):
+        session = paged_session(pages=4, page_size=10)
+        tags = Tags(session=session)
+        tags.prefetch = prefetch
+        for tag in tags:
+            if tag.model.id == 0:
+                # the first page is being consumed, wait for the request of the next page
+                overlapped[prefetch] = session.wait_for(
+                    lambda _method, url, _kwargs: url.endswith('page=1'), timeout=timeout
+                )
+                pages = requested(session)
+        assert requested(session) == [0, 1, 2, 3]
+
+        # the prefetch is bounded (one queued page and one page being put on the queue)
+        assert pages[:2] == ([0, 1] if prefetch else [0])
+        assert 3 not in pages
+
+    assert overlapped == {0: False, 1: True}
+
+
+def test_prefetch_error_raised_in_consumer(paged_session: SessionFactory):
+    """Test that an error fetching a page is raised to the consumer."""
+    tags = Tags(session=paged_session(pages=5, page_size=10, fail_page=2))
+    tags.prefetch = 1
+    with pytest.raises(RuntimeError):
+        consume(tags)
+
+
+def test_prefetch_stops_on_break(paged_session: SessionFactory):
+    """Test that the background fetch stops when the consumer stops iterating."""
+    session = paged_session(pages=100, page_size=10)
+    tags = Tags(session=session)
+    tags.prefetch = 1
+    for tag in tags:  # noqa: B007
+        break
+    time.sleep(0.3)
+    assert len(session.requests) <= 3
@@ -0,0 +1,66 @@
+"""Tests for the v3 response JSON cache and decoder hook."""
+
+# standard library
+import json
+from collections.abc import Callable
+
+# third-party
+import pytest
+from requests import Response
+
+# first-party
+from tcex.api.tc.v3.response_json import response_json, set_json_loads
+from tcex.api.tc.v3.tags.tag import Tags
+from tests.api.tc.v3.fake_session import FakeSession
+
+
+class CountingLoads:
+    """A JSON decoder that counts the decoded response bodies."""
+
+    def __init__(self):
+        """Initialize instance properties."""
+        self.calls = 0
+
+    def __call__(self, content: bytes | str):
+        """Decode the content."""
+        self.calls += 1
+        return json.loads(content)
+
+
+@pytest.fixture
+def loads():
+    """Return a counting decoder, restoring the default decoder after the test."""
+    loads_ = CountingLoads()
+    set_json_loads(loads_)
+    yield loads_
+    set_json_loads()
+
+
+def test_response_decoded_once(loads: CountingLoads):
+    """Test that the response body is decoded once and cached on the response."""
+    response = Response()
+    response._content = b'{"data": [1, 2], "status": "Success"}'
+    response.status_code = 200
+    assert response_json(response) == {'data': [1, 2], 'status': 'Success'}
+    assert response_json(response) is response_json(response)
+    assert Tags.success(response) is True
+    assert loads.calls == 1
+
+
+def test_collection_pages_decoded_once(
+    loads: CountingLoads, paged_session: Callable[..., FakeSession]
+):
+    """Test that each page of a collection is decoded once (success check and pagination)."""
+    session = paged_session(pages=3, page_size=5)
+    assert sum(1 for _ in Tags(session=session)) == 15
+    assert len(session.requests) == loads.calls == 3
+
+
+def test_response_invalid_json():
+    """Test that an invalid response body raises a ValueError with the default decoder."""
+    response = Response()
+    response._content = b'<html>'
+    response.status_code = 200
+    with pytest.raises(ValueError):  # noqa: PT011
+        response_json(response)
+    assert Tags.success(response) is False
@@ -0,0 +1,32 @@
+"""Tests for the V3ModelABC gen_body plan."""
+
+# first-party
+from tcex.api.tc.v3.indicators.indicator_model import IndicatorModel
+from tcex.api.tc.v3.tags.tag_model import TagModel
+
+
+def test_body_plan_cached():
+    """Test that the body plan is computed once per model class and combination."""
+    plan = IndicatorModel._body_plan('PUT', None, False)  # noqa: SLF001
+    assert IndicatorModel._body_plan('PUT', None, False) is plan  # noqa: SLF001
+    assert IndicatorModel._body_plan('POST', None, False) is not plan  # noqa: SLF001
+    assert TagModel._body_plan('PUT', None, False) is not plan  # noqa: SLF001
+
+    assert plan['host_name'].title == 'hostName'
+    assert plan['host_name'].summary_field is True
+    assert plan['tags'].nested_model is True
+
+
+def test_body_plan_rules():
+    """Test the field inclusion rules applied with the body plan."""
+    data = {'confidence': 0, 'hostName': 'plan.example.com', 'rating': 3.0, 'type': 'Host'}
+
+    # summary fields are only included when the indicator has no id
+    body = IndicatorModel(**data).gen_body('POST')
+    assert body == data
+    body = IndicatorModel(id=1, **data).gen_body('PUT')
+    assert body == {'confidence': 0, 'rating': 3.0, 'type': 'Host'}
+
+    # nested objects in delete mode only include the id/name fields
+    body = TagModel(id=1, name='tag-1', description='tag').gen_body('PUT', 'delete', nested=True)
+    assert body == {'id': 1, 'name': 'tag-1'}
@@ -0,0 +1,68 @@
+"""Tests for V3ModelABC change tracking."""
+
+# first-party
+from tcex.api.tc.v3.indicators.indicator_model import IndicatorModel
+from tcex.api.tc.v3.tags.tag_model import TagModel
+
+INDICATOR_DATA = {
+    'confidence': 50,
+    'hostName': 'updated.example.com',
+    'id': 1,
+    'ownerName': 'Example Org',
+    'rating': 3.0,
+    'summary': 'updated.example.com',
+    'tags': {'data': [{'name': 'tag-1'}, {'name': 'tag-2'}]},
+    'type': 'Host',
+}
+
+
+def test_model_not_updated():
+    """Test that a model is not updated after initialization."""
+    model = IndicatorModel(**INDICATOR_DATA)
+    assert model.updated is False
+
+
+def test_model_updated_field():
+    """Test that assigning a field marks the model as updated."""
+    model = IndicatorModel(**INDICATOR_DATA)
+    model.rating = 4.0
+    assert model.updated is True
+
+
+def test_model_updated_nested():
+    """Test that nested model and list changes mark the model as updated."""
+    model = IndicatorModel(**INDICATOR_DATA)
+    model.tags.data[0].name = 'tag-renamed'  # type: ignore
+    assert model.updated is True
+
+    model = IndicatorModel(**INDICATOR_DATA)
+    model.tags.data.append(TagModel(name='tag-3'))  # type: ignore
+    assert model.updated is True
+
+
+def test_gen_body_updated_only():
+    """Test that only the updated fields are included in a PUT body when requested."""
+    model = IndicatorModel(**INDICATOR_DATA)
+    model.rating = 4.0
+    model.tags.data.append(TagModel(name='tag-3'))  # type: ignore
+
+    body = model.gen_body(method='PUT', updated_only=True)
+    assert body.keys() == {'rating', 'tags'}
+    assert body['rating'] == 4.0
+
+    # the full body is generated by default
+    full_body = model.gen_body(method='PUT')
+    assert {'confidence', 'rating', 'tags'} <= full_body.keys()
+
+
+def test_model_updated_replaced_items():
+    """Test that replacing list items (without changing the count) marks the model as updated."""
+    model = IndicatorModel(**INDICATOR_DATA)
+    model.tags.data[0] = TagModel(name='tag-replaced')  # type: ignore
+    assert model.updated is True
+    assert model.gen_body(method='PUT', updated_only=True).keys() == {'tags'}
+
+    model = IndicatorModel(**INDICATOR_DATA)
+    model.tags.data = [TagModel(name='tag-3'), TagModel(name='tag-4')]  # type: ignore
+    assert model.updated is True
+    assert model.gen_body(method='PUT', updated_only=True).keys() == {'tags'}
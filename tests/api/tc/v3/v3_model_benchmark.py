@@ -0,0 +1,108 @@
+"""Microbenchmark of V3 model construction and change detection.
+
+Usage:
+    python -m tests.api.tc.v3.v3_model_benchmark --count 2000
+
+The report contains the time per operation (in microseconds) for IndicatorModel, GroupModel,
+and CaseModel: construction from API data, the updated check, and the POST/PUT body generation.
+"""
+
+# standard library
+import argparse
+import json
+import time
+from collections.abc import Callable
+
+# first-party
+from tcex.api.tc.v3.cases.case_model import CaseModel
+from tcex.api.tc.v3.groups.group_model import GroupModel
+from tcex.api.tc.v3.indicators.indicator_model import IndicatorModel
+from tcex.api.tc.v3.v3_model_abc import V3ModelABC
+
+# API response data used to construct each model
+MODEL_DATA: dict[type[V3ModelABC], dict] = {
+    CaseModel: {
+        'attributes': {'data': [{'id': 1, 'type': 'Description', 'value': 'case description'}]},
+        'caseOccurrenceTime': '2022-01-01T00:00:00Z',
+        'dateAdded': '2022-01-01T00:00:00Z',
+        'description': 'benchmark case',
+        'id': 1,
+        'name': 'benchmark case',
+        'ownerName': 'Example Org',
+        'severity': 'Low',
+        'status': 'Open',
+        'tags': {'data': [{'name': 'tag-1'}, {'name': 'tag-2'}]},
+    },
+    GroupModel: {
+        'attributes': {'data': [{'id': 1, 'type': 'Description', 'value': 'group description'}]},
+        'dateAdded': '2022-01-01T00:00:00Z',
+        'id': 1,
+        'lastModified': '2022-01-01T00:00:00Z',
+        'name': 'benchmark adversary',
+        'ownerName': 'Example Org',
+        'tags': {'data': [{'name': 'tag-1'}, {'name': 'tag-2'}]},
+        'type': 'Adversary',
+        'webLink': 'https://app.example.com/auth/adversary/adversary.xhtml?adversary=1',
+    },
+    IndicatorModel: {
+        'active': True,
+        'attributes': {'data': [{'id': 1, 'type': 'Description', 'value': 'host description'}]},
+        'confidence': 50,
+        'dateAdded': '2022-01-01T00:00:00Z',
+        'hostName': 'benchmark.example.com',
+        'id': 1,
+        'lastModified': '2022-01-01T00:00:00Z',
+        'ownerName': 'Example Org',
+        'privateFlag': False,
+        'rating': 3.0,
+        'summary': 'benchmark.example.com',
+        'tags': {'data': [{'name': 'tag-1'}, {'name': 'tag-2'}]},
+        'type': 'Host',
+    },
+}
+
+
+def time_per_op(func: Callable[[], object], count: int) -> float:
+    """Return the time per call in microseconds (best of 3 runs).
+
+    Args:
+        func: The function to time.
+        count: The number of calls per run.
+    """
+    best = float('inf')
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(count):
+            func()
+        best = min(best, time.perf_counter() - start)
+    return round(best / count * 1_000_000, 1)
+
+
+def run(count: int = 1_000) -> dict[str, dict[str, float]]:
+    """Return the time per operation in microseconds for each model.
+
+    Args:
+        count: The number of operations per run.
+    """
+    report = {}
+    for model_class, data in MODEL_DATA.items():
+        model = model_class(**data)
+        report[model_class.__name__] = {
+            'construct': time_per_op(lambda m=model_class, d=data: m(**d), count),
+            'gen_body_post': time_per_op(lambda m=model: m.gen_body('POST'), count),
+            'gen_body_put': time_per_op(lambda m=model: m.gen_body('PUT'), count),
+            'updated': time_per_op(lambda m=model: m.updated, count),
+        }
+    return report
+
+
+def main():
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n', 1)[0])
+    parser.add_argument('--count', default=1_000, type=int)
+    args = parser.parse_args()
+    print(json.dumps(run(args.count), indent=2))  # noqa: T201
+
+
+if __name__ == '__main__':
+    main()